@@ -0,0 +1,290 @@
+import asyncio
+import json
+import time
+
+import aiohttp
+import pandas as pd
+
+try:
+    from .endpoints import API_BASE
+    from .fastjson import loads
+    from .metrics import ClientMetrics, endpoint_for_url
+    from .ratelimit import HostRateLimiter
+    from .threesixfivescores import ThreeSixFiveScores
+except ImportError:
+    from endpoints import API_BASE
+    from fastjson import loads
+    from metrics import ClientMetrics, endpoint_for_url
+    from ratelimit import HostRateLimiter
+    from threesixfivescores import ThreeSixFiveScores
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncThreeSixFiveScores:
+    """
+    asyncio version of ThreeSixFiveScores for large crawls. Every request shares one
+    aiohttp connection pool, one concurrency cap and the per-host rate limiter, so
+    thousands of games are fetched from a single thread.
+
+    Usage:
+        async with AsyncThreeSixFiveScores(concurrency=50) as client:
+            games = await client.get_match_data_many(game_ids)
+
+    Args:
+        concurrency: Max requests in flight at once (also the connection pool size).
+        rate_limit: Max requests per second per host (None disables limiting).
+        burst: Requests allowed back-to-back before callers start waiting.
+        rate_limiter: HostRateLimiter shared with other clients (sync or async).
+        timeout: Total timeout per request, in seconds.
+        max_retries: Retries on 429/5xx and connection errors.
+        backoff_factor: Base of the exponential backoff between retries.
+        api_base: Send requests to this base URL instead of https://webws.365scores.com.
+        metrics: ClientMetrics to record into; a new one by default.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 32,
+        rate_limit: float = 3.0,
+        burst: int = 5,
+        rate_limiter: HostRateLimiter = None,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        api_base: str = None,
+        metrics: ClientMetrics = None
+    ):
+        self.rate_limiter = rate_limiter or HostRateLimiter(rate=rate_limit, burst=burst)
+        # URL builders and parsers are shared with the blocking client, built without a session or transport.
+        self._parser = ThreeSixFiveScores.offline()
+        self.headers = self._parser.headers
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.api_base = api_base.rstrip('/') if api_base else None
+        self.metrics = metrics or ClientMetrics()
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _get_json(self, url: str, params: dict = None) -> dict:
+        """
+        GET `url` and decode JSON, retrying 429/5xx with exponential backoff.
+        Raises aiohttp.ClientError, asyncio.TimeoutError or json.JSONDecodeError.
+        """
+        session = await self._ensure_session()
+        if self.api_base and url.startswith(API_BASE):
+            url = self.api_base + url[len(API_BASE):]
+        if params:
+            params = {k: str(v) for k, v in params.items()}
+        endpoint = endpoint_for_url(url)
+        retries = throttles = nbytes = 0
+        success = False
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                for attempt in range(self.max_retries + 1):
+                    retries = attempt
+                    wait = self.rate_limiter.reserve(url)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    try:
+                        async with session.get(url, params=params) as response:
+                            if response.status in (429, 503):
+                                throttles += 1
+                            if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                                continue
+                            response.raise_for_status()
+                            body = await response.read()
+                            nbytes = len(body)
+                            data = loads(body)
+                            success = True
+                            return data
+                    except aiohttp.ClientResponseError:
+                        raise
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        if attempt >= self.max_retries:
+                            raise
+                        await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+            finally:
+                self.metrics.observe(
+                    endpoint, time.perf_counter() - started, nbytes=nbytes,
+                    retries=retries, throttles=throttles, error=not success
+                )
+
+    async def _fetch_match_data(self, game_id, competition_id=None, matchup_id=None):
+        api_url = self._parser._match_data_url(game_id, competition_id=competition_id, matchup_id=matchup_id)
+        try:
+            return await self._get_json(api_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError):
+            return {}
+
+    ##############################
+    # Same surface as ThreeSixFiveScores
+    ##############################
+
+    async def get_match_data(self, match_url):
+        matchup_id, game_id = self._parser.get_ids(match_url)
+        if not game_id:
+            return {}
+        data = await self._fetch_match_data(game_id, matchup_id=matchup_id)
+        return data.get('game', {}) if 'game' in data else {}
+
+    async def get_match_data_by_id(self, game_id, competition_id="any id"):
+        return await self._fetch_match_data(game_id, competition_id=competition_id)
+
+    async def get_match_general_stats_by_id(self, game_id, competition_id=None):
+        url = self._parser._stats_url(game_id, competition_id)
+        try:
+            response_data = await self._get_json(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError):
+            return pd.DataFrame()
+        return self._parser._build_general_stats_dataframe(response_data)
+
+    async def get_match_shotmap(self, match_url):
+        match_data = await self.get_match_data(match_url)
+        return self._parser._match_shotmap_from_data(match_data, match_url)
+
+    async def get_shotmap_enriched(self, game_id, competition_id="552"):
+        match_data = await self.get_match_data_by_id(game_id, competition_id)
+        return self._parser._shotmap_enriched_from_data(match_data)
+
+    async def get_competition_results(
+        self,
+        competition_id: int,
+        after_game: int = None,
+        direction: int = 1,
+        page_size: int = 20,
+        status_filter: str = None
+    ) -> dict:
+        params = self._parser._competition_results_params(competition_id, after_game, direction, page_size)
+        try:
+            data = await self._get_json('https://webws.365scores.com/web/games/results/', params=params)
+            result = self._parser._parse_competition_results_page(data, status_filter)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            print(f"خطأ أثناء جلب صفحة نتائج المسابقة: {e}")
+            return {
+                'games': pd.DataFrame(),
+                'paging': {
+                    'next_token': None,
+                    'prev_token': None,
+                    'total_games': 0
+                }
+            }
+        return result
+
+    async def iter_competition_games(
+        self,
+        competition_id: int = None,
+        initial_url: str = None,
+        page_size: int = 50,
+        max_pages: int = 1000,
+        max_games: int = None,
+        as_dataframe: bool = True
+    ):
+        """
+        Async version of ThreeSixFiveScores.iter_competition_games. The next page is always
+        requested before the current one is handed to the consumer.
+
+        Usage:
+            async for page_df in client.iter_competition_games(552):
+                ...
+        """
+        current_full_url = self._parser._competition_results_url(competition_id, initial_url)
+        processed_game_ids = set()
+        seen_full_urls = set()
+        page_count = 0
+        pending_page = None
+
+        def _fetch(full_url):
+            api_path, params = self._parser._split_results_url(full_url, page_size)
+            return asyncio.ensure_future(self._get_json(f'https://webws.365scores.com/web/{api_path}', params=params))
+
+        try:
+            while current_full_url and page_count < max_pages:
+                if current_full_url in seen_full_urls:
+                    break
+                seen_full_urls.add(current_full_url)
+                page_count += 1
+                try:
+                    data = await (pending_page or _fetch(current_full_url))
+                except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+                    print(f"خطأ أثناء جلب البيانات من الرابط: {e}")
+                    break
+                pending_page = None
+                if 'games' not in data or not data['games']:
+                    break
+                next_page_relative_path = data.get('paging', {}).get('nextPage')
+                next_full_url = f"https://webws.365scores.com{next_page_relative_path}" if next_page_relative_path else None
+                if next_full_url and next_full_url not in seen_full_urls and page_count < max_pages:
+                    pending_page = _fetch(next_full_url)
+
+                new_games = [g for g in data['games'] if g.get('id') not in processed_game_ids]
+                processed_game_ids.update(g.get('id') for g in new_games)
+                if new_games:
+                    yield self._parser._process_game_records(new_games) if as_dataframe else new_games
+                if max_games and len(processed_game_ids) >= max_games:
+                    break
+                current_full_url = next_full_url
+        finally:
+            if pending_page is not None:
+                pending_page.cancel()
+
+    ##############################
+    # Bulk methods
+    ##############################
+
+    async def get_match_data_many(self, game_ids, competition_id=None) -> dict:
+        """
+        Fetches many /web/game/ payloads concurrently under the shared concurrency cap.
+
+        Returns:
+            dict mapping game_id -> raw payload ({} for games that failed).
+        """
+        game_ids = list(dict.fromkeys(game_ids))
+        results = await asyncio.gather(
+            *(self._fetch_match_data(game_id, competition_id=competition_id) for game_id in game_ids)
+        )
+        return dict(zip(game_ids, results))
+
+    async def get_stats_many(self, game_ids, competition_id=None) -> pd.DataFrame:
+        """
+        Fetches /web/game/stats/ for many games concurrently.
+
+        Returns:
+            One DataFrame of every game's stats with a 'game_id' column, or an empty DataFrame.
+        """
+        game_ids = list(dict.fromkeys(game_ids))
+        frames = await asyncio.gather(
+            *(self.get_match_general_stats_by_id(game_id, competition_id) for game_id in game_ids)
+        )
+        frames = [df.assign(game_id=game_id) for game_id, df in zip(game_ids, frames) if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,431 @@
+"""
+Offline benchmarks, run against a local standin_server.StandInServer.
+
+    python -m LanusStats.benchmarks competition-results --games 2000 --latency 0.02 --out bench_results/
+    python -m LanusStats.benchmarks shotmap --shots 30 1000 100000
+
+Every benchmark writes one JSON file so runs can be compared over time.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+try:
+    from . import fastjson
+    from .endpoints import recording_path
+    from .standin_server import StandInServer
+    from .threesixfivescores import ThreeSixFiveScores
+except ImportError:
+    import fastjson
+    from endpoints import recording_path
+    from standin_server import StandInServer
+    from threesixfivescores import ThreeSixFiveScores
+
+
+def synthetic_results_recordings(directory: str, competition_id: int = 552, n_games: int = 2000, seed: int = 0) -> set:
+    """Writes a fake /web/games/results/ recording with `n_games` games and returns their ids."""
+    rng = random.Random(seed)
+    statuses = ['FT'] * 8 + ['AET', 'Pen', 'NS', 'Postp']
+    start = time.mktime((2015, 8, 1, 18, 0, 0, 0, 0, 0))
+    games = []
+    for i in range(n_games):
+        game_id = 4000000 + i
+        status = rng.choice(statuses)
+        finished = status in ('FT', 'AET', 'Pen')
+        games.append({
+            'id': game_id,
+            'sportId': 1,
+            'competitionId': competition_id,
+            'seasonNum': 1 + i // 380,
+            'roundName': f'Round {1 + (i % 380) // 10}',
+            'statusGroup': 4 if finished else 2,
+            'shortStatusText': status,
+            'startTime': time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(start + i * 86400 / 3)),
+            'homeCompetitor': {'id': rng.randint(1, 20), 'name': f'Team {rng.randint(1, 20)}', 'score': rng.randint(0, 4) if finished else -1},
+            'awayCompetitor': {'id': rng.randint(21, 40), 'name': f'Team {rng.randint(21, 40)}', 'score': rng.randint(0, 4) if finished else -1},
+        })
+    path = recording_path(directory, 'games/results', {'competitions': competition_id})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'games': games}, f)
+    return {g['id'] for g in games}
+
+
+def _game_ids(result) -> set:
+    df = result['games'] if isinstance(result, dict) else result
+    if df is None or df.empty:
+        return set()
+    column = 'game_id' if 'game_id' in df.columns else 'id'
+    return set(int(x) for x in df[column].dropna())
+
+
+def _competition_results_methods(client, competition_id, page_size, workers):
+    """(name, callable) pairs; each callable pulls the whole competition with one of the public methods."""
+
+    def cursor_loop():
+        frames = []
+        token = None
+        seen = set()
+        while True:
+            page = client.get_competition_results(competition_id, after_game=token, page_size=page_size)
+            frames.append(page['games'])
+            token = page['paging']['next_token']
+            if not token or token in seen:
+                break
+            seen.add(token)
+        return {'games': pd.concat(frames, ignore_index=True)}
+
+    initial_url = (
+        f"https://webws.365scores.com/web/games/results/?appTypeId=5&langId=1&timezoneName=Asia/Hebron"
+        f"&userCountryId=115&competitions={competition_id}&games={page_size}"
+    )
+    methods = [
+        ('get_competition_results', None, cursor_loop),
+        ('get_full_competition_results', None,
+         lambda: client.get_full_competition_results(competition_id, page_size=page_size, max_pages=100000)),
+        ('get_full_competition_results[prefetch]', None,
+         lambda: client.get_full_competition_results(competition_id, page_size=page_size, max_pages=100000, prefetch=True)),
+        ('get_full_competition_results_optimized', workers,
+         lambda: client.get_full_competition_results_optimized(
+             [initial_url], max_pages=100000, max_empty_pages=1, delay=0, use_threading=True, max_workers=workers)),
+        ('get_competition_results_fast', None,
+         lambda: client.get_competition_results_fast(competition_id, page_size=page_size, max_pages=100000)),
+    ]
+    return methods
+
+
+def bench_competition_results(recordings_dir: str = None, competition_id: int = 552, n_games: int = 2000,
+                              page_sizes=(20, 50, 100), worker_counts=(1, 4, 8), latency: float = 0.02,
+                              measure_memory: bool = True) -> dict:
+    """
+    Runs every competition-results method at each page size (and worker count, for the
+    methods that take one) against a local stand-in server. Reports pages/sec, games/sec,
+    peak traced memory and whether the returned game ids equal the full set.
+    """
+    with contextlib.ExitStack() as stack:
+        if recordings_dir is None:
+            recordings_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            expected_ids = synthetic_results_recordings(recordings_dir, competition_id, n_games)
+        else:
+            expected_ids = None
+        server = stack.enter_context(StandInServer(recordings_dir, latency=latency))
+        runs = []
+        for page_size in page_sizes:
+            for worker_count in worker_counts:
+                client = ThreeSixFiveScores(api_base=server.base_url, rate_limit=None, pool_size=max(worker_count, 8))
+                for name, workers, run in _competition_results_methods(client, competition_id, page_size, worker_count):
+                    if workers is None and worker_count != worker_counts[0]:
+                        continue # worker count doesn't apply; measured once per page size
+                    before = server.requests['games/results']
+                    sink = io.StringIO()
+                    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                        started = time.perf_counter()
+                        result = run()
+                        seconds = time.perf_counter() - started
+                        peak = None
+                        if measure_memory:
+                            tracemalloc.start()
+                            run()
+                            peak = tracemalloc.get_traced_memory()[1]
+                            tracemalloc.stop()
+                    pages = server.requests['games/results'] - before
+                    if measure_memory:
+                        pages //= 2
+                    ids = _game_ids(result)
+                    if expected_ids is None:
+                        expected_ids = ids
+                    runs.append({
+                        'method': name,
+                        'page_size': page_size,
+                        'workers': workers,
+                        'seconds': round(seconds, 4),
+                        'pages': pages,
+                        'games': len(ids),
+                        'pages_per_sec': round(pages / seconds, 2) if seconds else None,
+                        'games_per_sec': round(len(ids) / seconds, 2) if seconds else None,
+                        'peak_memory_mb': round(peak / 2 ** 20, 2) if peak is not None else None,
+                        'complete': ids == expected_ids,
+                        'missing_games': len(expected_ids - ids),
+                    })
+    return {
+        'benchmark': 'competition_results',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'params': {
+            'competition_id': competition_id,
+            'n_games': n_games,
+            'page_sizes': list(page_sizes),
+            'worker_counts': list(worker_counts),
+            'latency': latency,
+        },
+        'runs': runs,
+    }
+
+
+def synthetic_game_payload(seed: int = 0, members_per_team: int = 30, stats_per_member: int = 25,
+                           shots: int = 30, recent_matches: int = 20) -> dict:
+    """A /web/game/ payload shaped like the real one: lineups, chartEvents, recentMatches, topPerformers."""
+    rng = random.Random(seed)
+
+    def competitor(team_id, offset):
+        return {
+            'id': team_id,
+            'name': f'Team {team_id}',
+            'score': rng.randint(0, 4),
+            'color': '#%06x' % rng.randrange(1 << 24),
+            'recentMatches': [
+                {'id': rng.randint(1, 10 ** 7), 'startTime': '2024-01-01T18:00:00+00:00', 'shortStatusText': 'FT',
+                 'homeCompetitor': {'id': rng.randint(1, 500), 'name': 'Home', 'score': rng.randint(0, 4)},
+                 'awayCompetitor': {'id': rng.randint(1, 500), 'name': 'Away', 'score': rng.randint(0, 4)},
+                 'outcome': rng.randint(0, 2)}
+                for _ in range(recent_matches)
+            ],
+            'lineups': {'members': [
+                {'id': offset + i, 'status': 1, 'statusText': 'Starting', 'hasStats': True,
+                 'position': {'id': rng.randint(1, 4), 'name': 'Midfielder'},
+                 'yardFormation': {'line': rng.randint(1, 5), 'fieldPosition': rng.randint(1, 9), 'fieldLine': 1, 'fieldSide': 2},
+                 'ranking': round(rng.uniform(5, 9), 1),
+                 'heatMap': f'https://imagecache.365scores.com/heatmap/{offset + i}.png',
+                 'stats': [
+                     {'type': t, 'value': str(rng.randint(0, 90)), 'isTop': rng.random() < 0.1, 'categoryId': t % 5,
+                      'name': f'Stat {t}', 'shortName': f'S{t}', 'order': t}
+                     for t in range(stats_per_member)
+                 ]}
+                for i in range(members_per_team)
+            ]},
+        }
+
+    home = competitor(1, 1000)
+    away = competitor(2, 2000)
+    members = [
+        {'id': m['id'], 'name': f"Player {m['id']}", 'shortName': f"P{m['id']}", 'jerseyNumber': rng.randint(1, 99),
+         'competitorId': team['id']}
+        for team in (home, away) for m in team['lineups']['members']
+    ]
+    return {'game': {
+        'id': 4000000 + seed,
+        'statusGroup': 4,
+        'shortStatusText': 'FT',
+        'homeCompetitor': home,
+        'awayCompetitor': away,
+        'members': members,
+        'events': [{'gameTime': rng.randint(1, 90), 'eventType': {'id': 1, 'name': 'Goal'}, 'playerId': rng.choice(members)['id']}
+                   for _ in range(10)],
+        'chartEvents': {
+            'eventTypes': [{'value': 1, 'name': 'Shot'}, {'value': 2, 'name': 'Goal'}],
+            'statuses': [{'id': 1, 'name': 'Saved'}, {'id': 2, 'name': 'Missed'}],
+            'eventSubTypes': [{'value': 1, 'name': 'Right foot'}, {'value': 2, 'name': 'Header'}],
+            'events': [
+                {'type': rng.randint(1, 2), 'status': rng.randint(1, 2), 'subType': rng.randint(1, 2),
+                 'playerId': rng.choice(members)['id'], 'competitorNum': rng.randint(1, 2), 'time': rng.randint(1, 90),
+                 'xg': str(round(rng.random(), 3)), 'xgot': rng.choice(['-', str(round(rng.random(), 3))]),
+                 'line': rng.uniform(0, 100), 'side': rng.uniform(0, 100),
+                 'outcome': {'y': rng.uniform(0, 10), 'z': rng.uniform(0, 3), 'id': rng.randint(1, 5), 'name': 'On target', 'x': 0}}
+                for _ in range(shots)
+            ],
+        },
+        'topPerformers': {'categories': [
+            {'name': f'Category {c}', 'homePlayer': {'id': 1000 + c, 'stats': [{'name': 'Rating', 'value': '8.1'}] * 5},
+             'awayPlayer': {'id': 2000 + c, 'stats': [{'name': 'Rating', 'value': '7.4'}] * 5}}
+            for c in range(5)
+        ]},
+    }}
+
+
+def bench_json_decode(recordings_dir: str = None, n_payloads: int = 20, repeat: int = 5) -> dict:
+    """
+    Decode time per /web/game/ payload for the stdlib json module and for fastjson's backend
+    (orjson when installed). Uses the recorded game payloads when `recordings_dir` is given.
+    """
+    if recordings_dir:
+        directory = os.path.join(recordings_dir, 'game')
+        bodies = []
+        for name in sorted(os.listdir(directory))[:n_payloads]:
+            with open(os.path.join(directory, name), 'rb') as f:
+                bodies.append(f.read())
+    else:
+        bodies = [json.dumps(synthetic_game_payload(seed)).encode() for seed in range(n_payloads)]
+
+    decoders = [('json', json.loads)]
+    if fastjson.BACKEND != 'json':
+        decoders.append((fastjson.BACKEND, fastjson.loads))
+    runs = []
+    for name, decode in decoders:
+        per_game = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for body in bodies:
+                decode(body)
+            per_game.append((time.perf_counter() - started) / len(bodies))
+        runs.append({
+            'decoder': name,
+            'payloads': len(bodies),
+            'avg_payload_kb': round(sum(map(len, bodies)) / len(bodies) / 1024, 1),
+            'ms_per_game': round(statistics.median(per_game) * 1000, 3),
+        })
+    baseline = runs[0]['ms_per_game']
+    for run in runs:
+        run['speedup'] = round(baseline / run['ms_per_game'], 2) if run['ms_per_game'] else None
+        run['ms_saved_per_game'] = round(baseline - run['ms_per_game'], 3)
+    return {
+        'benchmark': 'json_decode',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'params': {'recordings': recordings_dir, 'n_payloads': len(bodies), 'repeat': repeat},
+        'runs': runs,
+    }
+
+
+def _rowwise_process_shotmap_dataframe(client, chart, game=None):
+    """The per-row implementation _process_shotmap_dataframe replaced, kept as the baseline."""
+    events = chart.get('events', [])
+    if not events:
+        return pd.DataFrame()
+    df = pd.DataFrame(events)
+    event_types = {e["value"]: e["name"] for e in chart.get("eventTypes", [])}
+    statuses = {s["id"]: s["name"] for s in chart.get("statuses", [])}
+    subtypes = {s["value"]: s["name"] for s in chart.get("eventSubTypes", [])}
+    if "type" in df.columns:
+        df["eventTypeName"] = df["type"].map(event_types)
+    if "status" in df.columns:
+        df["statusName"] = df["status"].map(statuses)
+    if "subType" in df.columns:
+        df["subTypeName"] = df["subType"].map(subtypes)
+    if 'xgot' in df.columns:
+        df['xgot'] = df['xgot'].apply(lambda x: str(x).replace('-', '0') if pd.notnull(x) and isinstance(x, str) else ('0' if pd.notnull(x) else '0'))
+    else:
+        df['xgot'] = '0'
+    if 'xg' not in df.columns:
+        df['xg'] = 0.0
+    else:
+        df['xg'] = pd.to_numeric(df['xg'], errors='coerce').fillna(0.0)
+    df['xgot'] = pd.to_numeric(df['xgot'], errors='coerce').fillna(0.0)
+    if 'outcome' in df.columns:
+        for col in ['y', 'z', 'id', 'name', 'x']:
+            df[f'outcome_{col}'] = df['outcome'].apply(lambda o: o.get(col) if isinstance(o, dict) else None)
+        df = df.rename(columns={'outcome_name': 'shot_outcome'})
+        df = df.drop(columns=['outcome'])
+    else:
+        df['shot_outcome'] = None
+    if game is not None:
+        members = client._extract_members(game)
+        player_id_to_name = {m["id"]: m.get("name") for m in members if "id" in m and "name" in m}
+        player_id_to_jersey = {m["id"]: m.get("jerseyNumber") for m in members if "id" in m and "jerseyNumber" in m}
+        if "playerId" in df.columns:
+            df["playerName"] = df["playerId"].map(player_id_to_name)
+            df["jerseyNumber"] = df["playerId"].map(player_id_to_jersey)
+    return df
+
+
+def bench_shotmap(shot_counts=(30, 1000, 10000, 100000), repeat: int = 5) -> dict:
+    """
+    Time of _process_shotmap_dataframe against the per-row baseline on synthetic shot lists
+    of each size, and whether both return the same frame.
+    """
+    client = ThreeSixFiveScores(rate_limit=None, adaptive_concurrency=False)
+    implementations = [
+        ('rowwise', lambda chart, game: _rowwise_process_shotmap_dataframe(client, chart, game)),
+        ('columnar', client._process_shotmap_dataframe),
+    ]
+    runs = []
+    for shots in shot_counts:
+        game = synthetic_game_payload(seed=shots, members_per_team=30, stats_per_member=1, shots=shots, recent_matches=0)['game']
+        chart = game['chartEvents']
+        expected = None
+        baseline = None
+        for name, process in implementations:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                df = process(chart, game)
+                timings.append(time.perf_counter() - started)
+            ms = statistics.median(timings) * 1000
+            if expected is None:
+                expected, baseline = df, ms
+            try:
+                pd.testing.assert_frame_equal(df, expected)
+                identical = True
+            except AssertionError:
+                identical = False
+            runs.append({
+                'implementation': name,
+                'shots': shots,
+                'ms': round(ms, 3),
+                'shots_per_sec': round(shots / (ms / 1000)) if ms else None,
+                'speedup': round(baseline / ms, 2) if ms else None,
+                'identical': identical,
+            })
+    return {
+        'benchmark': 'shotmap',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'params': {'shot_counts': list(shot_counts), 'repeat': repeat},
+        'runs': runs,
+    }
+
+
+def write_results(results: dict, out_dir: str) -> str:
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{results['benchmark']}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def print_table(results: dict):
+    runs = results['runs']
+    if not runs:
+        return
+    columns = list(runs[0].keys())
+    widths = {c: max(len(c), *(len(str(r[c])) for r in runs)) for c in columns}
+    print('  '.join(c.ljust(widths[c]) for c in columns))
+    for run in runs:
+        print('  '.join(str(run[c]).ljust(widths[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline crawler benchmarks.')
+    parser.add_argument('--out', default='bench_results')
+    sub = parser.add_subparsers(dest='benchmark', required=True)
+    cr = sub.add_parser('competition-results')
+    cr.add_argument('--recordings', default=None, help='recordings dir; default: synthetic data')
+    cr.add_argument('--competition', type=int, default=552)
+    cr.add_argument('--games', type=int, default=2000)
+    cr.add_argument('--page-sizes', type=int, nargs='+', default=[20, 50, 100])
+    cr.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8])
+    cr.add_argument('--latency', type=float, default=0.02)
+    cr.add_argument('--no-memory', action='store_true')
+    jd = sub.add_parser('json-decode')
+    jd.add_argument('--recordings', default=None, help='recordings dir; default: synthetic game payloads')
+    jd.add_argument('--payloads', type=int, default=20)
+    jd.add_argument('--repeat', type=int, default=5)
+    sm = sub.add_parser('shotmap')
+    sm.add_argument('--shots', type=int, nargs='+', default=[30, 1000, 10000, 100000])
+    sm.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.benchmark == 'competition-results':
+        results = bench_competition_results(
+            args.recordings, args.competition, args.games, args.page_sizes, args.workers,
+            args.latency, measure_memory=not args.no_memory
+        )
+    elif args.benchmark == 'json-decode':
+        results = bench_json_decode(args.recordings, args.payloads, args.repeat)
+    elif args.benchmark == 'shotmap':
+        results = bench_shotmap(args.shots, args.repeat)
+    print_table(results)
+    print(f'\n{write_results(results, args.out)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+DEFAULT_TTLS = {
+    'finished': None,   # never expires
+    'live': 30,
+    'upcoming': 15 * 60,
+    None: 5 * 60        # status unknown
+}
+
+
+class ResponseCache:
+    """
+    Persistent cache of raw API responses in a single SQLite file, zlib-compressed,
+    keyed by (endpoint, game_id, request), where `request` is the full request URL, so
+    the same game asked for with other parameters (competition, matchup) is a separate entry.
+
+    The TTL of an entry depends on the status of its game, given when it is stored:
+    finished games are kept forever, live and upcoming games expire quickly, and entries
+    stored without a status get the TTL of DEFAULT_TTLS[None].
+    Once the stored bytes exceed `max_bytes`, the least recently used entries are evicted.
+
+    Args:
+        path: SQLite file to use (created if missing).
+        max_bytes: Upper bound for the compressed size of all entries.
+        ttls: Overrides for DEFAULT_TTLS, in seconds (None = forever).
+        compress_level: zlib level used for new entries.
+    """
+
+    def __init__(self, path: str = '365scores_cache.sqlite', max_bytes: int = 512 * 1024 * 1024,
+                 ttls: dict = None, compress_level: int = 6):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(responses)')]
+        if columns and 'request' not in columns:
+            # Files from before requests were part of the key: start over, it's only a cache
+            self._conn.execute('DROP TABLE responses')
+            self._conn.execute('DROP TABLE IF EXISTS game_status')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' endpoint TEXT NOT NULL, game_id TEXT NOT NULL, request TEXT NOT NULL, body BLOB NOT NULL,'
+            ' size INTEGER NOT NULL, status TEXT, expires_at REAL, last_access REAL NOT NULL,'
+            ' PRIMARY KEY (endpoint, game_id, request))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)')
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def get(self, endpoint: str, game_id, request: str = ''):
+        """Returns the cached body (bytes) or None when missing or expired."""
+        key = str(game_id)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, size, expires_at FROM responses WHERE endpoint = ? AND game_id = ? AND request = ?',
+                (endpoint, key, request)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, size, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    'DELETE FROM responses WHERE endpoint = ? AND game_id = ? AND request = ?', (endpoint, key, request)
+                )
+                self._total_bytes -= size
+                self.misses += 1
+                return None
+            self._conn.execute(
+                'UPDATE responses SET last_access = ? WHERE endpoint = ? AND game_id = ? AND request = ?',
+                (now, endpoint, key, request)
+            )
+            self.hits += 1
+        return zlib.decompress(body)
+
+    def set(self, endpoint: str, game_id, body: bytes, status: str = None, request: str = ''):
+        """
+        Stores `body` for (endpoint, game_id, request). `status` is the game's status
+        ('finished', 'live', 'upcoming' or None) and picks the TTL.
+        """
+        key = str(game_id)
+        now = time.time()
+        compressed = zlib.compress(body, self.compress_level)
+        ttl = self.ttls.get(status, self.ttls[None])
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            old = self._conn.execute(
+                'SELECT size FROM responses WHERE endpoint = ? AND game_id = ? AND request = ?', (endpoint, key, request)
+            ).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (endpoint, game_id, request, body, size, status, expires_at, last_access)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (endpoint, key, request, compressed, len(compressed), status, expires_at, now)
+            )
+            self._total_bytes += len(compressed) - (old[0] if old else 0)
+            self.stores += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Drop least recently used entries until we are back under 90% of max_bytes.
+        target = self.max_bytes * 0.9
+        cursor = self._conn.execute('SELECT endpoint, game_id, request, size FROM responses ORDER BY last_access')
+        removed = []
+        for endpoint, key, request, size in cursor:
+            if self._total_bytes <= target:
+                break
+            removed.append((endpoint, key, request))
+            self._total_bytes -= size
+        cursor.close()
+        self._conn.executemany('DELETE FROM responses WHERE endpoint = ? AND game_id = ? AND request = ?', removed)
+        self.evictions += len(removed)
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': entries,
+                'bytes': self._total_bytes
+            }
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SingleFlightLRU:
+    """
+    In-memory LRU of parsed payloads with single-flight loading: while one thread is
+    loading a key, other threads asking for the same key wait for that result instead
+    of issuing their own request. Falsy results (failed fetches) are not cached, and
+    neither are results rejected by the `cacheable` predicate given to get_or_load.
+
+    Args:
+        maxsize: Max number of payloads kept (0 disables caching but keeps coalescing).
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._data = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, loader, cacheable=None, refresh: bool = False):
+        """
+        Returns the cached value for `key`, or calls `loader()` once and shares its result.
+        The result is kept only if `cacheable(value)` is true (when given); `refresh`
+        ignores the cached value and loads again.
+        """
+        with self._lock:
+            if key in self._data and not refresh:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._inflight[key] = call
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return call.result()
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            call.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            if value and self.maxsize > 0 and (cacheable is None or cacheable(value)):
+                self._data[key] = value
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+            elif refresh:
+                self._data.pop(key, None)
+        call.set_result(value)
+        return value
+
+    def peek(self, key):
+        """The cached value for `key`, or None; never loads and doesn't count as a hit."""
+        with self._lock:
+            return self._data.get(key)
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'entries': len(self._data)
+            }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
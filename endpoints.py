@@ -0,0 +1,38 @@
+"""
+365scores API base URL and the endpoint naming shared by the transports, metrics and
+the stand-in server.
+"""
+import hashlib
+import os
+from urllib.parse import urlencode
+
+
+API_BASE = 'https://webws.365scores.com'
+
+# endpoint -> query param that identifies a recording (None: hash of the whole query)
+RECORDED_ENDPOINTS = {
+    'game': 'gameId',
+    'game/stats': 'games',
+    'games/results': None,
+    'stats': 'competitions'
+}
+
+
+def endpoint_of(path: str) -> str:
+    """'/web/game/stats/' -> 'game/stats'."""
+    path = path.strip('/')
+    if path.startswith('web/'):
+        path = path[len('web/'):]
+    return path
+
+
+def recording_path(root: str, endpoint: str, query: dict) -> str:
+    """File a response for `endpoint` + `query` (single-valued dict) is stored under."""
+    key_param = RECORDED_ENDPOINTS[endpoint]
+    if key_param is not None:
+        key = str(query.get(key_param, ''))
+    else:
+        canonical = urlencode(sorted((k, str(v)) for k, v in query.items()))
+        key = f"{query.get('competitions', 'all')}-{hashlib.sha1(canonical.encode()).hexdigest()[:12]}"
+    safe_key = ''.join(c if c.isalnum() or c in '-_' else '_' for c in key)
+    return os.path.join(root, endpoint.replace('/', '_'), f'{safe_key}.json')
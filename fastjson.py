@@ -0,0 +1,33 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep catching the stdlib error.
+JSONDecodeError = json.JSONDecodeError
+
+_MISSING = object()
+
+
+def loads(data):
+    """Decodes JSON from bytes or str with orjson when installed, the stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response):
+    """
+    Drop-in for response.json() that decodes the raw body bytes with loads() and remembers
+    the result on the response, so a payload is never decoded twice.
+    """
+    data = getattr(response, '_decoded_json', _MISSING)
+    if data is _MISSING:
+        data = loads(response.content)
+        response._decoded_json = data
+    return data
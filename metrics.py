@@ -0,0 +1,137 @@
+import os
+import threading
+from urllib.parse import urlparse
+
+try:
+    from .endpoints import endpoint_of
+except ImportError:
+    from endpoints import endpoint_of
+
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+
+def endpoint_for_url(url: str) -> str:
+    """Logical endpoint of a request: 'game', 'game/stats', 'games/results', 'stats', ... or 'heatmap_image'."""
+    parsed = urlparse(url)
+    if parsed.path.startswith('/web/'):
+        return endpoint_of(parsed.path)
+    # The only requests outside the /web/ API are the heatmap image downloads
+    return 'heatmap_image'
+
+
+class _EndpointMetrics:
+    __slots__ = ('requests', 'errors', 'retries', 'throttles', 'bytes', 'latency_sum', 'latency_buckets', 'cache_hits')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttles = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.cache_hits = {}
+
+    def to_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'throttles': self.throttles,
+            'bytes': self.bytes,
+            'latency_sum': round(self.latency_sum, 6),
+            'latency_avg': round(self.latency_sum / self.requests, 6) if self.requests else None,
+            'latency_histogram': {str(b): n for b, n in zip(LATENCY_BUCKETS, self.latency_buckets)},
+            'cache_hits': dict(self.cache_hits),
+        }
+
+
+class ClientMetrics:
+    """
+    Per-endpoint request counters for a client: requests, errors, latency histogram,
+    response bytes, retries, throttles (429/503) and cache hits by source ('disk', 'memory').
+    Thread-safe. Export with to_dict(), to_prometheus() or write_prometheus(path).
+    """
+
+    def __init__(self, namespace: str = 'threesixfivescores'):
+        self.namespace = namespace
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint: str) -> _EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = _EndpointMetrics()
+        return metrics
+
+    def observe(self, endpoint: str, seconds: float, nbytes: int = 0, retries: int = 0,
+                throttles: int = 0, error: bool = False):
+        """Records one logical request (retries included) to `endpoint`."""
+        with self._lock:
+            metrics = self._get(endpoint)
+            metrics.requests += 1
+            metrics.errors += int(error)
+            metrics.retries += retries
+            metrics.throttles += throttles
+            metrics.bytes += nbytes
+            metrics.latency_sum += seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    metrics.latency_buckets[i] += 1
+                    break
+
+    def cache_hit(self, endpoint: str, source: str = 'disk'):
+        with self._lock:
+            hits = self._get(endpoint).cache_hits
+            hits[source] = hits.get(source, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {endpoint: metrics.to_dict() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (histogram buckets are cumulative)."""
+        ns = self.namespace
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = []
+            counters = [
+                ('requests_total', 'requests', 'Logical requests sent; retries are counted separately.'),
+                ('errors_total', 'errors', 'Requests that ended in an error.'),
+                ('retries_total', 'retries', 'Retries performed by the retry policy.'),
+                ('throttles_total', 'throttles', '429/503 responses received.'),
+                ('response_bytes_total', 'bytes', 'Response body bytes received.'),
+            ]
+            for name, attr, help_text in counters:
+                lines.append(f'# HELP {ns}_{name} {help_text}')
+                lines.append(f'# TYPE {ns}_{name} counter')
+                for endpoint, metrics in endpoints:
+                    lines.append(f'{ns}_{name}{{endpoint="{endpoint}"}} {getattr(metrics, attr)}')
+            lines.append(f'# HELP {ns}_cache_hits_total Responses served from a cache instead of the network.')
+            lines.append(f'# TYPE {ns}_cache_hits_total counter')
+            for endpoint, metrics in endpoints:
+                for source, hits in sorted(metrics.cache_hits.items()):
+                    lines.append(f'{ns}_cache_hits_total{{endpoint="{endpoint}",source="{source}"}} {hits}')
+            lines.append(f'# HELP {ns}_request_duration_seconds Request latency, retries included.')
+            lines.append(f'# TYPE {ns}_request_duration_seconds histogram')
+            for endpoint, metrics in endpoints:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, metrics.latency_buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{ns}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{le}"}} {cumulative}')
+                lines.append(f'{ns}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {metrics.latency_sum}')
+                lines.append(f'{ns}_request_duration_seconds_count{{endpoint="{endpoint}"}} {metrics.requests}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str):
+        """Atomically writes to_prometheus() to `path` (for node_exporter's textfile collector)."""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
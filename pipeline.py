@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import requests
+
+try:
+    from .dataclasses import process_game_data
+    from .fastjson import loads
+    from .status import classify_game_status
+    from .threesixfivescores import ThreeSixFiveScores
+except ImportError:
+    from dataclasses import process_game_data
+    from fastjson import loads
+    from status import classify_game_status
+    from threesixfivescores import ThreeSixFiveScores
+
+
+_worker_parser = None
+
+
+def _parser() -> ThreeSixFiveScores:
+    # One client per worker process, used only for its parsing helpers (it never sends a request)
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ThreeSixFiveScores.offline()
+    return _worker_parser
+
+
+def _process_context():
+    # Parse workers must not be forked from this process: by the time the first parse job is
+    # submitted the download threads are running and may hold urllib3, SQLite or queue locks
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def parse_game(data: dict):
+    """/web/game/ payload -> dataclasses.process_game_data dict."""
+    game = data.get('game') or {}
+    return process_game_data(game, game.get('id'))
+
+
+def parse_shotmap(data: dict):
+    """/web/game/ payload -> shotmap DataFrame (same as get_shotmap_enriched)."""
+    return _parser()._shotmap_enriched_from_data(data)
+
+
+def parse_stats(data: dict):
+    """/web/game/stats/ payload -> per-team stats DataFrame (same as get_match_general_stats_by_id)."""
+    return _parser()._build_general_stats_dataframe(data)
+
+
+def parse_results(data: dict):
+    """/web/games/results/ payload -> _process_game_records DataFrame."""
+    return _parser()._process_game_records(data.get('games') or [])
+
+
+# kind -> (endpoint, parser)
+PARSERS = {
+    'game': ('game', parse_game),
+    'shotmap': ('game', parse_shotmap),
+    'stats': ('stats', parse_stats),
+    'results': ('games/results', parse_results),
+}
+
+
+def _parse_job(kind: str, body: bytes):
+    """Runs in a worker process: decodes `body` and extracts its table. Returns (status, result)."""
+    data = loads(body)
+    status = classify_game_status(data.get('game')) if PARSERS[kind][0] == 'game' else None
+    return status, PARSERS[kind][1](data)
+
+
+class FetchParsePipeline:
+    """
+    Producer/consumer pipeline: I/O threads download raw response bodies and put them on a
+    bounded queue; a process pool decodes them and builds the tables, so parsing uses every
+    core while the network stays busy. When the queue is full the downloaders wait, and at
+    most `max_pending` bodies are being parsed at once.
+
+    Kinds (see PARSERS): 'game' and 'shotmap' take game ids, 'stats' takes game ids,
+    'results' takes full /web/games/results/ URLs.
+
+    The worker processes are started with forkserver (spawn where it isn't available), never
+    forked from the process running the downloads; scripts need the usual
+    `if __name__ == '__main__':` guard, and PARSERS changes made at run time don't reach them.
+
+    Args:
+        client: ThreeSixFiveScores whose transport (and /web/game/ cache) is used for downloads.
+        kind: What to extract from every item.
+        competition_id: Added to game/stats requests.
+        fetch_workers: Download threads.
+        parse_workers: Worker processes (default: os.cpu_count()).
+        queue_size: Raw bodies waiting for a parse worker before downloads pause.
+        max_pending: Bodies submitted to the pool at once (default: 2 per worker).
+    """
+
+    def __init__(self, client, kind: str = 'game', competition_id=None, fetch_workers: int = 8,
+                 parse_workers: int = None, queue_size: int = 64, max_pending: int = None):
+        if kind not in PARSERS:
+            raise ValueError(f"نوع غير مدعوم: {kind}. الأنواع المتاحة: {', '.join(PARSERS)}")
+        self.client = client
+        self.kind = kind
+        self.competition_id = competition_id
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.max_pending = max_pending or 2 * self.parse_workers
+        self.fetch_errors = 0
+        self.parse_errors = 0
+
+    def _url(self, item) -> str:
+        if self.kind == 'results':
+            return item
+        if self.kind == 'stats':
+            return self.client._stats_url(item, self.competition_id)
+        return self.client._match_data_url(item, competition_id=self.competition_id)
+
+    def _download(self, item, raw: queue.Queue, stop: threading.Event):
+        if stop.is_set():
+            return
+        endpoint = PARSERS[self.kind][0]
+        cache = self.client.cache if endpoint in ('game', 'stats') else None
+        url = self._url(item)
+        store = None
+        try:
+            body = cache.get(endpoint, item, url) if cache is not None else None
+            if body is not None:
+                self.client.metrics.cache_hit(endpoint, 'disk')
+            else:
+                body = self.client.transport.get(url, headers=self.client.headers).content
+                if cache is not None:
+                    # Stored once the parse worker has classified the game's status (sets the TTL)
+                    store = (cache, endpoint, url)
+        except requests.exceptions.RequestException as e:
+            print(f"خطأ أثناء جلب البيانات من الرابط: {e}")
+            body = None
+        except Exception as e:
+            # Still hand the item over, or run() would wait for it forever
+            print(f"خطأ أثناء جلب البيانات ({item}): {e}")
+            body, store = None, None
+        # Waits while the queue is full (downloads wait for the parsers), until run() stops
+        while not stop.is_set():
+            try:
+                raw.put((item, body, store), timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def run(self, items):
+        """
+        Generator of (item, result) in completion order; result is None when the download or
+        the parse failed. Closing the generator early stops the downloads still queued.
+        """
+        items = list(items)
+        if not items:
+            return
+        raw = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        fetchers = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        parsers = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=_process_context())
+        try:
+            for item in items:
+                fetchers.submit(self._download, item, raw, stop)
+            remaining = len(items)
+            pending = {}
+            while remaining or pending:
+                while remaining and len(pending) < self.max_pending:
+                    try:
+                        item, body, store = raw.get(block=not pending, timeout=None if not pending else 0)
+                    except queue.Empty:
+                        break
+                    remaining -= 1
+                    if body is None:
+                        self.fetch_errors += 1
+                        yield item, None
+                        continue
+                    future = parsers.submit(_parse_job, self.kind, body)
+                    pending[future] = (item, body, store)
+                if not pending:
+                    continue
+                done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item, body, store = pending.pop(future)
+                    try:
+                        status, result = future.result()
+                    except Exception as e:
+                        print(f"خطأ أثناء تحليل البيانات ({item}): {e}")
+                        self.parse_errors += 1
+                        yield item, None
+                        continue
+                    if store is not None:
+                        store[0].set(store[1], item, body, status=status, request=store[2])
+                    yield item, result
+        finally:
+            # Runs on normal exit, on an exception and when the consumer closes the generator:
+            # unblock the downloaders waiting on a full queue before waiting for them
+            stop.set()
+            while True:
+                try:
+                    raw.get_nowait()
+                except queue.Empty:
+                    break
+            fetchers.shutdown(cancel_futures=True)
+            parsers.shutdown(cancel_futures=True)
+
+    def collect(self, items) -> dict:
+        """Runs the pipeline to the end and returns {item: result} for the successful items."""
+        return {item: result for item, result in self.run(items) if result is not None}
@@ -0,0 +1,248 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, holding at most `burst` tokens.
+    Callers only wait once the bucket is empty; waiting callers are served in the order
+    they reserved, so N threads sharing one bucket never exceed the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate is None or rate <= 0:
+            raise ValueError("rate must be a positive number of requests per second")
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Takes `tokens` from the bucket and returns how long the caller must wait before using them."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Blocks until `tokens` are available. Returns the time spent waiting, in seconds."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class HostRateLimiter:
+    """
+    One TokenBucket per host, created lazily. `per_host` overrides the default
+    (rate, burst) for specific hosts, e.g. {'imagecache.365scores.com': (10, 20)}.
+    A rate of None disables limiting for that host.
+    """
+
+    def __init__(self, rate: float = 3.0, burst: int = 5, per_host: dict = None):
+        self.rate = rate
+        self.burst = burst
+        self.per_host = dict(per_host or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str):
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self.per_host.get(host, (self.rate, self.burst))
+                self._buckets[host] = TokenBucket(rate, burst) if rate else None
+            return self._buckets[host]
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def reserve(self, url: str) -> float:
+        bucket = self.bucket(self._host(url))
+        return bucket.reserve() if bucket else 0.0
+
+    def acquire(self, url: str) -> float:
+        bucket = self.bucket(self._host(url))
+        return bucket.acquire() if bucket else 0.0
+
+
+class SharedRateLimiter:
+    """
+    HostRateLimiter whose buckets live in a SQLite file, so every process (and thread)
+    opening the same `path` draws from one request budget per host. Each reservation
+    runs in an IMMEDIATE transaction, i.e. under SQLite's file lock; wall-clock time is
+    used so processes agree on the refill.
+
+    Args:
+        path: SQLite file shared by the processes (created if missing).
+        rate, burst, per_host: As in HostRateLimiter.
+    """
+
+    def __init__(self, path: str = '365scores_budget.sqlite', rate: float = 3.0, burst: int = 5,
+                 per_host: dict = None):
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self.per_host = dict(per_host or {})
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS buckets (host TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)'
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread (and per process, since threading.local doesn't survive a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def reserve(self, url: str) -> float:
+        host = HostRateLimiter._host(url)
+        rate, burst = self.per_host.get(host, (self.rate, self.burst))
+        if not rate:
+            return 0.0
+        capacity = float(max(1, burst))
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE host = ?', (host,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * rate)
+            tokens -= 1
+            conn.execute(
+                'INSERT OR REPLACE INTO buckets (host, tokens, updated) VALUES (?, ?, ?)', (host, tokens, now)
+            )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    def acquire(self, url: str) -> float:
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on requests in flight: the window grows by `increase` per window's worth of
+    successful responses and is halved when the server throttles (429/503). At most one
+    decrease happens per `cooldown` seconds so a burst of 429s from the same window only
+    counts once.
+
+    Args:
+        initial: Starting window.
+        min_limit: The window never drops below this.
+        max_limit: The window never grows above this (e.g. the connection pool size).
+        increase: Additive step per full window of successes.
+        decrease_factor: Multiplier applied on throttling.
+        cooldown: Seconds after a decrease during which further throttles don't shrink the window.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 64,
+                 increase: float = 1.0, decrease_factor: float = 0.5, cooldown: float = 1.0):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self.successes = 0
+        self.throttle_events = 0
+        self.history = deque(maxlen=100)  # (time.time(), old_limit, new_limit) for every decrease
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        """Blocks until a slot inside the current window is free."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False, success: bool = True):
+        """
+        Frees a slot. `throttled` shrinks the window, a plain success grows it;
+        other failures (success=False) leave it unchanged.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.throttle_events += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    old = self._limit
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self.history.append((time.time(), int(old), int(self._limit)))
+            elif success:
+                self.successes += 1
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """with limiter.slot(): ... — releases as a plain success; use acquire/release to report throttling."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @property
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'successes': self.successes,
+                'throttle_events': self.throttle_events,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'decreases': list(self.history)
+            }
@@ -0,0 +1,186 @@
+import datetime
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from .status import classify_game_status
+except ImportError:
+    from status import classify_game_status
+
+
+# Lower runs first: live games are refreshed before upcoming ones, finished backfill fills what's left.
+STATUS_PRIORITY = {'live': 0, 'upcoming': 1, 'finished': 2, None: 3}
+
+
+def _kickoff_timestamp(game: dict) -> float:
+    try:
+        return datetime.datetime.fromisoformat(str(game.get('startTime'))).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CrawlScheduler:
+    """
+    Priority crawler for /web/game/ payloads across many competitions.
+
+    Games are discovered from the competitions' results pages and queued by status
+    (live > upcoming > finished, using the status map of _apply_status_filter) and kickoff:
+    live and upcoming games earliest kickoff first, finished games most recent first.
+    A bounded pool of workers takes the highest-priority game each time it's free; the
+    request budget is the client's shared rate limiter and concurrency limiter, so
+    backfill only uses capacity the live games leave over.
+
+    Args:
+        client: ThreeSixFiveScores used for every request.
+        competition_ids: Competitions to crawl.
+        max_workers: Worker threads.
+        live_refresh: Seconds after which a game that was live is fetched again (None: fetch once).
+        discover_pages: Results pages read per competition when discovering games.
+        page_size: Games per results page.
+        on_result: Callback(game_id, competition_id, payload) for every fetch; when omitted
+            the latest payload per game is kept in `results`.
+    """
+
+    def __init__(self, client, competition_ids, max_workers: int = 8, live_refresh: float = 60.0,
+                 discover_pages: int = 5, page_size: int = 100, on_result=None):
+        self.client = client
+        self.competition_ids = list(competition_ids)
+        self.max_workers = max_workers
+        self.live_refresh = live_refresh
+        self.discover_pages = discover_pages
+        self.page_size = page_size
+        self.on_result = on_result
+        self.results = {}
+        self.fetched = {'live': 0, 'upcoming': 0, 'finished': 0, None: 0}
+        self.errors = 0
+        self._ready = []    # (priority, order, seq, game_id, competition_id)
+        self._delayed = []  # (not_before, seq, entry)
+        self._queued = set()
+        self._in_flight = 0
+        self._seq = itertools.count()
+        self._stopped = False
+        self._cond = threading.Condition()
+
+    def discover(self) -> int:
+        """Reads the results pages of every competition and queues their games. Returns the number queued."""
+        queued = 0
+        for competition_id in self.competition_ids:
+            pages = self.client.iter_competition_games(
+                competition_id, page_size=self.page_size, max_pages=self.discover_pages, as_dataframe=False
+            )
+            for page in pages:
+                for game in page:
+                    queued += self.submit(game, competition_id)
+        return queued
+
+    def submit(self, game: dict, competition_id=None, not_before: float = None) -> bool:
+        """Queues a raw game dict (needs 'id'; uses 'shortStatusText'/'statusGroup' and 'startTime')."""
+        game_id = game.get('id')
+        if game_id is None:
+            return False
+        status = classify_game_status(game)
+        kickoff = _kickoff_timestamp(game)
+        order = -kickoff if status == 'finished' else kickoff
+        entry = (STATUS_PRIORITY[status], order, next(self._seq), game_id, competition_id or game.get('competitionId'))
+        with self._cond:
+            if game_id in self._queued:
+                return False
+            self._queued.add(game_id)
+            if not_before is not None and not_before > time.monotonic():
+                heapq.heappush(self._delayed, (not_before, entry[2], entry))
+            else:
+                heapq.heappush(self._ready, entry)
+            self._cond.notify()
+        return True
+
+    def _take(self, until_idle: bool, deadline: float):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    heapq.heappush(self._ready, heapq.heappop(self._delayed)[2])
+                if self._stopped or (deadline is not None and now >= deadline):
+                    return None
+                if self._ready:
+                    entry = heapq.heappop(self._ready)
+                    self._queued.discard(entry[3])
+                    self._in_flight += 1
+                    return entry
+                if until_idle and not self._delayed and self._in_flight == 0:
+                    return None
+                timeout = 0.5
+                if self._delayed:
+                    timeout = min(timeout, max(0.0, self._delayed[0][0] - now))
+                if deadline is not None:
+                    timeout = min(timeout, max(0.0, deadline - now))
+                self._cond.wait(timeout)
+
+    def _worker(self, until_idle: bool, deadline: float):
+        while True:
+            entry = self._take(until_idle, deadline)
+            if entry is None:
+                return
+            priority, _, _, game_id, competition_id = entry
+            try:
+                # Anything not known to be finished bypasses the client's memo and cache, or a
+                # live refresh would just get back the payload of the previous fetch
+                data = self.client.get_match_data_by_id(
+                    game_id, competition_id, fresh=priority != STATUS_PRIORITY['finished']
+                )
+                game = data.get('game') if isinstance(data, dict) else None
+                if not game:
+                    with self._cond:
+                        self.errors += 1
+                    continue
+                status = classify_game_status(game)
+                with self._cond:
+                    self.fetched[status] += 1
+                if self.on_result is not None:
+                    self.on_result(game_id, competition_id, data)
+                else:
+                    self.results[game_id] = data
+                if status == 'live' and self.live_refresh:
+                    self.submit(game, competition_id, not_before=time.monotonic() + self.live_refresh)
+            except Exception as e:
+                # A failed fetch or callback must not take the worker down with it
+                print(f"خطأ أثناء جلب بيانات المباراة ({game_id}): {e}")
+                with self._cond:
+                    self.errors += 1
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def run(self, duration: float = None, discover: bool = True) -> dict:
+        """
+        Crawls until the queue is empty (and no live game is waiting for its refresh), or
+        until `duration` seconds have passed. Returns `stats`.
+        """
+        if discover:
+            self.discover()
+        self._stopped = False
+        deadline = time.monotonic() + duration if duration is not None else None
+        until_idle = duration is None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in range(self.max_workers):
+                executor.submit(self._worker, until_idle, deadline)
+        return self.stats
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    @property
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'queued': len(self._ready),
+                'waiting_refresh': len(self._delayed),
+                'in_flight': self._in_flight,
+                'fetched': dict(self.fetched),
+                'errors': self.errors,
+            }
@@ -0,0 +1,225 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from .cache import ResponseCache
+    from .ratelimit import SharedRateLimiter
+    from .status import classify_game_status
+    from .threesixfivescores import ThreeSixFiveScores
+except ImportError:
+    from cache import ResponseCache
+    from ratelimit import SharedRateLimiter
+    from status import classify_game_status
+    from threesixfivescores import ThreeSixFiveScores
+
+
+class FetchedSet:
+    """
+    Set of already-fetched game ids shared by processes through a SQLite file.
+
+    A worker claim()s a game before fetching it; only one claimant wins. It then marks
+    the game done() or release()s it on failure so another worker may retry. Claims older
+    than `claim_timeout` seconds (their process died) can be taken over.
+
+    close() it before forking processes that open the same file: a SQLite connection
+    inherited through fork() leaves the children with lock state they don't actually
+    hold, and two of them can then win the same claim.
+
+    Args:
+        path: SQLite file shared by the processes (created if missing).
+        claim_timeout: Seconds after which an unfinished claim is considered abandoned.
+    """
+
+    def __init__(self, path: str = '365scores_fetched.sqlite', claim_timeout: float = 300):
+        self.path = path
+        self.claim_timeout = claim_timeout
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS fetched ('
+            ' key TEXT PRIMARY KEY, owner TEXT, done INTEGER NOT NULL DEFAULT 0, claimed_at REAL NOT NULL)'
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def claim(self, key, owner: str = None) -> bool:
+        """True when the caller now owns `key` and should fetch it."""
+        key = str(key)
+        now = time.time()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT done, claimed_at FROM fetched WHERE key = ?', (key,)).fetchone()
+            won = row is None or (not row[0] and now - row[1] > self.claim_timeout)
+            if won:
+                conn.execute(
+                    'INSERT OR REPLACE INTO fetched (key, owner, done, claimed_at) VALUES (?, ?, 0, ?)',
+                    (key, owner, now)
+                )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return won
+
+    def done(self, key):
+        self._connection().execute('UPDATE fetched SET done = 1 WHERE key = ?', (str(key),))
+
+    def release(self, key):
+        self._connection().execute('DELETE FROM fetched WHERE key = ? AND done = 0', (str(key),))
+
+    def __contains__(self, key) -> bool:
+        row = self._connection().execute('SELECT done FROM fetched WHERE key = ?', (str(key),)).fetchone()
+        return bool(row and row[0])
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM fetched WHERE done = 1').fetchone()[0]
+
+    def close(self):
+        """Closes this thread's connection; the next call opens a new one."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _crawl_shard(config: dict, shard_index: int, shard: list) -> dict:
+    """Runs in a crawler process: fetches the games of one shard into the shared cache."""
+    limiter = SharedRateLimiter(config['budget_path'], rate=config['rate'], burst=config['burst'])
+    client = ThreeSixFiveScores(
+        rate_limiter=limiter,
+        pool_size=config['threads'],
+        cache=ResponseCache(config['cache_path']),
+        memo_size=0,
+        api_base=config['api_base']
+    )
+    fetched = FetchedSet(config['fetched_path'])
+    owner = f'{os.getpid()}-{shard_index}'
+
+    if config['kind'] == 'competitions':
+        games = []
+        for competition_id in shard:
+            pages = client.iter_competition_games(
+                competition_id, page_size=config['page_size'], max_pages=config['max_pages'], as_dataframe=False
+            )
+            for page in pages:
+                games += [(game['id'], competition_id) for game in page if game.get('id') is not None]
+    else:
+        games = [(game_id, config['competition_id']) for game_id in shard]
+
+    counts = {'shard': shard_index, 'fetched': 0, 'skipped': 0, 'failed': 0, 'unfinished': 0}
+    lock = threading.Lock()
+
+    def _fetch(game):
+        game_id, competition_id = game
+        unfinished = False
+        if not fetched.claim(game_id, owner):
+            outcome = 'skipped'
+        else:
+            payload = client.get_match_data_by_id(game_id, competition_id).get('game')
+            status = classify_game_status(payload)
+            if payload and config['include_stats']:
+                client.get_match_general_stats_by_id(game_id, competition_id, status=status)
+            # Only a finished game's payload is final; live and upcoming ones are fetched again next run
+            if status == 'finished':
+                fetched.done(game_id)
+            else:
+                fetched.release(game_id)
+            outcome = 'fetched' if payload else 'failed'
+            unfinished = bool(payload) and status != 'finished'
+        with lock:
+            counts[outcome] += 1
+            counts['unfinished'] += unfinished
+
+    with ThreadPoolExecutor(max_workers=config['threads']) as executor:
+        list(executor.map(_fetch, games))
+    return counts
+
+
+class ShardedCrawler:
+    """
+    Crawls /web/game/ payloads with several processes. Competitions (or game ids) are split
+    round-robin into one shard per process; every process runs `threads` worker threads.
+
+    All processes draw from one SharedRateLimiter, so together they stay under `rate`
+    requests per second per host, and claim games in one FetchedSet, so a game found in
+    two shards (or left by an earlier run) is fetched once. Only finished games are marked
+    done; live and upcoming ones are released and fetched again by the next run.
+
+    Payloads go to the ResponseCache in `state_dir`/cache.sqlite, keyed on the request URL.
+    Read them back with ThreeSixFiveScores(cache=ResponseCache(path)) and the competition id
+    they were requested with: get_match_data_by_id(game_id, competition_id) (and
+    get_match_general_stats_by_id) where competition_id is the crawled competition, or the
+    crawler's `competition_id` for game_ids crawls (None when not given; the method's own
+    default, "any id", builds another URL and misses the cache).
+
+    Args:
+        competition_ids / game_ids: What to crawl (one of them is required).
+        processes: Crawler processes (default: os.cpu_count()).
+        threads: Worker threads per process.
+        rate, burst: Global request budget, per host.
+        state_dir: Directory for the budget, fetched-set and cache files.
+        competition_id: Competition passed with game_ids requests.
+        include_stats: Also fetch /web/game/stats/ for every game.
+        page_size, max_pages: Results paging used to discover the games of a competition.
+        api_base: As in ThreeSixFiveScores.
+    """
+
+    def __init__(self, competition_ids=None, game_ids=None, processes: int = None, threads: int = 4,
+                 rate: float = 3.0, burst: int = 5, state_dir: str = '365scores_crawl', competition_id=None,
+                 include_stats: bool = False, page_size: int = 100, max_pages: int = 1000, api_base: str = None):
+        if not competition_ids and not game_ids:
+            raise ValueError("يجب توفير إما 'competition_ids' أو 'game_ids'.")
+        self.items = list(competition_ids or game_ids)
+        self.processes = min(processes or os.cpu_count() or 1, len(self.items))
+        os.makedirs(state_dir, exist_ok=True)
+        self.config = {
+            'kind': 'competitions' if competition_ids else 'games',
+            'threads': threads,
+            'rate': rate,
+            'burst': burst,
+            'budget_path': os.path.join(state_dir, 'budget.sqlite'),
+            'fetched_path': os.path.join(state_dir, 'fetched.sqlite'),
+            'cache_path': os.path.join(state_dir, 'cache.sqlite'),
+            'competition_id': competition_id,
+            'include_stats': include_stats,
+            'page_size': page_size,
+            'max_pages': max_pages,
+            'api_base': api_base,
+        }
+        self.fetched = FetchedSet(self.config['fetched_path'])
+
+    def shards(self) -> list:
+        return [self.items[i::self.processes] for i in range(self.processes)]
+
+    def run(self) -> dict:
+        """
+        Crawls every shard and returns the totals plus the per-shard counts; 'unfinished'
+        counts the fetched games that weren't finished yet (they stay open for the next run).
+        """
+        # The crawler processes are forked from this one: no connection to the fetched set may be open
+        self.fetched.close()
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            futures = [
+                executor.submit(_crawl_shard, self.config, index, shard)
+                for index, shard in enumerate(self.shards())
+            ]
+            shards = [future.result() for future in futures]
+        return {
+            'fetched': sum(s['fetched'] for s in shards),
+            'skipped': sum(s['skipped'] for s in shards),
+            'failed': sum(s['failed'] for s in shards),
+            'unfinished': sum(s['unfinished'] for s in shards),
+            'shards': shards,
+        }
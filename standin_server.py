@@ -0,0 +1,238 @@
+"""
+Local stand-in for webws.365scores.com that replays responses recorded with
+transport.RecordingTransport, for offline benchmarks and load tests.
+
+    python standin_server.py recordings/ --port 8365 --latency 0.05 --throttle-rate 0.02
+
+then point a client at it with ThreeSixFiveScores(api_base='http://127.0.0.1:8365').
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+try:
+    from .endpoints import RECORDED_ENDPOINTS, endpoint_of, recording_path
+except ImportError:
+    from endpoints import RECORDED_ENDPOINTS, endpoint_of, recording_path
+
+
+class StandInServer:
+    """
+    Threaded HTTP server replaying recorded responses.
+
+    /web/game/, /web/game/stats/ and /web/stats/ are served from their recordings (404 when
+    missing; several comma-separated ids on /web/game/stats/ are merged). /web/games/results/
+    is re-paginated from every game recorded for the competition, ordered by startTime, with
+    `aftergame=<last game id>` cursors in paging.nextPage. `direction=-1` walks back in time
+    from the latest game (pages are then ordered latest first), and `startDate`/`endDate`
+    (dd/mm/yyyy, inclusive, compared with the date part of startTime) restrict the games
+    served to that window.
+
+    Args:
+        recordings_dir: Directory written by RecordingTransport.
+        host, port: Bind address; port 0 picks a free port.
+        latency: Seconds added to every response.
+        jitter: Extra random latency, uniform in [0, jitter].
+        page_size: Games per results page; overrides the client's `games` param when set.
+        throttle_rate: Probability of answering any request with 429.
+        max_in_flight: Answer 429 while more than this many requests are being served.
+        retry_after: Value of the Retry-After header sent with 429s (None: no header).
+        seed: Seed for latency jitter and throttle injection.
+    """
+
+    def __init__(self, recordings_dir: str, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, page_size: int = None, throttle_rate: float = 0.0,
+                 max_in_flight: int = None, retry_after: int = None, seed: int = None):
+        self.recordings_dir = recordings_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.throttle_rate = throttle_rate
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.requests = Counter()
+        self.throttled = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._results_cache = {}
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> str:
+        """Serves in a background thread and returns the base URL."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                status, body, headers = server._respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def _respond(self, raw_path: str):
+        parsed = urlparse(raw_path)
+        endpoint = endpoint_of(parsed.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        with self._lock:
+            self.requests[endpoint] += 1
+            self._in_flight += 1
+            over_capacity = self.max_in_flight is not None and self._in_flight > self.max_in_flight
+            throttle = over_capacity or (self.throttle_rate and self._random.random() < self.throttle_rate)
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        try:
+            if delay:
+                time.sleep(delay)
+            if throttle:
+                with self._lock:
+                    self.throttled[endpoint] += 1
+                headers = {'Retry-After': str(self.retry_after)} if self.retry_after is not None else {}
+                return 429, b'{}', headers
+            if endpoint == 'games/results':
+                body = self._results_page(parsed.path, query)
+            elif endpoint == 'game/stats' and ',' in query.get('games', ''):
+                body = self._merged_stats(query)
+            elif endpoint in RECORDED_ENDPOINTS:
+                body = self._read(recording_path(self.recordings_dir, endpoint, query))
+            else:
+                body = None
+            if body is None:
+                return 404, b'{}', {}
+            return 200, body, {}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _read(path: str):
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _merged_stats(self, query: dict):
+        merged = {'statistics': [], 'competitors': []}
+        found = False
+        for game_id in query['games'].split(','):
+            body = self._read(recording_path(self.recordings_dir, 'game/stats', {'games': game_id}))
+            if body is None:
+                continue
+            found = True
+            data = json.loads(body)
+            merged['statistics'].extend(data.get('statistics') or [])
+            merged['competitors'].extend(data.get('competitors') or [])
+        return json.dumps(merged).encode() if found else None
+
+    def _competition_games(self, competition: str) -> list:
+        with self._lock:
+            if competition in self._results_cache:
+                return self._results_cache[competition]
+        directory = os.path.join(self.recordings_dir, 'games_results')
+        games = {}
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if not name.startswith(f'{competition}-'):
+                    continue
+                with open(os.path.join(directory, name), 'rb') as f:
+                    for game in json.loads(f.read()).get('games') or []:
+                        games[game.get('id')] = game
+        ordered = sorted(games.values(), key=lambda g: (str(g.get('startTime', '')), g.get('id') or 0))
+        with self._lock:
+            self._results_cache[competition] = ordered
+        return ordered
+
+    @staticmethod
+    def _window_date(value: str):
+        """'dd/mm/yyyy' -> 'yyyy-mm-dd', comparable with the date part of startTime."""
+        day, month, year = value.split('/')
+        return f'{year}-{month.zfill(2)}-{day.zfill(2)}'
+
+    def _results_page(self, path: str, query: dict):
+        games = self._competition_games(str(query.get('competitions', '')))
+        if query.get('startDate') or query.get('endDate'):
+            first = self._window_date(query['startDate']) if query.get('startDate') else ''
+            last = self._window_date(query['endDate']) if query.get('endDate') else '9999-12-31'
+            games = [g for g in games if first <= str(g.get('startTime', ''))[:10] <= last]
+        if str(query.get('direction', '1')) == '-1':
+            games = games[::-1]
+        page_size = self.page_size or int(query.get('games') or 20)
+        start = 0
+        after_game = query.get('aftergame')
+        if after_game is not None:
+            ids = [str(g.get('id')) for g in games]
+            start = ids.index(after_game) + 1 if after_game in ids else len(games)
+        page = games[start:start + page_size]
+        paging = {'totalGames': len(games)}
+        if page and start + page_size < len(games):
+            next_query = dict(query, aftergame=page[-1].get('id'))
+            paging['nextPage'] = f'{path}?{urlencode(next_query)}'
+        return json.dumps({'games': page, 'paging': paging}).encode()
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded 365scores responses on a local port.')
+    parser.add_argument('recordings_dir')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8365)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=None)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--max-in-flight', type=int, default=None)
+    parser.add_argument('--retry-after', type=int, default=None)
+    args = parser.parse_args()
+    server = StandInServer(
+        args.recordings_dir, host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+        page_size=args.page_size, throttle_rate=args.throttle_rate, max_in_flight=args.max_in_flight,
+        retry_after=args.retry_after
+    )
+    print(f'Serving {args.recordings_dir} on {server.base_url}')
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
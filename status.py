@@ -0,0 +1,31 @@
+STATUS_MAP = {
+    'finished': ['FT', 'Ended', 'AET', 'Pen'],
+    'upcoming': ['NS', 'Not Started', 'Postp', 'Scheduled'],
+    'live': ['1H', '2H', 'HT', 'LIVE', 'ET']
+}
+
+# 365scores statusGroup values
+STATUS_GROUPS = {
+    2: 'upcoming',
+    3: 'live',
+    4: 'finished'
+}
+
+_STATUS_BY_TEXT = {text: name for name, texts in STATUS_MAP.items() for text in texts}
+
+
+def classify_status(short_status_text=None, status_group=None):
+    """Returns 'finished', 'live', 'upcoming' or None from shortStatusText and/or statusGroup."""
+    if short_status_text in _STATUS_BY_TEXT:
+        return _STATUS_BY_TEXT[short_status_text]
+    try:
+        return STATUS_GROUPS.get(int(status_group))
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_game_status(game):
+    """classify_status() for a raw game dict (as found in /web/game/ or /web/games/results/)."""
+    if not isinstance(game, dict):
+        return None
+    return classify_status(game.get('shortStatusText'), game.get('statusGroup'))
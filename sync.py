@@ -0,0 +1,250 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+
+try:
+    from .endpoints import API_BASE
+    from .fastjson import loads, response_json
+    from .status import classify_game_status
+except ImportError:
+    from endpoints import API_BASE
+    from fastjson import loads, response_json
+    from status import classify_game_status
+
+
+# Fields of a results-page game record that a /web/game/ refresh brings up to date
+REFRESHED_FIELDS = ('statusGroup', 'statusText', 'shortStatusText', 'gameTime', 'gameTimeDisplay', 'startTime')
+REFRESHED_COMPETITOR_FIELDS = ('score', 'isWinner')
+
+
+def _refreshed_record(record: dict, game: dict) -> dict:
+    """
+    `record` (a results-page game) with its status, time and score fields taken from the
+    /web/game/ payload `game`. Only fields the record already has are copied, besides the
+    ones status classification needs, so an unchanged game gives back an equal record.
+    """
+    refreshed = dict(record)
+    for field in REFRESHED_FIELDS:
+        if field in game and (field in record or field in ('statusGroup', 'shortStatusText')):
+            refreshed[field] = game[field]
+    for side in ('homeCompetitor', 'awayCompetitor'):
+        if isinstance(record.get(side), dict) and isinstance(game.get(side), dict):
+            competitor = dict(record[side])
+            for field in REFRESHED_COMPETITOR_FIELDS:
+                if field in game[side] and (field in competitor or field == 'score'):
+                    competitor[field] = game[side][field]
+            refreshed[side] = competitor
+    return refreshed
+
+
+class SyncState:
+    """
+    Persisted state of SeasonSync in a SQLite file: per competition, the URL of the last
+    results page read (its aftergame cursor is where the next run resumes) and every known
+    game as its raw results-page dict, with its status.
+
+    Args:
+        path: SQLite file to use (created if missing).
+    """
+
+    def __init__(self, path: str = '365scores_sync.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS checkpoints ('
+            ' competition_id TEXT PRIMARY KEY, page_url TEXT NOT NULL, updated_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS games ('
+            ' competition_id TEXT NOT NULL, game_id TEXT NOT NULL, status TEXT, record TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL, PRIMARY KEY (competition_id, game_id))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS games_status ON games(competition_id, status)')
+
+    def checkpoint(self, competition_id):
+        """URL of the last results page read for the competition, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT page_url FROM checkpoints WHERE competition_id = ?', (str(competition_id),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_page(self, competition_id, page_url: str, games: list) -> tuple:
+        """
+        Stores the games of one page and moves the checkpoint to `page_url` in one transaction.
+        Returns (new games, changed games).
+        """
+        return self._store(competition_id, games, page_url)
+
+    def save_games(self, competition_id, games: list) -> tuple:
+        """Stores refreshed games without touching the checkpoint. Returns (new games, changed games)."""
+        return self._store(competition_id, games, None)
+
+    def _store(self, competition_id, games: list, page_url: str = None) -> tuple:
+        key = str(competition_id)
+        now = time.time()
+        new, changed = [], []
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                for game in games:
+                    game_id = str(game.get('id'))
+                    record = json.dumps(game, sort_keys=True, separators=(',', ':'))
+                    row = self._conn.execute(
+                        'SELECT record FROM games WHERE competition_id = ? AND game_id = ?', (key, game_id)
+                    ).fetchone()
+                    if row is not None and row[0] == record:
+                        continue
+                    (changed if row is not None else new).append(game)
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO games (competition_id, game_id, status, record, updated_at)'
+                        ' VALUES (?, ?, ?, ?, ?)',
+                        (key, game_id, classify_game_status(game), record, now)
+                    )
+                if page_url is not None:
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO checkpoints (competition_id, page_url, updated_at) VALUES (?, ?, ?)',
+                        (key, page_url, now)
+                    )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return new, changed
+
+    def open_games(self, competition_id) -> list:
+        """Stored records (raw dicts) of the known games whose status can still change (anything not finished)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record FROM games WHERE competition_id = ? AND (status IS NULL OR status != 'finished')",
+                (str(competition_id),)
+            ).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def games(self, competition_id) -> list:
+        """Every known game of the competition as its raw dict."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT record FROM games WHERE competition_id = ?', (str(competition_id),)
+            ).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def reset(self, competition_id):
+        key = str(competition_id)
+        with self._lock:
+            self._conn.execute('DELETE FROM checkpoints WHERE competition_id = ?', (key,))
+            self._conn.execute('DELETE FROM games WHERE competition_id = ?', (key,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SeasonSync:
+    """
+    Incremental refresh of a competition's results.
+
+    The first run follows paging.nextPage from the first page like get_full_competition_results;
+    every page is stored in `state` together with the checkpoint. Later runs re-read only
+    the checkpointed (last) page and whatever pages follow it, then refetch /web/game/ for
+    the known games that weren't finished yet. The cost of a run depends on the number of
+    new and still-open games, not on the length of the history.
+
+    Args:
+        client: ThreeSixFiveScores used for every request.
+        state: SyncState, or a path for one.
+        page_size: Games per results page.
+        max_pages: Upper bound for pages read in one run.
+        max_workers: Concurrent /web/game/ refreshes of open games.
+    """
+
+    def __init__(self, client, state='365scores_sync.sqlite', page_size: int = 50, max_pages: int = 1000,
+                 max_workers: int = 4):
+        self.client = client
+        self.state = state if isinstance(state, SyncState) else SyncState(state)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+
+    def _read_pages(self, competition_id) -> tuple:
+        """Reads pages from the checkpoint onwards. Returns (new, changed, pages read, ids seen)."""
+        url = self.state.checkpoint(competition_id) or self.client._competition_results_url(competition_id)
+        new, changed, seen_ids, seen_urls = [], [], set(), set()
+        pages = 0
+        while url and pages < self.max_pages and url not in seen_urls:
+            seen_urls.add(url)
+            try:
+                data = self.client._fetch_results_page(url, self.page_size)
+            except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
+                print(f"خطأ أثناء جلب البيانات من الرابط: {e}")
+                break
+            pages += 1
+            games = [g for g in data.get('games') or [] if g.get('id') is not None]
+            if not games:
+                break
+            page_new, page_changed = self.state.save_page(competition_id, url, games)
+            new += page_new
+            changed += page_changed
+            seen_ids.update(str(g['id']) for g in games)
+            next_page = (data.get('paging') or {}).get('nextPage')
+            url = f'{API_BASE}{next_page}' if next_page else None
+        return new, changed, pages, seen_ids
+
+    def _fetch_game(self, game_id, competition_id):
+        # Straight to the transport: the client's response caches would hand back the stale payload
+        url = self.client._match_data_url(game_id, competition_id=competition_id)
+        try:
+            return response_json(self.client.transport.get(url, headers=self.client.headers)).get('game')
+        except (requests.exceptions.RequestException, json.JSONDecodeError):
+            return None
+
+    def _refresh_open_games(self, competition_id, skip: set) -> tuple:
+        records = [record for record in self.state.open_games(competition_id) if str(record.get('id')) not in skip]
+        if not records:
+            return [], 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            games = list(executor.map(lambda record: self._fetch_game(record['id'], competition_id), records))
+        # The /web/game/ payload has many more fields than a results record; storing it as is
+        # would make every refreshed game look changed, so only its status and scores are kept
+        games = [_refreshed_record(record, game) for record, game in zip(records, games) if game]
+        _, changed = self.state.save_games(competition_id, games)
+        return changed, len(records)
+
+    def sync(self, competition_id) -> dict:
+        """
+        Brings the stored state of `competition_id` up to date.
+
+        Returns:
+            {'games': DataFrame of new and changed games (_process_game_records columns),
+             'new': int, 'changed': int, 'pages': int, 'refreshed': int}
+        """
+        new, changed, pages, seen_ids = self._read_pages(competition_id)
+        refreshed_changed, refreshed = self._refresh_open_games(competition_id, seen_ids)
+        changed += refreshed_changed
+        return {
+            'games': self.client._process_game_records(new + changed),
+            'new': len(new),
+            'changed': len(changed),
+            'pages': pages,
+            'refreshed': refreshed
+        }
+
+    def load(self, competition_id) -> pd.DataFrame:
+        """Every stored game of the competition, without any request, sorted like get_full_competition_results."""
+        df = self.client._process_game_records(self.state.games(competition_id))
+        if df.empty:
+            return df
+        if 'datetime_obj' in df.columns and not df['datetime_obj'].isnull().all():
+            return df.sort_values('datetime_obj', ascending=True).reset_index(drop=True)
+        return df.sort_values('game_id', ascending=True).reset_index(drop=True)
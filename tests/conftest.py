@@ -0,0 +1,117 @@
+"""
+The modules of this repository are the LanusStats package and import each other
+relatively, so the tests import them under that name through a temporary directory
+holding a LanusStats link to the repository root. The root itself is deliberately not
+put on sys.path (dataclasses.py would shadow the standard library); the link directory
+is, so worker processes started with spawn or forkserver import the package too.
+
+    pytest -q tests
+
+functions.py, exceptions.py and config.py belong to the full LanusStats tree; when they
+are missing here, minimal stand-ins are written next to the link (LanusStats is a
+namespace package, so both directories make it up) so threesixfivescores imports.
+"""
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAND_INS = {
+    'functions': "def get_possible_leagues_for_page(league, none, page):\n    return {league: {'id': 72}}\n",
+    'exceptions': "class MatchDoesntHaveInfo(Exception):\n    pass\n",
+    'config': "headers = {'user-agent': 'LanusStats-tests'}\n",
+}
+
+
+def _register_package():
+    if 'LanusStats' in sys.modules:
+        return
+    links = tempfile.mkdtemp(prefix='lanusstats-tests-')
+    atexit.register(shutil.rmtree, links, True)
+    os.symlink(ROOT, os.path.join(links, 'LanusStats'))
+    stand_ins = os.path.join(links, 'stand-ins', 'LanusStats')
+    os.makedirs(stand_ins)
+    for name, source in STAND_INS.items():
+        if not os.path.exists(os.path.join(ROOT, f'{name}.py')):
+            with open(os.path.join(stand_ins, f'{name}.py'), 'w') as f:
+                f.write(source)
+    sys.path[:0] = [links, os.path.dirname(stand_ins)]
+
+
+_register_package()
+
+from LanusStats.endpoints import recording_path
+from LanusStats.standin_server import StandInServer
+from LanusStats.threesixfivescores import ThreeSixFiveScores
+
+# shortStatusText, statusGroup per status
+STATUSES = {'finished': ('FT', 4), 'live': ('2H', 3), 'upcoming': ('NS', 2)}
+
+
+def make_game(game_id, status='finished', competition_id=552, home=None, away=None, day=1):
+    """A results-page game dict; /web/game/ payloads wrap the same dict as {'game': ...}."""
+    short_status_text, status_group = STATUSES[status]
+    return {
+        'id': game_id,
+        'competitionId': competition_id,
+        'statusGroup': status_group,
+        'shortStatusText': short_status_text,
+        'startTime': f'2024-01-{day:02d}T18:00:00+00:00',
+        'homeCompetitor': {'id': home or game_id * 10 + 1, 'name': f'Home {game_id}', 'score': 1 if status != 'upcoming' else -1},
+        'awayCompetitor': {'id': away or game_id * 10 + 2, 'name': f'Away {game_id}', 'score': 0 if status != 'upcoming' else -1},
+    }
+
+
+def make_stats(game):
+    home, away = game['homeCompetitor'], game['awayCompetitor']
+    return {
+        'statistics': [
+            {'id': 1, 'name': 'Shots', 'competitorId': home['id'], 'value': '7'},
+            {'id': 1, 'name': 'Shots', 'competitorId': away['id'], 'value': '3'},
+        ],
+        'competitors': [{'id': home['id'], 'name': home['name']}, {'id': away['id'], 'name': away['name']}],
+    }
+
+
+class Recordings:
+    """Writes responses where StandInServer looks for them."""
+
+    def __init__(self, root):
+        self.root = str(root)
+
+    def write(self, endpoint, query, payload):
+        path = recording_path(self.root, endpoint, query)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(payload, f)
+
+    def game(self, game, stats=True):
+        self.write('game', {'gameId': game['id']}, {'game': game})
+        if stats:
+            self.write('game/stats', {'games': game['id']}, make_stats(game))
+
+    def results(self, competition_id, games):
+        self.write('games/results', {'competitions': competition_id}, {'games': games})
+
+
+@pytest.fixture
+def recordings(tmp_path):
+    return Recordings(tmp_path / 'recordings')
+
+
+@pytest.fixture
+def server(recordings):
+    os.makedirs(recordings.root, exist_ok=True)
+    with StandInServer(recordings.root) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    return ThreeSixFiveScores(api_base=server.base_url, rate_limit=None, adaptive_concurrency=False)
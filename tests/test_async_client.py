@@ -0,0 +1,30 @@
+import asyncio
+
+from conftest import make_game
+
+from LanusStats.async_client import AsyncThreeSixFiveScores
+
+
+def _run(server, coroutine_function):
+    async def main():
+        async with AsyncThreeSixFiveScores(rate_limit=None, api_base=server.base_url) as client:
+            return await coroutine_function(client)
+    return asyncio.run(main())
+
+
+def test_helper_client_opens_nothing(server):
+    client = AsyncThreeSixFiveScores(rate_limit=None, api_base=server.base_url)
+    assert client._parser.transport is None
+    assert client._parser.session is None
+
+
+def test_status_filter_on_an_empty_page(server, recordings):
+    recordings.results(552, [])
+    result = _run(server, lambda client: client.get_competition_results(552, status_filter='finished'))
+    assert result['games'].empty
+
+
+def test_status_filter_keeps_matching_games(server, recordings):
+    recordings.results(552, [make_game(1, 'finished'), make_game(2, 'upcoming', day=2)])
+    result = _run(server, lambda client: client.get_competition_results(552, status_filter='upcoming'))
+    assert result['games']['game_id'].tolist() == [2]
@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from LanusStats import cache as cache_module
+from LanusStats.cache import ResponseCache, SingleFlightLRU
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controls the time.time() seen by the cache."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, 'time', lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize('status, ttl', [('live', 30), ('upcoming', 15 * 60), (None, 5 * 60)])
+def test_ttl_follows_game_status(response_cache, clock, status, ttl):
+    response_cache.set('game', 1, b'{"a": 1}', status=status)
+    clock[0] += ttl - 1
+    assert response_cache.get('game', 1) == b'{"a": 1}'
+    clock[0] += 2
+    assert response_cache.get('game', 1) is None
+    assert response_cache.stats['entries'] == 0
+
+
+def test_finished_games_never_expire(response_cache, clock):
+    response_cache.set('game', 1, b'{}', status='finished')
+    clock[0] += 10 * 365 * 86400
+    assert response_cache.get('game', 1) == b'{}'
+
+
+def test_ttl_does_not_depend_on_other_entries_of_the_game(response_cache, clock):
+    # A stats entry stored without a status gets the default TTL, whatever was stored for /web/game/
+    response_cache.set('game', 1, b'{}', status='finished')
+    response_cache.set('stats', 1, b'{}')
+    clock[0] += 5 * 60 + 1
+    assert response_cache.get('stats', 1) is None
+    assert response_cache.get('game', 1) == b'{}'
+
+
+def test_entries_are_keyed_on_the_request(response_cache):
+    response_cache.set('game', 1, b'"competition 1"', status='finished', request='https://x/web/game/?gameId=1&competitions=1')
+    response_cache.set('game', 1, b'"competition 2"', status='finished', request='https://x/web/game/?gameId=1&competitions=2')
+    assert response_cache.get('game', 1, 'https://x/web/game/?gameId=1&competitions=1') == b'"competition 1"'
+    assert response_cache.get('game', 1, 'https://x/web/game/?gameId=1&competitions=2') == b'"competition 2"'
+    assert response_cache.get('game', 1, 'https://x/web/game/?gameId=1') is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / 'small.sqlite'), max_bytes=700, compress_level=0)
+    for game_id in range(3):
+        cache.set('game', game_id, bytes(200), status='finished')
+        clock[0] += 1
+    clock[0] += 1
+    cache.get('game', 0)
+    cache.set('game', 3, bytes(200), status='finished')
+    assert cache.get('game', 0) is not None
+    assert cache.get('game', 1) is None
+    assert cache.stats['evictions'] >= 1
+    assert cache.stats['bytes'] <= 700
+    cache.close()
+
+
+def test_old_schema_is_replaced(tmp_path):
+    path = str(tmp_path / 'old.sqlite')
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE responses (endpoint TEXT NOT NULL, game_id TEXT NOT NULL, body BLOB NOT NULL,'
+        ' size INTEGER NOT NULL, status TEXT, expires_at REAL, last_access REAL NOT NULL, PRIMARY KEY (endpoint, game_id))'
+    )
+    conn.commit()
+    conn.close()
+    cache = ResponseCache(path)
+    cache.set('game', 1, b'{}', status='finished', request='u')
+    assert cache.get('game', 1, 'u') == b'{}'
+    cache.close()
+
+
+def test_memo_coalesces_concurrent_loads():
+    memo = SingleFlightLRU(maxsize=4)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(1)
+        return {'game': 1}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(memo.get_or_load('k', loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{'game': 1}] * 5
+    assert memo.stats['coalesced'] == 4
+    assert memo.get_or_load('k', lambda: pytest.fail('served from the memo')) == {'game': 1}
+
+
+def test_memo_keeps_only_cacheable_values():
+    memo = SingleFlightLRU(maxsize=4)
+    finished = lambda value: value['status'] == 'finished'
+    assert memo.get_or_load('live', lambda: {'status': 'live'}, cacheable=finished) == {'status': 'live'}
+    assert memo.get_or_load('live', lambda: {'status': 'live', 'n': 2}, cacheable=finished)['n'] == 2
+    memo.get_or_load('done', lambda: {'status': 'finished'}, cacheable=finished)
+    assert memo.stats['entries'] == 1
+
+
+def test_memo_skips_falsy_values_and_refresh_reloads():
+    memo = SingleFlightLRU(maxsize=2)
+    assert memo.get_or_load('k', dict) == {}
+    assert memo.stats['entries'] == 0
+    memo.get_or_load('k', lambda: {'v': 1})
+    assert memo.get_or_load('k', lambda: {'v': 2}, refresh=True) == {'v': 2}
+    assert memo.get_or_load('k', lambda: {'v': 3}) == {'v': 2}
+    # A refresh whose result may not be kept drops the old entry too
+    memo.get_or_load('k', lambda: {'v': 4}, cacheable=lambda value: False, refresh=True)
+    assert memo.get_or_load('k', lambda: {'v': 5}) == {'v': 5}
+
+
+def test_memo_evicts_least_recently_used():
+    memo = SingleFlightLRU(maxsize=2)
+    for key in 'abc':
+        memo.get_or_load(key, lambda: {'key': key})
+    assert memo.stats['entries'] == 2
+    assert memo.get_or_load('a', lambda: {'reloaded': True}) == {'reloaded': True}
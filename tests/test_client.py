@@ -0,0 +1,275 @@
+import time
+import warnings
+
+import pandas as pd
+import pytest
+
+from conftest import make_game
+
+from LanusStats import threesixfivescores
+from LanusStats.cache import ResponseCache
+
+
+@pytest.fixture
+def cached_client(client, tmp_path):
+    client.cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    yield client
+    client.cache.close()
+
+
+def test_finished_games_are_memoized(client, server, recordings):
+    recordings.game(make_game(1, 'finished'))
+    for _ in range(3):
+        assert client.get_match_data_by_id(1)['game']['id'] == 1
+    assert server.requests['game'] == 1
+
+
+def test_live_games_are_not_memoized(client, server, recordings):
+    recordings.game(make_game(2, 'live'))
+    client.get_match_data_by_id(2)
+    recordings.game(dict(make_game(2, 'live'), gameTime=80))
+    assert client.get_match_data_by_id(2)['game']['gameTime'] == 80
+    assert server.requests['game'] == 2
+
+
+def test_fresh_bypasses_memo_and_cache(cached_client, server, recordings):
+    recordings.game(make_game(3, 'finished'))
+    cached_client.get_match_data_by_id(3)
+    cached_client.get_match_data_by_id(3)
+    assert server.requests['game'] == 1
+    cached_client.get_match_data_by_id(3, fresh=True)
+    assert server.requests['game'] == 2
+
+
+def test_cache_keeps_requests_for_other_competitions_apart(cached_client, server, recordings):
+    recordings.game(make_game(4, 'finished'))
+    cached_client._game_memo.maxsize = 0
+    cached_client.get_match_data_by_id(4, competition_id=1)
+    cached_client.get_match_data_by_id(4, competition_id=2)
+    cached_client.get_match_data_by_id(4, competition_id=1)
+    assert server.requests['game'] == 2
+
+
+def _stats_entry(client, game_id):
+    return client.cache._conn.execute(
+        "SELECT status, expires_at FROM responses WHERE endpoint = 'stats' AND game_id = ?", (str(game_id),)
+    ).fetchone()
+
+
+@pytest.mark.parametrize('status, expires', [('finished', False), ('live', True)])
+def test_stats_ttl_comes_from_the_game_payload_already_held(cached_client, server, recordings, status, expires):
+    # Finished games are found in the memo, live ones in the cache
+    recordings.game(make_game(5, status))
+    cached_client.get_match_data_by_id(5)
+    assert not cached_client.get_match_general_stats_by_id(5).empty
+    status_, expires_at = _stats_entry(cached_client, 5)
+    assert status_ == status
+    assert (expires_at is not None) == expires
+    assert server.requests['game'] == 1
+
+
+def test_stats_of_an_unseen_game_cost_one_request(cached_client, server, recordings):
+    recordings.game(make_game(6))
+    recordings.game(make_game(7))
+    assert not cached_client.get_match_general_stats_by_id(6).empty
+    assert not cached_client.get_match_general_stats_by_id(7, status='finished').empty
+    assert server.requests == {'game/stats': 2}
+    # Unknown status: the default TTL; a status from the caller: kept for good
+    assert _stats_entry(cached_client, 6)[0] is None and _stats_entry(cached_client, 6)[1] is not None
+    assert _stats_entry(cached_client, 7) == ('finished', None)
+
+
+def test_stats_many_batches_attributable_games_and_reads_the_cache(cached_client, server, recordings):
+    games = [make_game(game_id) for game_id in (11, 12, 13)]
+    for game in games:
+        recordings.game(game)
+    competitors = {g['id']: (g['homeCompetitor']['id'], g['awayCompetitor']['id']) for g in games[:2]}
+    df = cached_client.get_match_general_stats_many([11, 12, 13], competitors=competitors)
+    assert sorted(df['game_id'].unique()) == [11, 12, 13]
+    assert df.groupby('game_id').size().tolist() == [2, 2, 2]
+    # One batch for the two attributable games, one single request for the third
+    assert server.requests['game/stats'] == 2
+
+    df = cached_client.get_match_general_stats_many([11, 12, 13], competitors=competitors)
+    assert len(df) == 6
+    assert server.requests['game/stats'] == 2
+
+
+def test_stats_many_without_competitors_costs_one_request_per_game(client, server, recordings):
+    for game_id in (21, 22, 23):
+        recordings.game(make_game(game_id))
+    df = client.get_match_general_stats_many([21, 22, 23], batch_size=3)
+    assert sorted(df['game_id'].unique()) == [21, 22, 23]
+    assert server.requests['game/stats'] == 3
+
+
+def test_season_stats_cache_batches_with_the_known_statuses(cached_client, server, recordings):
+    games = [make_game(game_id) for game_id in range(31, 37)]
+    for game in games:
+        recordings.game(game)
+    stats = cached_client.get_competition_season_stats(552, games=games, batch_size=3)
+    assert sorted(stats['game_id'].unique()) == list(range(31, 37))
+    assert server.requests == {'game/stats': 2}
+    # The combined responses carry no games list; the statuses come from the results records
+    rows = cached_client.cache._conn.execute("SELECT status, expires_at FROM responses WHERE endpoint = 'stats'").fetchall()
+    assert rows == [('finished', None)] * 2
+
+
+def test_season_stats_from_a_results_frame_send_no_game_requests(cached_client, server, recordings):
+    games = [make_game(game_id) for game_id in range(41, 45)] + [make_game(45, 'upcoming')]
+    for game in games:
+        recordings.game(game)
+    results = cached_client._process_game_records(games)
+    stats = cached_client.get_competition_season_stats(552, games=results)
+    assert sorted(stats['game_id'].unique()) == [41, 42, 43, 44]
+    assert server.requests == {'game/stats': 4}
+    assert {row[0] for row in cached_client.cache._conn.execute("SELECT status FROM responses")} == {'finished'}
+
+
+def test_status_filter_stops_the_crawl_early(client, server, recordings):
+    games = [make_game(100 + i, 'finished', day=1 + i % 28) for i in range(30)]
+    games += [dict(make_game(200 + i, 'upcoming'), startTime=f'2024-03-{1 + i % 28:02d}T18:00:00+00:00') for i in range(30)]
+    recordings.results(552, games)
+    result = client.get_competition_results_fast(552, status_filter='finished', page_size=10)
+    assert result['total_games'] == 30
+    assert set(result['games']['status']) == {'FT'}
+    # Three pages of finished games, then the first all-upcoming page ends the crawl
+    assert server.requests['games/results'] == 4
+
+
+def test_competition_results_fast_deprecates_max_workers(client, recordings):
+    recordings.results(552, [make_game(1)])
+    with pytest.warns(DeprecationWarning):
+        client.get_competition_results_fast(552, max_workers=4)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        client.get_competition_results_fast(552)
+
+
+def _season(count, first_day='2015-08-01', every_days=2):
+    start = pd.Timestamp(first_day, tz='UTC')
+    return [dict(make_game(game_id), startTime=(start + pd.Timedelta(days=every_days * game_id)).isoformat())
+            for game_id in range(1, count + 1)]
+
+
+def test_sharded_results_match_the_full_crawl(client, recordings):
+    recordings.results(552, _season(120))
+    full = client.get_full_competition_results(552, page_size=25)
+    sharded = client.get_competition_results_sharded(552, '2015-08-01', '2016-04-01', window_days=30, max_workers=4, page_size=10)
+    assert len(full) == 120
+    assert sharded['game_id'].tolist() == full['game_id'].tolist()
+    pd.testing.assert_frame_equal(sharded, full)
+
+
+def test_sharded_results_reject_a_server_that_ignores_the_window(client, server, recordings, monkeypatch):
+    recordings.results(552, _season(60))
+    serve = server._results_page
+    monkeypatch.setattr(server, '_results_page', lambda path, query: serve(
+        path, {key: value for key, value in query.items() if key not in ('startDate', 'endDate')}))
+    with pytest.raises(ValueError):
+        client.get_competition_results_sharded(552, '2015-08-01', '2016-01-01', window_days=30)
+
+
+@pytest.mark.parametrize('max_pages', [1000, 2])
+def test_prefetched_results_match_the_serial_crawl(client, server, recordings, max_pages):
+    recordings.results(552, [make_game(game_id, day=1 + game_id % 28) for game_id in range(1, 36)])
+    serial = client.get_full_competition_results(552, page_size=10, max_pages=max_pages)
+    requests_serial = server.requests['games/results']
+    server.requests.clear()
+    prefetched = client.get_full_competition_results(552, page_size=10, max_pages=max_pages, prefetch=True)
+    pd.testing.assert_frame_equal(prefetched, serial)
+    # No page past the end or past max_pages is requested ahead
+    assert server.requests['games/results'] == requests_serial
+
+
+def test_prefetch_requests_the_next_page_while_the_current_one_is_handled(client, server, recordings):
+    recordings.results(552, [make_game(game_id) for game_id in range(1, 21)])
+    pages = client.iter_competition_games(552, page_size=10, as_dataframe=False, prefetch=True)
+    assert [g['id'] for g in next(pages)] == list(range(1, 11))
+    deadline = time.monotonic() + 5
+    while server.requests['games/results'] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert server.requests['games/results'] == 2
+    assert [g['id'] for g in next(pages)] == list(range(11, 21))
+    assert list(pages) == []
+
+
+def _top_players(*categories):
+    return {'stats': [{'name': name, 'rows': [{'player': f'{name} {rank}', 'value': 10 - rank} for rank in range(3)]}
+                      for name in categories]}
+
+
+def test_top_players_of_many_leagues_in_one_frame(client, server, recordings, monkeypatch):
+    league_ids = {'Liga A': 72, 'Liga B': 73}
+    monkeypatch.setattr(threesixfivescores, 'get_possible_leagues_for_page',
+                        lambda league, none, page: {league: {'id': league_ids[league]}} if league in league_ids else {})
+    recordings.write('stats', {'competitions': 72}, _top_players('Goals', 'Assists'))
+    recordings.write('stats', {'competitions': 73}, _top_players('Goals'))
+    df = client.get_leagues_top_players_stats(['Liga A', 'Unknown', 'Liga B'], max_workers=3)
+    assert df.columns[0] == 'league'
+    assert df.groupby(['league', 'stat_category'], sort=False).size().to_dict() == {
+        ('Liga A', 'Goals'): 3, ('Liga A', 'Assists'): 3, ('Liga B', 'Goals'): 3}
+    assert server.requests['stats'] == 2
+    single = client.get_league_top_players_stats('Liga A')
+    pd.testing.assert_frame_equal(df[df['league'] == 'Liga A'].drop(columns='league'), single)
+    assert client.get_leagues_top_players_stats(['Unknown']).empty
+
+
+def test_season_stats_long_table_from_a_crawl(client, server, recordings):
+    games = [make_game(game_id, day=game_id) for game_id in (51, 52)] + [make_game(53, 'upcoming', day=28)]
+    recordings.results(552, games)
+    for game in games:
+        home, away = game['homeCompetitor'], game['awayCompetitor']
+        recordings.write('game/stats', {'games': game['id']}, {
+            'statistics': [
+                {'id': 10, 'name': 'Possession', 'categoryName': 'General', 'competitorId': home['id'], 'value': '55%'},
+                {'id': 10, 'name': 'Possession', 'categoryName': 'General', 'competitorId': away['id'], 'value': '45%'},
+                {'id': 11, 'name': 'Passes', 'categoryName': 'Passing', 'competitorId': home['id'], 'value': '3/10 (30%)'},
+                {'id': 12, 'name': 'Distance', 'categoryName': 'General', 'competitorId': away['id'], 'value': '1,234'},
+                {'id': 13, 'name': 'Rating', 'categoryName': 'General', 'competitorId': away['id'], 'value': '-'},
+            ],
+            'competitors': [{'id': home['id'], 'name': home['name']}, {'id': away['id'], 'name': away['name']}],
+        })
+    stats = client.get_competition_season_stats(552, page_size=10)
+    assert stats.columns.tolist() == ['game_id', 'competitorId', 'team_name', 'stat_id', 'stat_name', 'category', 'value', 'value_raw']
+    assert stats['game_id'].unique().tolist() == [51, 52]
+    game = stats[stats['game_id'] == 51]
+    assert game['team_name'].tolist() == ['Home 51', 'Away 51', 'Home 51', 'Away 51', 'Away 51']
+    assert game['category'].tolist() == ['General', 'General', 'Passing', 'General', 'General']
+    assert game['value'].tolist()[:4] == [55.0, 45.0, 3.0, 1234.0]
+    assert pd.isna(game['value'].iloc[4]) and game['value_raw'].iloc[4] == '-'
+    assert stats['value'].dtype == 'float64'
+    # Both finished games share no team, so they go out in one batch
+    assert server.requests['game/stats'] == 1
+    assert sorted(client.get_competition_season_stats(552, finished_only=False, page_size=10)['game_id'].unique()) == [51, 52, 53]
+
+
+def test_game_records_have_compact_dtypes(client):
+    games = [
+        dict(make_game(1), seasonNum=2024, roundName='Fecha 1', sportId=1, startTime='2024-01-01T18:00:00-03:00'),
+        dict(make_game(2, 'upcoming'), roundName='Fecha 1', startTime='not a date'),
+        {'id': 3, 'homeCompetitor': {'name': 'Home 3'}, 'awayCompetitor': None},
+    ]
+    df = client._process_game_records(games)
+    assert df.columns.tolist() == ['game_id', 'season', 'round', 'status', 'home_team', 'home_score', 'away_team',
+                                   'away_score', 'competition_id', 'sport_id', 'datetime_obj']
+    for column in ('game_id', 'season', 'home_score', 'away_score', 'competition_id', 'sport_id'):
+        assert df[column].dtype == 'Int32'
+    for column in ('round', 'status', 'home_team', 'away_team'):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert df['game_id'].tolist() == [1, 2, 3]
+    assert df['season'].isna().tolist() == [False, True, True]
+    # Missing scores are 0; the upcoming game's -1 is kept as sent
+    assert df['home_score'].tolist() == [1, -1, 0] and df['away_score'].tolist() == [0, -1, 0]
+    assert df['datetime_obj'].iloc[0] == pd.Timestamp('2024-01-01T21:00:00Z')
+    assert df['datetime_obj'].iloc[1:].isna().all()
+
+    dated = client._process_game_records(games, string_dates=True)
+    assert dated['start_time_raw'].tolist()[:2] == ['2024-01-01T18:00:00-03:00', 'not a date']
+    assert dated['start_date'].tolist()[0] == '2024-01-01' and dated['start_time'].tolist()[0] == '18:00'
+    assert dated['start_date'].iloc[1:].isna().all()
+
+    both = client._restore_game_dtypes(pd.concat([df, client._process_game_records([make_game(4)])], ignore_index=True))
+    for column in client.GAME_CATEGORY_COLUMNS:
+        assert isinstance(both[column].dtype, pd.CategoricalDtype)
+    assert client._process_game_records([]).empty
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from conftest import make_game
+
+from LanusStats.cache import ResponseCache
+from LanusStats.endpoints import recording_path
+from LanusStats.pipeline import FetchParsePipeline
+
+
+def _in_thread(function, timeout=20):
+    """Runs `function` in a thread and fails the test if it doesn't return within `timeout`."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault('value', function()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'pipeline hung'
+    return result.get('value')
+
+
+@pytest.fixture
+def games(recordings):
+    games = [make_game(game_id) for game_id in range(1, 41)]
+    for game in games:
+        recordings.game(game, stats=False)
+    return games
+
+
+def test_collect_parses_every_game_and_fills_the_cache(client, server, games, tmp_path):
+    client.cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    ids = [game['id'] for game in games[:10]] + [999]
+    results = FetchParsePipeline(client, 'game', parse_workers=2).collect(ids)
+    assert sorted(results) == ids[:10]
+    assert results[1]['matchId'] == 1
+    assert server.requests['game'] == 11
+
+    pipe = FetchParsePipeline(client, 'game', parse_workers=2)
+    assert sorted(pipe.collect(ids[:10])) == ids[:10]
+    assert server.requests['game'] == 11
+    client.cache.close()
+
+
+def test_closing_the_generator_early_does_not_hang(client, games):
+    pipe = FetchParsePipeline(client, 'game', fetch_workers=4, parse_workers=2, queue_size=2, max_pending=2)
+
+    def consume():
+        for item, result in pipe.run([game['id'] for game in games]):
+            return item
+
+    assert _in_thread(consume) is not None
+
+
+def test_unexpected_parse_errors_are_reported(client, recordings, games):
+    # Parse workers run in fresh processes, so the failure has to travel in the body
+    with open(recording_path(recordings.root, 'game', {'gameId': 3}), 'w') as f:
+        f.write('not json')
+    pipe = FetchParsePipeline(client, 'game', parse_workers=2, queue_size=2)
+    results = _in_thread(lambda: dict(pipe.run(range(1, 6))))
+    assert {item: result and result['matchId'] for item, result in results.items()} == {1: 1, 2: 2, 3: None, 4: 4, 5: 5}
+    assert pipe.parse_errors == 1
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from LanusStats.ratelimit import AdaptiveConcurrencyLimiter, HostRateLimiter, SharedRateLimiter, TokenBucket
+
+
+def test_token_bucket_serves_burst_then_paces():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # The next callers queue behind each other, one token interval apart
+    waits = [bucket.reserve() for _ in range(3)]
+    assert waits[0] == pytest.approx(0.1, abs=0.02)
+    assert waits[1] == pytest.approx(0.2, abs=0.02)
+    assert waits[2] == pytest.approx(0.3, abs=0.02)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_threads_stay_under_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 20 acquisitions, the first free: at least 19 intervals of 20 ms
+    assert time.monotonic() - started >= 19 / 50 * 0.9
+
+
+def test_host_rate_limiter_buckets_per_host():
+    limiter = HostRateLimiter(rate=1, burst=1, per_host={'img.example': (None, 1)})
+    assert limiter.reserve('https://a.example/x') == 0.0
+    assert limiter.reserve('https://a.example/y') > 0.5
+    # Another host has its own budget, and a rate of None disables limiting
+    assert limiter.reserve('https://b.example/x') == 0.0
+    assert all(limiter.reserve('https://img.example/p.png') == 0.0 for _ in range(10))
+
+
+def test_shared_rate_limiter_budget_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'budget.sqlite')
+    first = SharedRateLimiter(path, rate=1, burst=2)
+    second = SharedRateLimiter(path, rate=1, burst=2)
+    assert first.reserve('https://a.example/') == 0.0
+    assert second.reserve('https://a.example/') == 0.0
+    assert first.reserve('https://a.example/') > 0.5
+    assert second.reserve('https://other.example/') == 0.0
+
+
+def test_adaptive_concurrency_limiter_aimd():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, min_limit=1, max_limit=8, cooldown=60)
+    for _ in range(8):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 5
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+    # Inside the cooldown a second throttle doesn't shrink the window again
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+    assert limiter.stats['throttle_events'] == 2
+    # Failures that aren't throttles leave it alone
+    limiter.acquire()
+    limiter.release(success=False)
+    assert limiter.limit == 2
+
+
+def test_adaptive_concurrency_limiter_blocks_at_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.1)
+    limiter.release()
+    assert acquired.wait(1)
+    limiter.release()
+    thread.join()
@@ -0,0 +1,54 @@
+from conftest import make_game
+
+from LanusStats.scheduler import CrawlScheduler
+
+
+def test_games_are_fetched_by_priority(client, server, recordings):
+    games = [make_game(1, 'finished', day=1), make_game(2, 'upcoming', day=3), make_game(3, 'live', day=2)]
+    recordings.results(552, games)
+    for game in games:
+        recordings.game(game, stats=False)
+    order = []
+    scheduler = CrawlScheduler(client, [552], max_workers=1, live_refresh=None,
+                               on_result=lambda game_id, competition_id, data: order.append(game_id))
+    stats = scheduler.run()
+    assert order == [3, 2, 1]
+    assert stats['fetched'] == {'live': 1, 'upcoming': 1, 'finished': 1, None: 0}
+
+
+def test_live_refresh_reaches_the_server(client, server, recordings):
+    game = make_game(4, 'live')
+    recordings.results(552, [game])
+    recordings.game(game, stats=False)
+    scheduler = CrawlScheduler(client, [552], max_workers=2, live_refresh=0.05)
+    stats = scheduler.run(duration=0.6)
+    # Every refresh is a request, not a hit on the client's memo
+    assert stats['fetched']['live'] >= 3
+    assert server.requests['game'] == stats['fetched']['live']
+
+
+def test_worker_survives_failures(client, server, recordings):
+    games = [make_game(game_id, 'finished', day=game_id) for game_id in range(1, 6)]
+    recordings.results(552, games)
+    for game in games:
+        recordings.game(game, stats=False)
+    seen = []
+
+    def on_result(game_id, competition_id, data):
+        if game_id == 2:
+            raise RuntimeError('callback failed')
+        seen.append(game_id)
+
+    scheduler = CrawlScheduler(client, [552], max_workers=1, live_refresh=None, on_result=on_result)
+    original = client.get_match_data_by_id
+
+    def flaky(game_id, *args, **kwargs):
+        if game_id == 4:
+            raise ValueError('fetch failed')
+        return original(game_id, *args, **kwargs)
+
+    client.get_match_data_by_id = flaky
+    stats = scheduler.run()
+    assert sorted(seen) == [1, 3, 5]
+    assert stats['errors'] == 2
+    assert stats['in_flight'] == 0
@@ -0,0 +1,118 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from conftest import make_game
+
+from LanusStats import sharding
+from LanusStats.cache import ResponseCache
+from LanusStats.sharding import FetchedSet, ShardedCrawler
+from LanusStats.threesixfivescores import ThreeSixFiveScores
+
+
+def _claim_all(path, keys):
+    fetched = FetchedSet(path)
+    return [key for key in keys if fetched.claim(key)]
+
+
+def test_claim_is_won_once(tmp_path):
+    fetched = FetchedSet(str(tmp_path / 'fetched.sqlite'))
+    assert fetched.claim(1, 'a')
+    assert not fetched.claim(1, 'b')
+    assert 1 not in fetched
+    fetched.done(1)
+    assert 1 in fetched and '1' in fetched
+    assert len(fetched) == 1
+    assert not fetched.claim(1, 'c')
+
+
+def test_release_lets_another_worker_retry(tmp_path):
+    fetched = FetchedSet(str(tmp_path / 'fetched.sqlite'))
+    assert fetched.claim(2)
+    fetched.release(2)
+    assert fetched.claim(2)
+    # Done games are never released
+    fetched.done(2)
+    fetched.release(2)
+    assert 2 in fetched
+
+
+def test_abandoned_claims_can_be_taken_over(tmp_path, monkeypatch):
+    fetched = FetchedSet(str(tmp_path / 'fetched.sqlite'), claim_timeout=60)
+    now = [1_000_000.0]
+    monkeypatch.setattr(sharding.time, 'time', lambda: now[0])
+    assert fetched.claim(3, 'dead worker')
+    now[0] += 30
+    assert not fetched.claim(3, 'b')
+    now[0] += 31
+    assert fetched.claim(3, 'b')
+
+
+def test_concurrent_claims_across_threads(tmp_path):
+    fetched = FetchedSet(str(tmp_path / 'fetched.sqlite'))
+    won = []
+    lock = threading.Lock()
+
+    def worker():
+        mine = [key for key in range(50) if fetched.claim(key)]
+        with lock:
+            won.extend(mine)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(won) == list(range(50))
+
+
+def test_concurrent_claims_across_processes(tmp_path):
+    path = str(tmp_path / 'fetched.sqlite')
+    # Opened (and closed) before forking, as ShardedCrawler does
+    fetched = FetchedSet(path)
+    fetched.close()
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(_claim_all, [path] * 3, [range(40)] * 3))
+    won = [key for keys in results for key in keys]
+    assert sorted(won) == list(range(40))
+    assert not fetched.claim(0)
+
+
+def test_sharded_crawler_fetches_every_game_once(server, recordings, tmp_path):
+    games = [make_game(game_id) for game_id in range(1, 21)]
+    for game in games:
+        recordings.game(game, stats=False)
+    crawler = ShardedCrawler(game_ids=[game['id'] for game in games] + [99], processes=3, threads=2, rate=None,
+                             state_dir=str(tmp_path / 'crawl'), api_base=server.base_url)
+    result = crawler.run()
+    assert (result['fetched'], result['skipped'], result['failed']) == (20, 0, 1)
+    assert len(crawler.fetched) == 20
+    assert server.requests['game'] == 21
+
+    # A second run finds every game already fetched; only the missing one is retried
+    result = crawler.run()
+    assert (result['fetched'], result['skipped'], result['failed']) == (0, 20, 1)
+    assert server.requests['game'] == 22
+
+
+def test_unfinished_games_are_fetched_again_and_read_back(server, recordings, tmp_path):
+    games = [make_game(1, 'finished'), make_game(2, 'live'), make_game(3, 'upcoming')]
+    for game in games:
+        recordings.game(game)
+    crawler = ShardedCrawler(game_ids=[1, 2, 3], processes=2, threads=2, rate=None, competition_id=552,
+                             include_stats=True, state_dir=str(tmp_path / 'crawl'), api_base=server.base_url)
+    result = crawler.run()
+    assert (result['fetched'], result['unfinished']) == (3, 2)
+    assert 1 in crawler.fetched and 2 not in crawler.fetched and 3 not in crawler.fetched
+    # Fetched again (here from the cache, while their TTL lasts); the finished one is skipped
+    result = crawler.run()
+    assert (result['fetched'], result['skipped'], result['unfinished']) == (2, 1, 2)
+    assert server.requests['game'] == 3
+
+    # Read back with the competition id the crawler requested them with
+    server.requests.clear()
+    reader = ThreeSixFiveScores(cache=ResponseCache(str(tmp_path / 'crawl' / 'cache.sqlite')), api_base=server.base_url,
+                                rate_limit=None, adaptive_concurrency=False)
+    assert [reader.get_match_data_by_id(game_id, 552)['game']['id'] for game_id in (1, 2, 3)] == [1, 2, 3]
+    assert not reader.get_match_general_stats_by_id(1, 552).empty
+    assert not server.requests
+    reader.cache.close()
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from LanusStats.benchmarks import _rowwise_process_shotmap_dataframe, synthetic_game_payload
+from LanusStats.threesixfivescores import ThreeSixFiveScores
+
+
+@pytest.fixture(scope='module')
+def client():
+    return ThreeSixFiveScores(rate_limit=None, adaptive_concurrency=False)
+
+
+@pytest.mark.parametrize('shots', [1, 30, 1000])
+def test_matches_rowwise_implementation(client, shots):
+    game = synthetic_game_payload(seed=shots, members_per_team=30, stats_per_member=1, shots=shots, recent_matches=0)['game']
+    chart = game['chartEvents']
+    pd.testing.assert_frame_equal(
+        client._process_shotmap_dataframe(chart, game),
+        _rowwise_process_shotmap_dataframe(client, chart, game)
+    )
+
+
+def test_matches_rowwise_implementation_on_irregular_events(client):
+    chart = {
+        'events': [
+            {'playerId': 1, 'type': 1, 'status': 2, 'xg': '0.3', 'xgot': '-', 'outcome': {'id': 1, 'name': 'Goal', 'x': 1.0}},
+            {'playerId': 2, 'type': 9, 'xg': None, 'xgot': '0.5', 'outcome': None},
+            {'playerId': 3, 'type': 1, 'status': 2, 'xg': 'n/a', 'outcome': 'blocked'},
+        ],
+        'eventTypes': [{'value': 1, 'name': 'Shot'}],
+        'statuses': [{'id': 2, 'name': 'On target'}],
+        'eventSubTypes': [],
+    }
+    game = {'homeCompetitor': {'lineups': {'members': [{'id': 1, 'name': 'A', 'jerseyNumber': 9}]}}, 'members': [{'id': 2, 'name': 'B'}]}
+    for g in (game, None):
+        pd.testing.assert_frame_equal(
+            client._process_shotmap_dataframe(chart, g),
+            _rowwise_process_shotmap_dataframe(client, chart, g)
+        )
+
+
+def test_without_outcome_or_xgot(client):
+    chart = {'events': [{'playerId': 1, 'type': 1, 'xg': 0.1}]}
+    df = client._process_shotmap_dataframe(chart)
+    pd.testing.assert_frame_equal(df, _rowwise_process_shotmap_dataframe(client, chart))
+    assert df['xgot'].tolist() == [0.0]
+    assert df['shot_outcome'].isna().all()
+
+
+def test_no_events(client):
+    assert client._process_shotmap_dataframe({'events': []}).empty
+
+
+def _recorded_game(recordings, game_id, shots, home_score=1, away_score=0, player_prefix='Player'):
+    game = synthetic_game_payload(seed=game_id, members_per_team=5, stats_per_member=1, shots=shots, recent_matches=0)['game']
+    game['id'] = game_id
+    game['homeCompetitor']['score'], game['awayCompetitor']['score'] = home_score, away_score
+    for member in game['members']:
+        member['name'] = f"{player_prefix} {member['id']}"
+    recordings.write('game', {'gameId': game_id}, {'game': game})
+
+
+def test_season_shotmap_matches_the_per_game_shotmaps(server, recordings):
+    season_client = ThreeSixFiveScores(api_base=server.base_url, rate_limit=None, adaptive_concurrency=False)
+    _recorded_game(recordings, 1, 12)
+    _recorded_game(recordings, 2, 7, player_prefix='Jugador')
+    _recorded_game(recordings, 3, 5, home_score=0)
+    _recorded_game(recordings, 4, 9)
+    season = season_client.get_season_shotmap([1, 2, 3, 4], max_workers=4)
+    assert server.requests['game'] == 4
+    per_game = []
+    for game_id in (1, 2, 4):
+        df = season_client.get_shotmap_enriched(game_id)
+        df.insert(0, 'game_id', game_id)
+        per_game.append(df)
+    # The 0-0 game has no enriched shotmap; player names come from each game's own lineup
+    pd.testing.assert_frame_equal(season, pd.concat(per_game, ignore_index=True))
+    assert season.loc[season['game_id'] == 2, 'playerName'].str.startswith('Jugador').all()
+    assert season_client.get_season_shotmap([]).empty
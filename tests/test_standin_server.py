@@ -0,0 +1,33 @@
+import requests
+
+from conftest import make_game
+
+
+def _page(server, **params):
+    return requests.get(f'{server.base_url}/web/games/results/', params=dict(competitions=552, **params)).json()
+
+
+def test_results_are_paged_forward_from_the_first_game(server, recordings):
+    recordings.results(552, [make_game(game_id, day=game_id) for game_id in range(1, 11)])
+    page = _page(server, games=4)
+    assert [game['id'] for game in page['games']] == [1, 2, 3, 4]
+    assert page['paging']['nextPage'].endswith('aftergame=4')
+    assert [game['id'] for game in _page(server, games=4, aftergame=8)['games']] == [9, 10]
+
+
+def test_direction_minus_one_walks_back_in_time(client, server, recordings):
+    recordings.results(552, [make_game(game_id, day=game_id) for game_id in range(1, 11)])
+    assert [game['id'] for game in _page(server, games=4, direction=-1)['games']] == [10, 9, 8, 7]
+    server.requests.clear()
+    result = client.get_competition_results(552, direction=-1, page_size=4, fetch_all=True)
+    assert result['games']['game_id'].tolist() == list(range(10, 0, -1))
+    assert server.requests['games/results'] == 3
+
+
+def test_date_window_restricts_the_games(server, recordings):
+    recordings.results(552, [make_game(game_id, day=game_id) for game_id in range(1, 11)])
+    page = _page(server, games=2, startDate='03/01/2024', endDate='06/01/2024')
+    assert [game['id'] for game in page['games']] == [3, 4]
+    assert page['paging']['totalGames'] == 4
+    assert [game['id'] for game in _page(server, games=20, startDate='03/01/2024', endDate='06/01/2024', aftergame=4)['games']] == [5, 6]
+    assert _page(server, startDate='01/02/2024', endDate='28/02/2024')['games'] == []
@@ -0,0 +1,71 @@
+import pytest
+
+from conftest import make_game
+
+from LanusStats.sync import SeasonSync, SyncState
+
+
+@pytest.fixture
+def season(client, server, recordings, tmp_path):
+    # Games 1-12, one a day; game 3 was postponed, 11 and 12 haven't been played yet
+    games = [make_game(game_id, 'upcoming' if game_id in (3, 11, 12) else 'finished', day=game_id) for game_id in range(1, 13)]
+    recordings.results(552, games)
+    recordings.game(dict(games[2], venue={'name': 'Stadium'}, events=[]), stats=False)
+    sync = SeasonSync(client, str(tmp_path / 'sync.sqlite'), page_size=5)
+    yield sync, games
+    sync.state.close()
+
+
+def _counts(result):
+    return {key: value for key, value in result.items() if key != 'games'}
+
+
+def test_first_run_reads_every_page(season, server):
+    sync, _ = season
+    assert _counts(sync.sync(552)) == {'new': 12, 'changed': 0, 'pages': 3, 'refreshed': 0}
+    assert len(sync.load(552)) == 12
+    assert sync.state.checkpoint(552).endswith('aftergame=10')
+
+
+def test_later_runs_resume_from_the_checkpoint(season, server, recordings):
+    sync, games = season
+    sync.sync(552)
+    server.requests.clear()
+    # Nothing changed upstream: only the checkpointed page is read, and the refreshed
+    # postponed game (whose /web/game/ payload has extra fields) isn't reported as changed
+    assert _counts(sync.sync(552)) == {'new': 0, 'changed': 0, 'pages': 1, 'refreshed': 1}
+    assert server.requests == {'games/results': 1, 'game': 1}
+
+    recordings.results(552, games + [make_game(13, 'upcoming', day=13)])
+    server._results_cache.clear()
+    result = sync.sync(552)
+    assert _counts(result) == {'new': 1, 'changed': 0, 'pages': 1, 'refreshed': 1}
+    assert result['games']['game_id'].tolist() == [13]
+
+
+def test_refresh_picks_up_status_and_score_changes(season, recordings):
+    sync, games = season
+    sync.sync(552)
+    played = make_game(3, 'finished', day=3)
+    played['homeCompetitor']['score'] = 4
+    recordings.game(dict(played, venue={'name': 'Stadium'}, events=[{'id': 1}]), stats=False)
+    result = sync.sync(552)
+    assert _counts(result) == {'new': 0, 'changed': 1, 'pages': 1, 'refreshed': 1}
+    record = next(game for game in sync.state.games(552) if game['id'] == 3)
+    assert record['shortStatusText'] == 'FT'
+    assert record['homeCompetitor']['score'] == 4
+    assert 'venue' not in record and 'events' not in record
+    # Finished now, so no longer refreshed
+    assert sync.sync(552)['refreshed'] == 0
+
+
+def test_state_reset(tmp_path):
+    state = SyncState(str(tmp_path / 'state.sqlite'))
+    new, changed = state.save_page(1, 'https://x/page', [make_game(1, 'upcoming')])
+    assert len(new) == 1 and changed == []
+    assert state.save_page(1, 'https://x/page', [make_game(1, 'upcoming')]) == ([], [])
+    assert [game['id'] for game in state.open_games(1)] == [1]
+    state.reset(1)
+    assert state.checkpoint(1) is None
+    assert state.games(1) == []
+    state.close()
@@ -0,0 +1,23 @@
+import pytest
+import requests
+from urllib3.util.retry import Retry
+
+from LanusStats.metrics import ClientMetrics
+from LanusStats.ratelimit import AdaptiveConcurrencyLimiter
+from LanusStats.transport import Transport
+
+
+@pytest.mark.parametrize('status, throttled', [(503, True), (429, True), (500, False), (502, False)])
+def test_only_throttle_statuses_shrink_the_window(server, monkeypatch, status, throttled):
+    monkeypatch.setattr(server, '_respond', lambda path: (status, b'{}', {}))
+    limiter = AdaptiveConcurrencyLimiter(initial=4, min_limit=1, max_limit=8)
+    metrics = ClientMetrics()
+    transport = Transport(
+        max_retries=Retry(total=2, backoff_factor=0, status_forcelist=[429, 500, 502, 503, 504]),
+        concurrency_limiter=limiter, api_base=server.base_url, metrics=metrics
+    )
+    with pytest.raises(requests.exceptions.RetryError):
+        transport.get('https://webws.365scores.com/web/game/?gameId=1')
+    assert limiter.limit == (2 if throttled else 4)
+    assert metrics.to_dict()['game']['throttles'] == (1 if throttled else 0)
+    transport.close()
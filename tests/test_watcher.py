@@ -0,0 +1,55 @@
+from conftest import make_game
+
+from LanusStats.watcher import LiveWatcher
+
+
+def _ops(changes):
+    return [(change['kind'], change['op'], change['key']) for change in changes]
+
+
+def test_diff_reports_added_changed_removed():
+    changes = LiveWatcher._diff('1', 'statistic', {'a': 1, 'b': 2}, {'a': 1, 'b': 3, 'c': 4})
+    assert _ops(changes) == [('statistic', 'changed', 'b'), ('statistic', 'added', 'c')]
+    assert changes[0]['previous'] == 2
+    changes = LiveWatcher._diff('1', 'statistic', {'a': 1}, {})
+    assert _ops(changes) == [('statistic', 'removed', 'a')]
+
+
+def test_diff_of_none_values():
+    # An unchanged None is not news; None -> value is a change, not an addition
+    assert LiveWatcher._diff('1', 'statistic', {'a': None}, {'a': None}) == []
+    changes = LiveWatcher._diff('1', 'statistic', {'a': None}, {'a': 5})
+    assert _ops(changes) == [('statistic', 'changed', 'a')]
+    assert changes[0]['previous'] is None
+    assert _ops(LiveWatcher._diff('1', 'statistic', None, {'a': None})) == [('statistic', 'added', 'a')]
+
+
+def test_poll_reports_only_changes(client, server, recordings):
+    game = dict(make_game(7, 'live'), events=[{'id': 1, 'gameTime': 10}])
+    recordings.game(game)
+    watcher = LiveWatcher(client, [7], min_interval=0, max_interval=0)
+    first = watcher.poll()
+    assert ('event', 'added', 1) in _ops(first)
+    assert ('status', 'added', 'status') in _ops(first)
+
+    # Byte-identical bodies are skipped without a diff
+    assert watcher.poll() == []
+    assert watcher.unchanged == 2
+
+    game['events'].append({'id': 2, 'gameTime': 30})
+    game['homeCompetitor']['score'] = 2
+    recordings.game(game, stats=False)
+    changes = watcher.poll()
+    assert ('event', 'added', 2) in _ops(changes)
+    assert ('status', 'changed', 'status') in _ops(changes)
+    assert not any(change['kind'] == 'event' and change['key'] == 1 for change in changes)
+
+
+def test_finished_games_stop_being_watched(client, recordings):
+    recordings.game(make_game(8, 'live'))
+    watcher = LiveWatcher(client, [8], include_stats=False, min_interval=0, max_interval=0)
+    watcher.poll()
+    recordings.game(make_game(8, 'finished'), stats=False)
+    changes = watcher.poll()
+    assert changes[-1]['value']['status'] == 'finished'
+    assert watcher.games == {}
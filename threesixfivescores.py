@@ -6,16 +6,31 @@ import re
 from io import BytesIO
 import time
 import numpy as np
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import concurrent.futures
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urljoin, urlencode
 from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 import logging
+import warnings
 from tqdm import tqdm
 
 
 
+try:
+    from .cache import ResponseCache, SingleFlightLRU
+    from .fastjson import loads, response_json
+    from .metrics import ClientMetrics
+    from .ratelimit import AdaptiveConcurrencyLimiter, HostRateLimiter
+    from .status import STATUS_MAP, classify_game_status, classify_status
+    from .transport import Transport
+except ImportError:
+    from cache import ResponseCache, SingleFlightLRU
+    from fastjson import loads, response_json
+    from metrics import ClientMetrics
+    from ratelimit import AdaptiveConcurrencyLimiter, HostRateLimiter
+    from status import STATUS_MAP, classify_game_status, classify_status
+    from transport import Transport
+
 try:
     from .functions import get_possible_leagues_for_page
     from .exceptions import MatchDoesntHaveInfo
@@ -39,31 +54,106 @@ except ImportError:
             if data is not None:
                 results.append(data)
 
-    
+
+# Sent with every API request on top of config.headers
+API_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.365scores.com/',
+    'Origin': 'https://www.365scores.com'
+}
+
+
 class ThreeSixFiveScores:
-    def __init__(self):
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
+    def __init__(
+        self,
+        rate_limit: float = 3.0,
+        burst: int = 5,
+        rate_limiter: HostRateLimiter = None,
+        adaptive_concurrency: bool = True,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        pool_size: int = 32,
+        keep_alive: bool = True,
+        timeout: float = 10,
+        transport: Transport = None,
+        cache: ResponseCache = None,
+        memo_size: int = 128,
+        api_base: str = None,
+        metrics: ClientMetrics = None
+    ):
+        """
+        Args:
+            rate_limit: Max requests per second per host (None disables limiting).
+            burst: Requests allowed back-to-back before callers start waiting.
+            rate_limiter: HostRateLimiter shared with other clients; overrides rate_limit/burst.
+            adaptive_concurrency: Bound requests in flight with an AIMD window (up to pool_size)
+                that halves on 429/503, so worker pools back off together.
+            concurrency_limiter: AdaptiveConcurrencyLimiter shared with other clients.
+            pool_size: Connections kept alive per host; match it to the number of worker threads.
+            keep_alive: Reuse connections between requests.
+            timeout: Default request timeout in seconds.
+            transport: Pre-built Transport shared with other clients; overrides the options above.
+            cache: ResponseCache for /web/game/ and /web/game/stats/ payloads (None disables caching).
+            memo_size: Parsed /web/game/ payloads of finished games kept in memory and shared between
+                the match_url helpers; concurrent requests for the same game are coalesced (0 disables
+                the memo). Live and upcoming games are always fetched again.
+            api_base: Send API requests to this base URL instead of https://webws.365scores.com
+                (e.g. a local standin_server.StandInServer).
+            metrics: ClientMetrics to record into (shared with other clients); a new one by default.
+                Read it with client.metrics.to_dict() or client.metrics.write_prometheus(path).
+        """
         self.headers = headers
-        self.headers.update({
-            'Accept': 'application/json',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': 'https://www.365scores.com/',
-            'Origin': 'https://www.365scores.com'
-        })
+        self.metrics = metrics or getattr(transport, 'metrics', None) or ClientMetrics()
+        if transport is None:
+            transport = Transport(
+                headers=self.headers,
+                pool_maxsize=pool_size,
+                keep_alive=keep_alive,
+                timeout=timeout,
+                rate_limiter=rate_limiter or HostRateLimiter(rate=rate_limit, burst=burst),
+                concurrency_limiter=concurrency_limiter or (
+                    AdaptiveConcurrencyLimiter(initial=min(8, pool_size), max_limit=pool_size)
+                    if adaptive_concurrency else None
+                ),
+                api_base=api_base,
+                metrics=self.metrics
+            )
+        else:
+            if not getattr(transport, 'headers', True):
+                # A transport built outside (e.g. RecordingTransport) sends the client's headers by default
+                transport.headers = self.headers
+            transport.metrics = self.metrics
+        self.transport = transport
+        self.rate_limiter = transport.rate_limiter
+        self.concurrency_limiter = transport.concurrency_limiter
+        self.session = transport.session
+        self.cache = cache
+        self._game_memo = SingleFlightLRU(maxsize=memo_size)
+        self.headers.update(API_HEADERS)
+
+    @classmethod
+    def offline(cls):
+        """
+        A client for the URL builders and parsers only, e.g. inside the async client or a
+        parse worker: no session, transport, limiters, cache or memo are created, so there
+        is nothing to close. Methods that send requests can't be used on it.
+        """
+        client = cls.__new__(cls)
+        client.headers = {**headers, **API_HEADERS}
+        client.metrics = ClientMetrics()
+        client.transport = None
+        client.rate_limiter = None
+        client.concurrency_limiter = None
+        client.session = None
+        client.cache = None
+        client._game_memo = SingleFlightLRU(maxsize=0)
+        return client
 
     ##############################
     # Shared/utility/private methods
     ##############################
 
-    def _fetch_match_data(self, game_id, competition_id=None, matchup_id=None):
+    def _match_data_url(self, game_id, competition_id=None, matchup_id=None):
         api_url = (
             f'https://webws.365scores.com/web/game/?appTypeId=5&langId=1'
             f'&timezoneName=America/Buenos_Aires&userCountryId=382&gameId={game_id}'
@@ -73,11 +163,114 @@ class ThreeSixFiveScores:
         if matchup_id:
             api_url += f'&matchupId={matchup_id}'
         api_url += '&topBookmaker=14'
+        return api_url
+
+    def _stats_url(self, game_id, competition_id=None):
+        url = (
+            f"https://webws.365scores.com/web/game/stats/?"
+            f"appTypeId=5&langId=1&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}"
+        )
+        if competition_id:
+            url += f"&competitions={competition_id}"
+        return url
+
+    def _competition_results_params(self, competition_id, after_game=None, direction=1, page_size=20):
+        params = {
+            'appTypeId': 5,
+            'langId': 1,
+            'timezoneName': 'Asia/Hebron',
+            'userCountryId': 115,
+            'competitions': competition_id,
+            'showOdds': 'false',
+            'games': page_size,
+            'direction': direction
+        }
+        if after_game:
+            params['aftergame'] = after_game
+        return params
+
+    def _cached_response(self, url, body):
+        # Wraps a cached body so callers that expect a Response (e.g. get_requests_stats) keep working.
+        response = requests.Response()
+        response._content = body
+        response.status_code = 200
+        response.url = url
+        return response
+
+    def _fetch_cached(self, endpoint, game_id, url, status_of=None, fresh=False) -> requests.Response:
+        """
+        GET `url`, served from self.cache when a fresh copy of (endpoint, game_id, url) exists.
+        `status_of(data)` gives the game status used to pick the TTL of a new entry; `fresh`
+        skips the lookup (the new response is still stored).
+        """
+        if self.cache is not None and not fresh:
+            body = self.cache.get(endpoint, game_id, url)
+            if body is not None:
+                self.metrics.cache_hit(endpoint, 'disk')
+                return self._cached_response(url, body)
+        response = self.transport.get(url)
+        if self.cache is not None:
+            status = None
+            if status_of is not None:
+                try:
+                    status = status_of(response_json(response))
+                except json.JSONDecodeError:
+                    return response
+            self.cache.set(endpoint, game_id, response.content, status=status, request=url)
+        return response
+
+    def _stats_status_of(self, game_id, competition_id=None, status=None, matchup_id=None):
+        """
+        status_of for a /web/game/stats/ response: the status of the game's entry in the
+        payload's 'games' list, otherwise `status` (known to the caller, e.g. from a results
+        page), otherwise what the memo or the cache already hold for the game. Never sends
+        a request; an unknown status stores the entry with the default TTL.
+        """
+        def _status(data):
+            for game in data.get('games') or []:
+                if isinstance(game, dict) and str(game.get('id')) == str(game_id):
+                    return classify_game_status(game)
+            return status or self._known_game_status(game_id, competition_id, matchup_id)
+        return _status
+
+    def _known_game_status(self, game_id, competition_id=None, matchup_id=None):
+        """Status of the /web/game/ payload held in the memo or the cache, or None; sends no request."""
+        # get_match_data_by_id asks for competitions="any id" unless given one
+        for competition in dict.fromkeys((competition_id, "any id")):
+            data = self._game_memo.peek((str(game_id), matchup_id, competition))
+            if data is None and self.cache is not None:
+                body = self.cache.get('game', game_id, self._match_data_url(game_id, competition, matchup_id))
+                try:
+                    data = loads(body) if body is not None else None
+                except json.JSONDecodeError:
+                    data = None
+            if data:
+                return classify_game_status(data.get('game'))
+        return None
+
+    def _fetch_match_data(self, game_id, competition_id=None, matchup_id=None, fresh=False):
+        key = (str(game_id), matchup_id, competition_id)
+        loaded = []
+
+        def _load():
+            loaded.append(True)
+            return self._load_match_data(game_id, competition_id=competition_id, matchup_id=matchup_id, fresh=fresh)
+
+        # Only finished games are memoized: live and upcoming payloads go stale within seconds
+        data = self._game_memo.get_or_load(
+            key, _load, cacheable=lambda data: classify_game_status(data.get('game')) == 'finished', refresh=fresh
+        )
+        if not loaded:
+            self.metrics.cache_hit('game', 'memory')
+        return data
+
+    def _load_match_data(self, game_id, competition_id=None, matchup_id=None, fresh=False):
+        api_url = self._match_data_url(game_id, competition_id=competition_id, matchup_id=matchup_id)
         try:
-            response = requests.get(api_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            time.sleep(3)
-            return response.json()
+            response = self._fetch_cached(
+                'game', game_id, api_url, status_of=lambda data: classify_game_status(data.get('game')), fresh=fresh
+            )
+            return response_json(response)
         except requests.RequestException:
             return {}
         except json.JSONDecodeError:
@@ -126,41 +319,108 @@ class ThreeSixFiveScores:
         events = chart.get('events', [])
         if not events:
             return pd.DataFrame()
-        df = pd.DataFrame(events)
-        event_types = {e["value"]: e["name"] for e in chart.get("eventTypes", [])}
-        statuses = {s["id"]: s["name"] for s in chart.get("statuses", [])}
-        subtypes = {s["value"]: s["name"] for s in chart.get("eventSubTypes", [])}
-        if "type" in df.columns:
-            df["eventTypeName"] = df["type"].map(event_types)
-        if "status" in df.columns:
-            df["statusName"] = df["status"].map(statuses)
-        if "subType" in df.columns:
-            df["subTypeName"] = df["subType"].map(subtypes)
-        if 'xgot' in df.columns:
-            df['xgot'] = df['xgot'].apply(lambda x: str(x).replace('-', '0') if pd.notnull(x) and isinstance(x, str) else ('0' if pd.notnull(x) else '0'))
-        else:
-            df['xgot'] = '0'
-        if 'xg' not in df.columns:
-            df['xg'] = 0.0
-        else:
-            df['xg'] = pd.to_numeric(df['xg'], errors='coerce').fillna(0.0)
-        df['xgot'] = pd.to_numeric(df['xgot'], errors='coerce').fillna(0.0)
-        if 'outcome' in df.columns:
-            outcols = ['y', 'z', 'id', 'name', 'x']
-            for col in outcols:
-                df[f'outcome_{col}'] = df['outcome'].apply(lambda o: o.get(col) if isinstance(o, dict) else None)
-            df = df.rename(columns={'outcome_name': 'shot_outcome'})
-            df = df.drop(columns=['outcome'])
+        return self._shot_events_frame([(None, events)], {None: chart}, {None: game} if game is not None else None)
+
+    # outcome field -> column, in the order the columns are added
+    SHOT_OUTCOME_COLUMNS = [('y', 'outcome_y'), ('z', 'outcome_z'), ('id', 'outcome_id'), ('name', 'shot_outcome'), ('x', 'outcome_x')]
+
+    def _shot_events_frame(self, events: list, charts: dict, games: dict = None, key: str = None):
+        """
+        Shotmap enrichment built column by column from the raw events: eventTypeName/
+        statusName/subTypeName from each game's chart lookups, numeric xg/xgot, flattened
+        outcome_* columns and playerName/jerseyNumber from the lineups. Every column is one
+        map(dict.get) over the raw events or outcome dicts, int-only and float-only columns
+        become numpy arrays directly and the DataFrame is built once at the end, so there is
+        no intermediate frame and no per-row pandas call. Same columns and dtypes as the
+        row-wise version (pd.DataFrame(events) plus Series.map/apply per column).
+
+        Args:
+            events: [(game key, chartEvents.events)], in output order.
+            charts: {game key: chartEvents dict}.
+            games: {game key: game dict} for the player joins (None skips them).
+            key: Name of a leading column holding each event's game key (None: no such column).
+        """
+        rows = [event for _, game_events in events for event in game_events]
+        if not rows:
+            return pd.DataFrame()
+        # Event keys in first-seen order, as pd.DataFrame(rows) would lay them out
+        names = dict.fromkeys(chain.from_iterable(rows))
+
+        def _array(values):
+            # Lists holding only ints or only floats go through numpy, several times faster
+            # than pandas' object inference; anything else is left for pandas to infer
+            kinds = set(map(type, values))
+            if kinds == {float}:
+                return np.array(values, dtype=np.float64)
+            if kinds == {int}:
+                try:
+                    return np.array(values, dtype=np.int64)
+                except OverflowError:
+                    return values
+            return values
+
+        def _per_game(values, tables, default=np.nan):
+            # tables: {game key: {id: name}}; each game's slice of `values` goes through its own table
+            out, start = [], 0
+            for game_key, game_events in events:
+                table = tables.get(game_key) or {}
+                end = start + len(game_events)
+                out += map(table.get, values[start:end], repeat(default))
+                start = end
+            return out
+
+        def _numeric(values):
+            # pd.to_numeric(errors='coerce').fillna(0.0) on the raw values
+            numbers = pd.to_numeric(np.array(values, dtype=object), errors='coerce')
+            return np.where(np.isnan(numbers), 0.0, numbers) if numbers.dtype.kind == 'f' else numbers
+
+        columns = {}
+        if key is not None:
+            columns[key] = [game_key for game_key, game_events in events for _ in game_events]
+        for name in names:
+            if name != key:
+                columns[name] = list(map(dict.get, rows, repeat(name), repeat(np.nan)))
+
+        lookups = [
+            ('type', 'eventTypeName', 'eventTypes', 'value'),
+            ('status', 'statusName', 'statuses', 'id'),
+            ('subType', 'subTypeName', 'eventSubTypes', 'value'),
+        ]
+        for column, name_column, chart_field, id_field in lookups:
+            if column in columns:
+                tables = {
+                    game_key: {e[id_field]: e['name'] for e in chart.get(chart_field, [])}
+                    for game_key, chart in charts.items()
+                }
+                columns[name_column] = _per_game(columns[column], tables)
+        # Strings are cleaned ('-' -> '0'); anything else becomes 0, as before
+        xgot = columns.get('xgot')
+        columns['xgot'] = _numeric(
+            [value.replace('-', '0') if isinstance(value, str) else '0' for value in xgot] if xgot is not None else ['0'] * len(rows)
+        )
+        columns['xg'] = _numeric(columns['xg']) if 'xg' in columns else np.zeros(len(rows))
+        if 'outcome' in columns:
+            outcomes = columns.pop('outcome')
+            if not all(map(isinstance, outcomes, repeat(dict))):
+                outcomes = [outcome if isinstance(outcome, dict) else {} for outcome in outcomes]
+            for field, column in self.SHOT_OUTCOME_COLUMNS:
+                columns[column] = list(map(dict.get, outcomes, repeat(field)))
         else:
-            df['shot_outcome'] = None
-        if game is not None:
-            members = self._extract_members(game)
-            player_id_to_name = {m["id"]: m.get("name") for m in members if "id" in m and "name" in m}
-            player_id_to_jersey = {m["id"]: m.get("jerseyNumber") for m in members if "id" in m and "jerseyNumber" in m}
-            if "playerId" in df.columns:
-                df["playerName"] = df["playerId"].map(player_id_to_name)
-                df["jerseyNumber"] = df["playerId"].map(player_id_to_jersey)
-        return df
+            columns['shot_outcome'] = [None] * len(rows)
+        if games is not None and 'playerId' in columns:
+            names_by_game, jerseys_by_game = {}, {}
+            for game_key, game in games.items():
+                game_names = names_by_game[game_key] = {}
+                game_jerseys = jerseys_by_game[game_key] = {}
+                for m in self._extract_members(game):
+                    if 'id' in m:
+                        if 'name' in m:
+                            game_names[m['id']] = m.get('name')
+                        if 'jerseyNumber' in m:
+                            game_jerseys[m['id']] = m.get('jerseyNumber')
+            columns['playerName'] = _per_game(columns['playerId'], names_by_game)
+            columns['jerseyNumber'] = _per_game(columns['playerId'], jerseys_by_game)
+        return pd.DataFrame({name: _array(values) if isinstance(values, list) else values for name, values in columns.items()})
 
     def _safe_int(self, value) -> int:
         try:
@@ -188,7 +448,8 @@ class ThreeSixFiveScores:
         max_empty_pages: int = 5,
         delay: float = 0.5,
         user_agent: str = None,
-        use_threading: bool = False
+        use_threading: bool = False,
+        max_workers: int = 5
     ) -> pd.DataFrame:
         """
         جلب نتائج المباريات من عدة روابط مع تحسين الكفاءة والموثوقية.
@@ -200,11 +461,11 @@ class ThreeSixFiveScores:
             delay: التأخير بين طلبات الـ API بالثواني.
             user_agent: الـ User-Agent المستخدم في طلبات الـ API.
             use_threading: تفعيل استخدام الـ Threading لجلب البيانات بشكل متوازي.
+            max_workers: الحد الأعلى لعدد الـ threads؛ العدد الفعلي للطلبات المتزامنة يتكيف مع ردود 429/503.
         Returns:
             DataFrame يحتوي على جميع نتائج المباريات التي تم جلبها.
         """
-        # Use self.session & self.headers
-        session = self.session
+        # Requests go through self.transport; only the headers may be overridden here
         headers = self.headers.copy()
         if user_agent:
             headers['User-Agent'] = user_agent
@@ -216,7 +477,7 @@ class ThreeSixFiveScores:
         def _extract_games_from_response(response: requests.Response):
             try:
                 response.raise_for_status()
-                data = response.json()
+                data = response_json(response)
                 return data.get("games", [])
             except requests.exceptions.RequestException as e:
                 logging.error(f"خطأ أثناء جلب البيانات: {e}")
@@ -226,7 +487,7 @@ class ThreeSixFiveScores:
                 return []
 
         def _get_next_page_url(response, current_url, base_url, base_query_params, games, inferred_page_count):
-            data = response.json()
+            data = response_json(response)
             paging = data.get("paging", {})
             next_page_relative_url = paging.get("nextPage")
             if next_page_relative_url:
@@ -273,10 +534,9 @@ class ThreeSixFiveScores:
                     visited_game_ids.add(game_id)
             return new_games
 
-        def _fetch_page_data(url, headers, session):
+        def _fetch_page_data(url, headers):
             try:
-                response = session.get(url, headers=headers)
-                response.raise_for_status()
+                response = self.transport.get(url, headers=headers)
                 return response
             except requests.exceptions.RequestException as e:
                 logging.error(f"حدث خطأ أثناء جلب البيانات من {url}: {e}")
@@ -298,7 +558,7 @@ class ThreeSixFiveScores:
             for current_page in tqdm(range(1, max_pages + 1), desc=f"جلب الصفحات ({initial_url})"):
                 if not next_page_url:
                     break
-                response = _fetch_page_data(next_page_url, headers, session)
+                response = _fetch_page_data(next_page_url, headers)
                 if not response:
                     break
                 games = _extract_games_from_response(response)
@@ -319,7 +579,7 @@ class ThreeSixFiveScores:
             return all_games_for_url
 
         if use_threading:
-            with ThreadPoolExecutor(max_workers=5) as executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 results = executor.map(_process_url, initial_urls)
                 for result in results:
                     all_games.extend(result)
@@ -361,29 +621,53 @@ class ThreeSixFiveScores:
         return df
     
 
-    def get_league_top_players_stats(self, league):
+    def _league_stats_url(self, league_id):
+        return f'https://webws.365scores.com/web/stats/?appTypeId=5&langId=1&timezoneName=America/Buenos_Aires&userCountryId=382&competitions={league_id}'
+
+    def _league_top_players_frames(self, league) -> list:
+        """Fetches one league's /web/stats/ payload and returns one DataFrame per stat group (no concat)."""
         leagues = get_possible_leagues_for_page(league, None, '365Scores')
         if league not in leagues or 'id' not in leagues[league]:
-            return pd.DataFrame()
+            return []
         league_id = leagues[league]['id']
+        url = self._league_stats_url(league_id)
         try:
-            response = requests.get(f'https://webws.365scores.com/web/stats/?appTypeId=5&langId=1&timezoneName=America/Buenos_Aires&userCountryId=382&competitions={league_id}', headers=self.headers, timeout=10)
-            response.raise_for_status()
-            time.sleep(3)
-            stats_data = response.json()
+            response = self.transport.get(url)
+            stats_data = response_json(response)
         except requests.RequestException:
-            return pd.DataFrame()
+            return []
         except json.JSONDecodeError:
-            return pd.DataFrame()
+            return []
         if 'stats' not in stats_data or not isinstance(stats_data['stats'], list):
+            return []
+        frames = [self.parse_dataframe(stat_group_object) for stat_group_object in stats_data['stats']]
+        return [df for df in frames if not df.empty]
+
+    def get_league_top_players_stats(self, league):
+        frames = self._league_top_players_frames(league)
+        if not frames:
             return pd.DataFrame()
-        general_stats_list = stats_data['stats']
-        total_df = pd.DataFrame()
-        for stat_group_object in general_stats_list:
-            stats_df = self.parse_dataframe(stat_group_object)
-            if not stats_df.empty:
-                total_df = pd.concat([total_df, stats_df], ignore_index=True)
-        return total_df
+        return pd.concat(frames, ignore_index=True)
+
+    def get_leagues_top_players_stats(self, leagues, max_workers: int = 8) -> pd.DataFrame:
+        """
+        Top-player stats of many leagues in one long DataFrame, keyed by 'league' and 'stat_category'.
+        The /web/stats/ payloads are fetched concurrently (the client's rate limiter still applies)
+        and all stat groups are concatenated once.
+        """
+        leagues = list(leagues)
+        if not leagues:
+            return pd.DataFrame()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            league_frames = list(executor.map(self._league_top_players_frames, leagues))
+        frames = []
+        for league, league_frame_list in zip(leagues, league_frames):
+            for df in league_frame_list:
+                df.insert(0, 'league', league)
+                frames.append(df)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
 
     def get_ids(self, match_url):
         match_id1 = re.search(r'-(\d+-\d+-\d+)', match_url)
@@ -394,26 +678,26 @@ class ThreeSixFiveScores:
         id_2 = match_id2.group(1) if match_id2 else None
         return id_1, id_2
 
-    def get_match_data(self, match_url):
+    def get_match_data(self, match_url, fresh=False):
+        """`fresh=True` bypasses the in-memory memo and the response cache (e.g. for live polling)."""
         matchup_id, game_id = self.get_ids(match_url)
         if not game_id:
             return {}
-        data = self._fetch_match_data(game_id, matchup_id=matchup_id)
+        data = self._fetch_match_data(game_id, matchup_id=matchup_id, fresh=fresh)
         return data.get('game', {}) if 'game' in data else {}
 
-    def get_match_data_by_id(self, game_id, competition_id="any id"):
-        data = self._fetch_match_data(game_id, competition_id=competition_id)
+    def get_match_data_by_id(self, game_id, competition_id="any id", fresh=False):
+        """`fresh=True` bypasses the in-memory memo and the response cache (e.g. for live polling)."""
+        data = self._fetch_match_data(game_id, competition_id=competition_id, fresh=fresh)
         return data
 
     def get_requests_stats(self, match_url):
-        _, game_id = self.get_ids(match_url)
+        matchup_id, game_id = self.get_ids(match_url)
         if not game_id:
             return None
+        url = self._stats_url(game_id)
         try:
-            response = requests.get(f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=1&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}', headers=self.headers, timeout=10)
-            response.raise_for_status()
-            time.sleep(3)
-            return response
+            return self._fetch_cached('stats', game_id, url, status_of=self._stats_status_of(game_id, matchup_id=matchup_id))
         except requests.RequestException:
             return None
 
@@ -422,55 +706,37 @@ class ThreeSixFiveScores:
         if response_obj is None:
             return pd.DataFrame()
         try:
-            response_data = response_obj.json()
+            response_data = response_json(response_obj)
         except json.JSONDecodeError:
             return pd.DataFrame()
-        if 'statistics' not in response_data or not isinstance(response_data['statistics'], list) or \
-           'competitors' not in response_data or not isinstance(response_data['competitors'], list) or \
-           len(response_data['competitors']) < 2:
-            return pd.DataFrame()
-        match_stats_list = response_data['statistics']
-        if not match_stats_list:
-            return pd.DataFrame()
-        match_stats_df = pd.DataFrame(match_stats_list)
-        if match_stats_df.empty or 'competitorId' not in match_stats_df.columns:
-            return match_stats_df
-        team1_data = response_data['competitors'][0]
-        team2_data = response_data['competitors'][1]
-        team1_id = team1_data.get('id')
-        team1_name = team1_data.get('name', 'Team 1')
-        team2_id = team2_data.get('id')
-        team2_name = team2_data.get('name', 'Team 2')
-        if team1_id is not None and team2_id is not None:
-             match_stats_df['team_name'] = np.where(match_stats_df['competitorId'] == team1_id, team1_name, 
-                                               np.where(match_stats_df['competitorId'] == team2_id, team2_name, 'Unknown'))
-        else:
-             match_stats_df['team_name'] = 'Unknown' 
-        return match_stats_df
+        return self._build_general_stats_dataframe(response_data)
 
-    def get_match_general_stats_by_id(self, game_id, competition_id=None):
+    def get_match_general_stats_by_id(self, game_id, competition_id=None, status=None):
         """
         Fetches general match statistics using game_id (and competition_id if available).
 
+        Args:
+            status: The game's status if the caller knows it ('finished', 'live', 'upcoming'),
+                e.g. from a results page; picks the cache TTL of the response.
+
         Returns:
             pd.DataFrame with stats, or empty DataFrame if not found.
         """
-        # Compose the API URL for stats by game id (see your get_requests_stats logic)
-        url = (
-            f"https://webws.365scores.com/web/game/stats/?"
-            f"appTypeId=5&langId=1&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}"
-        )
-        if competition_id:
-            url += f"&competitions={competition_id}"
+        url = self._stats_url(game_id, competition_id)
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            response = self._fetch_cached(
+                'stats', game_id, url, status_of=self._stats_status_of(game_id, competition_id, status)
+            )
         except requests.RequestException:
             return pd.DataFrame()
         try:
-            response_data = response.json()
+            response_data = response_json(response)
         except json.JSONDecodeError:
             return pd.DataFrame()
+        return self._build_general_stats_dataframe(response_data)
+
+    def _build_general_stats_dataframe(self, response_data):
+        """Turns a /web/game/stats/ payload into the per-team stats DataFrame with a 'team_name' column."""
         if 'statistics' not in response_data or not isinstance(response_data['statistics'], list) or \
         'competitors' not in response_data or not isinstance(response_data['competitors'], list) or \
         len(response_data['competitors']) < 2:
@@ -496,13 +762,234 @@ class ThreeSixFiveScores:
             match_stats_df['team_name'] = 'Unknown' 
         return match_stats_df
 
+    def get_match_general_stats_many(self, game_ids, competition_id=None, batch_size: int = 20, competitors: dict = None, max_workers: int = 1, statuses: dict = None) -> pd.DataFrame:
+        """
+        Fetches general stats for many games, packing up to `batch_size` game ids into each
+        /web/game/stats/?games=... request and splitting the combined response back per game.
+
+        Games already in self.cache are read from it. Only games whose competitors are known
+        are batched, since those are the ones the combined response can be split back for;
+        the others (and games that still can't be resolved, e.g. one team twice in a batch)
+        are fetched on their own.
+
+        Args:
+            game_ids: Game ids to fetch.
+            competition_id: Optional competition id sent with every request.
+            batch_size: Max game ids per request.
+            competitors: Optional {game_id: (home_competitor_id, away_competitor_id)}, e.g. from a
+                results crawl; needed for batching, and keeps two games of the same team out of one batch.
+            max_workers: Batches (and single-game requests) requested concurrently.
+            statuses: Optional {game_id: 'finished' | 'live' | 'upcoming'}, e.g. from a results crawl;
+                picks the cache TTL of responses whose payload doesn't carry the games' statuses.
+
+        Returns:
+            pd.DataFrame with one row per stat and team and a 'game_id' column, or empty DataFrame.
+        """
+        original_ids = {str(game_id): game_id for game_id in game_ids}
+        competitors = {str(k): tuple(v) for k, v in (competitors or {}).items()}
+        statuses = {str(k): v for k, v in (statuses or {}).items()}
+        frames = []
+        pending = []
+        for game_id in original_ids:
+            body = self.cache.get('stats', game_id, self._stats_url(game_id, competition_id)) if self.cache is not None else None
+            if body is None:
+                pending.append(game_id)
+                continue
+            self.metrics.cache_hit('stats', 'disk')
+            try:
+                game_df = self._build_general_stats_dataframe(loads(body))
+            except json.JSONDecodeError:
+                pending.append(game_id)
+                continue
+            if not game_df.empty:
+                frames.append(game_df.assign(game_id=game_id))
+
+        attributable = [game_id for game_id in pending if len(competitors.get(game_id, ())) == 2]
+        unresolved = [game_id for game_id in pending if len(competitors.get(game_id, ())) != 2]
+        batches = self._pack_stats_batches(attributable, batch_size, competitors)
+        unresolved.extend(batch[0] for batch in batches if len(batch) == 1)
+        batches = [batch for batch in batches if len(batch) > 1]
+
+        def _batch_status(batch):
+            # A combined response is kept forever only when every game in it is finished
+            def _status(data):
+                batch_statuses = {str(game.get('id')): classify_game_status(game)
+                                  for game in data.get('games') or [] if isinstance(game, dict)}
+                finished = all((batch_statuses.get(game_id) or statuses.get(game_id)) == 'finished' for game_id in batch)
+                return 'finished' if finished else None
+            return _status
+
+        def _fetch_batch(batch):
+            url = self._stats_url(','.join(batch), competition_id)
+            try:
+                response_data = response_json(
+                    self._fetch_cached('stats', ','.join(batch), url, status_of=_batch_status(batch))
+                )
+            except (requests.RequestException, json.JSONDecodeError):
+                return pd.DataFrame(), list(batch)
+            return self._split_batched_stats(response_data, batch, competitors)
+
+        def _fetch_single(game_id):
+            game_df = self.get_match_general_stats_by_id(game_id, competition_id, status=statuses.get(game_id))
+            return game_df.assign(game_id=game_id) if not game_df.empty else game_df
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for batch_df, missing in executor.map(_fetch_batch, batches):
+                if not batch_df.empty:
+                    frames.append(batch_df)
+                unresolved.extend(missing)
+            frames.extend(df for df in executor.map(_fetch_single, unresolved) if not df.empty)
+        if not frames:
+            return pd.DataFrame()
+        stats_df = pd.concat(frames, ignore_index=True)
+        stats_df['game_id'] = stats_df['game_id'].map(original_ids)
+        return stats_df
+
+    def get_competition_season_stats(
+        self,
+        competition_id: int = None,
+        games=None,
+        max_workers: int = 8,
+        batch_size: int = 20,
+        finished_only: bool = True,
+        page_size: int = 100,
+        max_pages: int = 1000
+    ) -> pd.DataFrame:
+        """
+        Team stats of every game of a season as one long table.
+
+        Args:
+            competition_id: Competition to crawl when `games` isn't given; also sent with the stats requests.
+            games: The games to use instead of crawling: a results DataFrame (with 'game_id'
+                and optionally 'status'), or raw game dicts from iter_competition_games(as_dataframe=False),
+                whose competitor ids let get_match_general_stats_many batch more requests.
+            max_workers: Stats requests in flight at once.
+            batch_size: Game ids per /web/game/stats/ request.
+            finished_only: Skip games that aren't finished.
+            page_size, max_pages: Results paging used when crawling.
+
+        Returns:
+            pd.DataFrame with columns game_id, competitorId, team_name, stat_id, stat_name,
+            category, value (float, NaN when not numeric) and value_raw; empty when nothing was found.
+        """
+        if games is None:
+            games = []
+            for page in self.iter_competition_games(competition_id, page_size=page_size, max_pages=max_pages, as_dataframe=False):
+                games.extend(page)
+        competitors = {}
+        statuses = {}
+        if isinstance(games, pd.DataFrame):
+            if games.empty or 'game_id' not in games.columns:
+                return pd.DataFrame()
+            if finished_only and 'status' in games.columns:
+                games = games[games['status'].isin(STATUS_MAP['finished'])]
+            games = games[games['game_id'].notna()]
+            game_ids = games['game_id'].tolist()
+            if 'status' in games.columns:
+                statuses = dict(zip(game_ids, (classify_status(status) for status in games['status'])))
+        else:
+            if finished_only:
+                games = [g for g in games if classify_game_status(g) == 'finished']
+            game_ids = [g.get('id') for g in games if g.get('id') is not None]
+            statuses = {g['id']: classify_game_status(g) for g in games if g.get('id') is not None}
+            for g in games:
+                home_id = (g.get('homeCompetitor') or {}).get('id')
+                away_id = (g.get('awayCompetitor') or {}).get('id')
+                if g.get('id') is not None and home_id is not None and away_id is not None:
+                    competitors[g['id']] = (home_id, away_id)
+        if not game_ids:
+            return pd.DataFrame()
+        stats_df = self.get_match_general_stats_many(
+            game_ids, competition_id, batch_size=batch_size, competitors=competitors, max_workers=max_workers,
+            statuses=statuses
+        )
+        return self._season_stats_long_format(stats_df)
+
+    @staticmethod
+    def _season_stats_long_format(stats_df: pd.DataFrame) -> pd.DataFrame:
+        if stats_df.empty or 'competitorId' not in stats_df.columns:
+            return pd.DataFrame()
+
+        def _column(name, default=None):
+            return stats_df[name] if name in stats_df.columns else pd.Series(default, index=stats_df.index)
+
+        category = _column('categoryName')
+        if 'categoryId' in stats_df.columns:
+            category = category.fillna(stats_df['categoryId'])
+        value_raw = _column('value')
+        # '55%', '12', '3/10 (30%)' -> first number in the string
+        value = pd.to_numeric(
+            value_raw.astype(str).str.replace(',', '', regex=False).str.extract(r'(-?\d+(?:\.\d+)?)', expand=False),
+            errors='coerce'
+        ).astype('float64')
+        return pd.DataFrame({
+            'game_id': stats_df['game_id'],
+            'competitorId': stats_df['competitorId'],
+            'team_name': _column('team_name', 'Unknown'),
+            'stat_id': _column('id'),
+            'stat_name': _column('name'),
+            'category': category,
+            'value': value,
+            'value_raw': value_raw,
+        }).reset_index(drop=True)
+
+    @staticmethod
+    def _pack_stats_batches(game_ids: list, batch_size: int, competitors: dict) -> list:
+        # Greedy packing: a batch never holds two games that share a known competitor.
+        batches = []
+        batch_teams = []
+        for game_id in game_ids:
+            teams = set(competitors.get(game_id, ()))
+            for batch, used in zip(batches, batch_teams):
+                if len(batch) < batch_size and not (teams & used):
+                    batch.append(game_id)
+                    used.update(teams)
+                    break
+            else:
+                batches.append([game_id])
+                batch_teams.append(set(teams))
+        return batches
+
+    @staticmethod
+    def _split_batched_stats(response_data: dict, batch: list, competitors: dict):
+        """Returns (DataFrame with a str 'game_id' column, game ids that could not be resolved)."""
+        stats_list = response_data.get('statistics')
+        if not isinstance(stats_list, list) or not stats_list:
+            return pd.DataFrame(), list(batch)
+        df = pd.DataFrame(stats_list)
+        if 'competitorId' not in df.columns:
+            return pd.DataFrame(), list(batch)
+        if 'gameId' in df.columns:
+            df['game_id'] = df['gameId'].astype(str)
+        else:
+            owners = {}
+            for game in response_data.get('games') or []:
+                if not isinstance(game, dict):
+                    continue
+                for side in ('homeCompetitor', 'awayCompetitor'):
+                    competitor_id = (game.get(side) or {}).get('id')
+                    if competitor_id is not None:
+                        owners.setdefault(competitor_id, set()).add(str(game.get('id')))
+            for game_id in batch:
+                for competitor_id in competitors.get(game_id, ()):
+                    owners.setdefault(competitor_id, set()).add(game_id)
+            unique_owner = {cid: next(iter(games)) for cid, games in owners.items() if len(games) == 1}
+            ambiguous = set().union(*(games for games in owners.values() if len(games) > 1))
+            df['game_id'] = df['competitorId'].map(unique_owner)
+            df = df[~df['game_id'].isin(ambiguous)]
+        df = df[df['game_id'].isin(batch)].copy()
+        team_names = {c.get('id'): c.get('name') for c in response_data.get('competitors') or [] if isinstance(c, dict)}
+        df['team_name'] = df['competitorId'].map(team_names).fillna('Unknown')
+        resolved = set(df['game_id'])
+        return df, [game_id for game_id in batch if game_id not in resolved]
+
 
     def get_match_time_stats(self, match_url):
         response_obj = self.get_requests_stats(match_url)
         if response_obj is None:
             raise MatchDoesntHaveInfo(f"Failed to get response for time stats: {match_url}")
         try:
-            response_data = response_obj.json()
+            response_data = response_json(response_obj)
         except json.JSONDecodeError:
             raise MatchDoesntHaveInfo(f"Failed to decode JSON for time stats: {match_url}")
         if 'actualGameStatistics' not in response_data:
@@ -511,6 +998,9 @@ class ThreeSixFiveScores:
 
     def get_match_shotmap(self, match_url):
         match_data = self.get_match_data(match_url)
+        return self._match_shotmap_from_data(match_data, match_url)
+
+    def _match_shotmap_from_data(self, match_data, match_url):
         if not match_data or 'chartEvents' not in match_data or 'events' not in match_data.get('chartEvents', {}):
             raise MatchDoesntHaveInfo(f"Shotmap data (chartEvents or events) not found: {match_url}")
         # Check for positive, non-zero result
@@ -532,22 +1022,53 @@ class ThreeSixFiveScores:
 
     def get_shotmap_enriched(self, game_id, competition_id="552"):
         match_data = self.get_match_data_by_id(game_id, competition_id)
+        return self._shotmap_enriched_from_data(match_data)
+
+    def _shotmap_enriched_from_data(self, match_data):
+        if not self._has_enriched_shotmap(match_data):
+            return pd.DataFrame()
+        game = match_data['game']
+        chart = game['chartEvents']
+        return self._process_shotmap_dataframe(chart, game=game)
+
+    @staticmethod
+    def _has_enriched_shotmap(match_data) -> bool:
         if not (
             isinstance(match_data, dict)
             and 'game' in match_data
             and 'chartEvents' in match_data['game']
             and 'events' in match_data['game']['chartEvents']
         ):
-            return pd.DataFrame()
+            return False
         game = match_data['game']
         home_score = game.get('homeCompetitor', {}).get('score', 0)
         away_score = game.get('awayCompetitor', {}).get('score', 0)
         if not (isinstance(home_score, (int, float)) and isinstance(away_score, (int, float))):
+            return False
+        return not (home_score <= 0 and away_score <= 0)
+
+    def get_season_shotmap(self, game_ids, competition_id="552", max_workers: int = 8) -> pd.DataFrame:
+        """
+        Shots of many games in one DataFrame (the rows of get_shotmap_enriched plus a 'game_id'
+        column). Games are fetched concurrently and the season's chartEvents.events are turned
+        into one DataFrame by _shot_events_frame, column by column.
+        Games get_shotmap_enriched would return nothing for (no chart, 0-0) are skipped.
+        """
+        game_ids = list(game_ids)
+        if not game_ids:
             return pd.DataFrame()
-        if home_score <= 0 and away_score <= 0:
-            return pd.DataFrame()
-        chart = game['chartEvents']
-        return self._process_shotmap_dataframe(chart, game=game)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            payloads = list(executor.map(lambda game_id: self.get_match_data_by_id(game_id, competition_id), game_ids))
+        events, charts, games = [], {}, {}
+        for game_id, match_data in zip(game_ids, payloads):
+            if not self._has_enriched_shotmap(match_data):
+                continue
+            game = match_data['game']
+            chart = game['chartEvents']
+            charts[game_id] = chart
+            games[game_id] = game
+            events.append((game_id, chart.get('events', []) or []))
+        return self._shot_events_frame(events, charts, games, key='game_id')
 
     def get_players_info(self, match_url):
         match_data = self.get_match_data(match_url)
@@ -664,9 +1185,7 @@ class ThreeSixFiveScores:
         if not heatmap_url:
             raise MatchDoesntHaveInfo(f"No heatmap URL available for player '{player_name_to_find}' in match {match_url}")
         try:
-            resp = requests.get(heatmap_url, headers=self.headers, timeout=10)
-            resp.raise_for_status()
-            time.sleep(3)
+            resp = self.transport.get(heatmap_url)
             return Image.open(BytesIO(resp.content))
         except Exception as e:
             raise MatchDoesntHaveInfo(f"Failed to fetch/open heatmap for '{player_name_to_find}': {e}")
@@ -678,63 +1197,160 @@ class ThreeSixFiveScores:
         except (TypeError, ValueError):
             return 0
 
-    def _process_game_records(self, games_data_from_api: list) -> pd.DataFrame:
+    # Columns of _process_game_records stored as categoricals; pd.concat of frames with
+    # different categories falls back to object, so concatenations re-apply them.
+    GAME_CATEGORY_COLUMNS = ('round', 'status', 'home_team', 'away_team')
+
+    def _process_game_records(self, games_data_from_api: list, string_dates: bool = False) -> pd.DataFrame:
         """
-        Processes a raw list of game dictionaries from the API into a standardized DataFrame.
-        Ensures consistent column names and data types, including 'game_id'.
+        Processes a raw list of game dictionaries from the API into a standardized DataFrame,
+        column by column: game_id, season, scores and competition/sport ids as nullable Int32
+        (missing scores are 0), round/status/team names as categoricals and datetime_obj as
+        a UTC datetime parsed from the ISO 8601 startTime.
+
+        Args:
+            string_dates: Also add start_time_raw and the local kickoff start_date ('%Y-%m-%d')
+                and start_time ('%H:%M') string columns.
         """
         if not games_data_from_api:
             return pd.DataFrame()
 
-        game_records = []
-        for game in games_data_from_api:
-            home = game.get('homeCompetitor', {})
-            away = game.get('awayCompetitor', {})
-            record = {
-                'game_id': game.get('id'), # Ensure 'id' is mapped to 'game_id'
-                'season': game.get('seasonNum'),
-                'round': game.get('roundName'),
-                'status': game.get('shortStatusText'),
-                'start_time_raw': game.get('startTime'),
-                'home_team': home.get('name'),
-                'home_score': self._safe_int(home.get('score')),
-                'away_team': away.get('name'),
-                'away_score': self._safe_int(away.get('score')),
-                'competition_id': game.get('competitionId'),
-                'sport_id': game.get('sportId')
-            }
-            game_records.append(record)
-        
-        games_df = pd.DataFrame(game_records)
-
-        # Process datetime and add start_date, start_time columns
-        if 'start_time_raw' in games_df.columns and not games_df.empty:
-            games_df['datetime_obj'] = pd.to_datetime(games_df['start_time_raw'], errors='coerce')
-            if not games_df['datetime_obj'].isnull().all():
-                games_df['start_date'] = games_df['datetime_obj'].dt.strftime('%Y-%m-%d')
-                games_df['start_time'] = games_df['datetime_obj'].dt.strftime('%H:%M')
-            else:
-                games_df['start_date'] = None
-                games_df['start_time'] = None
-        else:
-            games_df['start_date'] = None
-            games_df['start_time'] = None
-            if 'datetime_obj' not in games_df.columns:
-                 games_df['datetime_obj'] = pd.NaT # Ensure datetime_obj column exists
+        games = games_data_from_api
+        home = [game.get('homeCompetitor') or {} for game in games]
+        away = [game.get('awayCompetitor') or {} for game in games]
+
+        def _int32(values, fill=None):
+            numbers = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+            if fill is not None:
+                numbers = numbers.fillna(fill)
+            return numbers.astype('Int32')
+
+        start_time_raw = pd.Series([game.get('startTime') for game in games], dtype=object)
+        games_df = pd.DataFrame({
+            'game_id': _int32([game.get('id') for game in games]),
+            'season': _int32([game.get('seasonNum') for game in games]),
+            'round': pd.Categorical([game.get('roundName') for game in games]),
+            'status': pd.Categorical([game.get('shortStatusText') for game in games]),
+            'home_team': pd.Categorical([team.get('name') for team in home]),
+            'home_score': _int32([team.get('score') for team in home], fill=0),
+            'away_team': pd.Categorical([team.get('name') for team in away]),
+            'away_score': _int32([team.get('score') for team in away], fill=0),
+            'competition_id': _int32([game.get('competitionId') for game in games]),
+            'sport_id': _int32([game.get('sportId') for game in games]),
+            'datetime_obj': pd.to_datetime(start_time_raw, format='ISO8601', utc=True, errors='coerce'),
+        })
+        if string_dates:
+            # The local date/time as written by the API, before conversion to UTC
+            raw = start_time_raw.where(games_df['datetime_obj'].notna())
+            games_df.insert(4, 'start_time_raw', start_time_raw)
+            games_df['start_date'] = raw.str.slice(0, 10)
+            games_df['start_time'] = raw.str.slice(11, 16)
+        return games_df
 
+    @classmethod
+    def _restore_game_dtypes(cls, games_df: pd.DataFrame) -> pd.DataFrame:
+        """Re-applies the categorical dtypes lost when concatenating _process_game_records frames."""
+        for column in cls.GAME_CATEGORY_COLUMNS:
+            if column in games_df.columns and not isinstance(games_df[column].dtype, pd.CategoricalDtype):
+                games_df[column] = games_df[column].astype('category')
         return games_df
 
     def _apply_status_filter(self, df: pd.DataFrame, status_filter: str) -> pd.DataFrame:
-        status_map = {
-            'finished': ['FT', 'Ended', 'AET', 'Pen'],
-            'upcoming': ['NS', 'Not Started', 'Postp', 'Scheduled'],
-            'live': ['1H', '2H', 'HT', 'LIVE', 'ET']
-        }
-        valid_statuses = status_map.get(status_filter, [])
+        valid_statuses = STATUS_MAP.get(status_filter, [])
         if valid_statuses:
             return df[df['status'].isin(valid_statuses)]
         return df
 
+    # Order in which a game passes through the statuses; results pages are ordered by kickoff,
+    # so a crawl moving forward in time only sees later phases once it has left a phase behind.
+    STATUS_PHASES = {'finished': 0, 'live': 1, 'upcoming': 2}
+
+    def _filter_games_by_status(self, games: list, status_filter: str) -> list:
+        """_apply_status_filter for raw game dicts, on shortStatusText/statusGroup, before any DataFrame is built."""
+        if status_filter not in STATUS_MAP:
+            return games
+        return [g for g in games if classify_status(g.get('shortStatusText'), g.get('statusGroup')) == status_filter]
+
+    def _results_crawl_exhausted(self, page_games: list, status_filter: str, forward_in_time) -> bool:
+        """
+        True when `page_games` has no game matching `status_filter` and all of them are past
+        its phase in the direction the crawl moves (e.g. only finished games while walking
+        back in time looking for upcoming ones), so later pages can't match either.
+        Postponed games left behind among finished ones beyond that page are not reached.
+        """
+        if status_filter not in self.STATUS_PHASES or forward_in_time is None or not page_games:
+            return False
+        target = self.STATUS_PHASES[status_filter]
+        phases = [self.STATUS_PHASES.get(classify_game_status(g)) for g in page_games]
+        if any(phase is None for phase in phases):
+            return False
+        if forward_in_time:
+            return all(phase > target for phase in phases)
+        return all(phase < target for phase in phases)
+
+    @staticmethod
+    def _kickoff(game: dict):
+        try:
+            return pd.Timestamp(game.get('startTime'))
+        except (TypeError, ValueError):
+            return None
+
+    def _fetch_competition_results_page(self, competition_id, after_game=None, direction=1, page_size=20) -> dict:
+        params = self._competition_results_params(competition_id, after_game, direction, page_size)
+        response = self._365scores_request('games/results/', params=params)
+        return response_json(response)
+
+    def _crawl_competition_results(self, competition_id, after_game=None, direction=1, page_size=20,
+                                   status_filter=None, max_pages=None, max_games=None) -> dict:
+        """
+        Follows the aftergame cursor, keeping only the raw games that match `status_filter`, and
+        stops early once the crawl has moved past the filter's phase (see _results_crawl_exhausted).
+
+        Returns:
+            {'games': [raw game dicts], 'paging': {...as in _parse_competition_results_page}, 'pages': int}
+        """
+        games = []
+        seen_tokens = set()
+        token = after_game
+        first_kickoff = None
+        forward_in_time = None
+        paging = {'next_token': None, 'prev_token': None, 'total_games': 0}
+        pages = 0
+        while not max_pages or pages < max_pages:
+            try:
+                data = self._fetch_competition_results_page(competition_id, token, direction, page_size)
+            except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
+                if not pages:
+                    raise
+                # Keep what the earlier pages returned
+                print(f"خطأ في جلب الصفحة: {e}")
+                break
+            pages += 1
+            page_games = data.get('games') or []
+            page_paging = self._results_paging(data)
+            if pages == 1:
+                paging['prev_token'] = page_paging['prev_token']
+                paging['total_games'] = page_paging['total_games']
+            paging['next_token'] = page_paging['next_token']
+            games.extend(self._filter_games_by_status(page_games, status_filter) if status_filter else page_games)
+            if max_games and len(games) >= max_games:
+                del games[max_games:]
+                break
+            if status_filter and page_games:
+                if first_kickoff is None:
+                    first_kickoff = self._kickoff(page_games[0])
+                last_kickoff = self._kickoff(page_games[-1])
+                if forward_in_time is None and first_kickoff is not None and last_kickoff is not None \
+                        and last_kickoff != first_kickoff:
+                    forward_in_time = last_kickoff > first_kickoff
+                if self._results_crawl_exhausted(page_games, status_filter, forward_in_time):
+                    break
+            token = page_paging['next_token']
+            if not page_games or not token or token in seen_tokens:
+                break
+            seen_tokens.add(token)
+        return {'games': games, 'paging': paging, 'pages': pages}
+
     def get_competition_results(
         self,
         competition_id: int,
@@ -746,44 +1362,20 @@ class ThreeSixFiveScores:
         max_pages: int = None,
         max_games: int = None
     ) -> dict:
-        params = {
-            'appTypeId': 5,
-            'langId': 1,
-            'timezoneName': 'Asia/Hebron',
-            'userCountryId': 115,
-            'competitions': competition_id,
-            'showOdds': 'false',
-            'games': page_size,
-            'direction': direction
-        }
-        if after_game:
-            params['aftergame'] = after_game
-        
-        current_next_token = None
-        current_prev_token = None
-        total_games_from_api = 0
-        games_df = pd.DataFrame() # Initialize empty DataFrame
-
+        """
+        One results page (or, with fetch_all=True, every page from `after_game` on, up to
+        max_pages/max_games). `status_filter` ('finished', 'upcoming', 'live') is applied to the
+        raw games before the DataFrame is built, and a fetch_all crawl stops as soon as later
+        pages can no longer hold matching games.
+        """
         try:
-            response = self._365scores_request('games/results/', params=params)
-            data = response.json()
-            games_data_from_api = data.get('games', [])
-            
-            # Process raw games data using the new helper
-            games_df = self._process_game_records(games_data_from_api)
-
-            paging_data = data.get('paging', {})
-            total_games_from_api = paging_data.get('totalGames', len(games_data_from_api))
-            next_page_url = paging_data.get('nextPage')
-            if next_page_url:
-                next_token_match = re.search(r'aftergame=(\d+)', next_page_url)
-                if next_token_match:
-                    current_next_token = int(next_token_match.group(1))
-            prev_page_url = paging_data.get('prevPage')
-            if prev_page_url:
-                prev_token_match = re.search(r'aftergame=(\d+)', prev_page_url)
-                if prev_token_match:
-                    current_prev_token = int(prev_token_match.group(1))
+            if fetch_all:
+                crawl = self._crawl_competition_results(
+                    competition_id, after_game, direction, page_size, status_filter, max_pages, max_games
+                )
+                return {'games': self._process_game_records(crawl['games']), 'paging': crawl['paging']}
+            data = self._fetch_competition_results_page(competition_id, after_game, direction, page_size)
+            return self._parse_competition_results_page(data, status_filter)
         except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
             print(f"خطأ أثناء جلب صفحة نتائج المسابقة: {e}")
             return {
@@ -794,131 +1386,204 @@ class ThreeSixFiveScores:
                     'total_games': 0
                 }
             }
-        
+
+    def _results_paging(self, data: dict) -> dict:
+        """The next/prev aftergame tokens and totalGames of one /web/games/results/ payload."""
+        current_next_token = None
+        current_prev_token = None
+        paging_data = data.get('paging', {})
+        total_games_from_api = paging_data.get('totalGames', len(data.get('games', [])))
+        next_page_url = paging_data.get('nextPage')
+        if next_page_url:
+            next_token_match = re.search(r'aftergame=(\d+)', next_page_url)
+            if next_token_match:
+                current_next_token = int(next_token_match.group(1))
+        prev_page_url = paging_data.get('prevPage')
+        if prev_page_url:
+            prev_token_match = re.search(r'aftergame=(\d+)', prev_page_url)
+            if prev_token_match:
+                current_prev_token = int(prev_token_match.group(1))
+        return {
+            'next_token': current_next_token,
+            'prev_token': current_prev_token,
+            'total_games': total_games_from_api
+        }
+
+    def _parse_competition_results_page(self, data: dict, status_filter: str = None) -> dict:
+        """Converts one /web/games/results/ payload into {'games': DataFrame, 'paging': {...}}."""
+        games_data_from_api = data.get('games', [])
         if status_filter:
-            games_df = self._apply_status_filter(games_df, status_filter)
-        
+            games_data_from_api = self._filter_games_by_status(games_data_from_api, status_filter)
         return {
-            'games': games_df,
-            'paging': {
-                'next_token': current_next_token,
-                'prev_token': current_prev_token,
-                'total_games': total_games_from_api
-            }
+            'games': self._process_game_records(games_data_from_api),
+            'paging': self._results_paging(data)
         }
 
     def _365scores_request(self, path: str, params: dict = None) -> requests.Response:
         base_url = f'https://webws.365scores.com/web/{path}'
         try:
-            response = self.session.get(
-                base_url,
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            time.sleep(0.3)
+            response = self.transport.get(base_url, params=params)
             return response
         except requests.RequestException as e:
             raise ConnectionError(f"فشل في الاتصال بواجهة برمجة التطبيقات: {e}")
 
 
-    def get_full_competition_results(self, competition_id: int = None, initial_url: str = None, page_size: int = 50, max_pages: int = 1000, max_games: int = None) -> pd.DataFrame:
-        if not initial_url and not competition_id:
-            raise ValueError("يجب توفير إما 'competition_id' أو 'initial_url'.")
+    def _split_results_url(self, full_url: str, page_size: int = None):
+        """Splits a full results URL into the (api_path, params) pair expected by _365scores_request."""
+        # Parse the full URL to extract path and params for _365scores_request
+        parsed_url = urlparse(full_url)
+        # Ensure the path starts correctly for _365scores_request
+        # It expects 'games/results/' not '/web/games/results/'
+        path_segments = parsed_url.path.strip('/').split('/')
+        if len(path_segments) >= 2 and path_segments[0] == 'web':
+            api_path = '/'.join(path_segments[1:]) + '/' # e.g., 'games/results/'
+        else:
+            api_path = '/'.join(path_segments) + '/' # Fallback for other paths
+
+        params = parse_qs(parsed_url.query)
+        # Convert list values in params to single values
+        single_value_params = {k: v[0] for k, v in params.items()}
+
+        # Override 'games' param with the provided page_size if it exists in the URL
+        # This ensures the page_size passed to the function is respected
+        if page_size:
+            single_value_params['games'] = str(page_size) # Ensure it's a string as expected by URL params
+        return api_path, single_value_params
+
+    def _fetch_results_page(self, full_url: str, page_size: int = None) -> dict:
+        """
+        Fetches one /web/games/results/ page from a full (or nextPage-derived) URL and returns the decoded JSON.
+        Raises ConnectionError or json.JSONDecodeError.
+        """
+        api_path, params = self._split_results_url(full_url, page_size)
+        response = self._365scores_request(api_path, params=params)
+        return response_json(response)
 
+    def _competition_results_url(self, competition_id: int = None, initial_url: str = None) -> str:
         if initial_url:
-            current_full_url = initial_url
-            print(f"جاري جلب الصفحة الأولية من الرابط: {initial_url}...")
-        else: # Construct initial URL from competition_id
-            # Add a check to ensure competition_id is an integer
-            if not isinstance(competition_id, int):
-                raise ValueError("إذا لم يتم توفير 'initial_url'، يجب أن يكون 'competition_id' رقمًا صحيحًا (int).")
-            # This is the base URL structure we saw in Postman
-            current_full_url = (
-                f"https://webws.365scores.com/web/games/results/?"
-                f"appTypeId=5&langId=1&timezoneName=Asia/Hebron&userCountryId=115&competitions={competition_id}"
-                f"&showOdds=true&includeTopBettingOpportunity=1"
-            )
-            print(f"جاري جلب الصفحة الأولية للمسابقة {competition_id} من الرابط المُنشأ: {current_full_url}...")
+            return initial_url
+        if not competition_id:
+            raise ValueError("يجب توفير إما 'competition_id' أو 'initial_url'.")
+        # Add a check to ensure competition_id is an integer
+        if not isinstance(competition_id, int):
+            raise ValueError("إذا لم يتم توفير 'initial_url'، يجب أن يكون 'competition_id' رقمًا صحيحًا (int).")
+        # This is the base URL structure we saw in Postman
+        return (
+            f"https://webws.365scores.com/web/games/results/?"
+            f"appTypeId=5&langId=1&timezoneName=Asia/Hebron&userCountryId=115&competitions={competition_id}"
+            f"&showOdds=true&includeTopBettingOpportunity=1"
+        )
 
-        all_games_dfs = []
+    def iter_competition_games(
+        self,
+        competition_id: int = None,
+        initial_url: str = None,
+        page_size: int = 50,
+        max_pages: int = 1000,
+        max_games: int = None,
+        as_dataframe: bool = True,
+        prefetch: bool = False
+    ):
+        """
+        Follows paging.nextPage and yields every page as soon as it arrives, holding only
+        the set of already-seen game ids between pages.
+
+        Args:
+            competition_id / initial_url: Where to start (one of them is required).
+            page_size: Games per request.
+            max_pages: Stop after this many pages.
+            max_games: Stop once this many unique games have been yielded.
+            as_dataframe: Yield _process_game_records DataFrames; False yields the raw game dicts.
+            prefetch: Request the next page in a background thread while the consumer handles the current one.
+
+        Yields:
+            The new (not previously seen) games of each page; pages without new games are skipped.
+        """
+        current_full_url = self._competition_results_url(competition_id, initial_url)
         processed_game_ids = set()
         seen_full_urls = set()
         page_count = 0
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending_page = None # Future for current_full_url when prefetching
 
-        while current_full_url:
-            if page_count >= max_pages:
-                print("تجاوز الحد الأقصى لعدد الصفحات. إيقاف الجلب.")
-                break
+        try:
+            while current_full_url and page_count < max_pages:
+                if current_full_url in seen_full_urls:
+                    print("تم اكتشاف رابط صفحة مكرر. إيقاف الجلب لتجنب الحلقة اللانهائية.")
+                    break
+                seen_full_urls.add(current_full_url)
+                page_count += 1
 
-            if current_full_url in seen_full_urls:
-                print("تم اكتشاف رابط صفحة مكرر. إيقاف الجلب لتجنب الحلقة اللانهائية.")
-                break
-            seen_full_urls.add(current_full_url)
-            page_count += 1
+                try:
+                    if pending_page is not None:
+                        data = pending_page.result()
+                    else:
+                        data = self._fetch_results_page(current_full_url, page_size)
+                except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
+                    print(f"خطأ أثناء جلب البيانات من الرابط: {e}")
+                    break
+                pending_page = None
 
-            print(f"  جلب صفحة رقم {page_count} من الرابط: {current_full_url}")
+                if 'games' not in data or not data['games']:
+                    break
 
-            try:
-                # Parse the full URL to extract path and params for _365scores_request
-                parsed_url = urlparse(current_full_url)
-                # Ensure the path starts correctly for _365scores_request
-                # It expects 'games/results/' not '/web/games/results/'
-                path_segments = parsed_url.path.strip('/').split('/')
-                if len(path_segments) >= 2 and path_segments[0] == 'web':
-                    api_path = '/'.join(path_segments[1:]) + '/' # e.g., 'games/results/'
+                # Get the next page URL from the 'paging' section
+                next_page_relative_path = data.get('paging', {}).get('nextPage')
+                if next_page_relative_path:
+                    next_full_url = f"https://webws.365scores.com{next_page_relative_path}"
                 else:
-                    api_path = '/'.join(path_segments) + '/' # Fallback for other paths
-
-                params = parse_qs(parsed_url.query)
-                # Convert list values in params to single values
-                single_value_params = {k: v[0] for k, v in params.items()}
-                
-                # Override 'games' param with the provided page_size if it exists in the URL
-                # This ensures the page_size passed to the function is respected
-                single_value_params['games'] = str(page_size) # Ensure it's a string as expected by URL params
-
-                response = self._365scores_request(api_path, params=single_value_params)
-                data = response.json()
-            except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
-                print(f"خطأ أثناء جلب البيانات من الرابط: {e}")
-                break
+                    next_full_url = None # No more pages
 
-            if 'games' not in data or not data['games']:
-                print("لم يتم العثور على مباريات في الصفحة الحالية.")
-                break
+                # Put the next request in flight before spending CPU on this page
+                if executor and next_full_url and next_full_url not in seen_full_urls and page_count < max_pages:
+                    pending_page = executor.submit(self._fetch_results_page, next_full_url, page_size)
 
-            # Process raw games data using the new helper
-            df_page = self._process_game_records(data['games'])
-            
-            # Process and add games to all_games_dfs
-            new_games = df_page[~df_page['game_id'].isin(processed_game_ids)]
-            if not new_games.empty:
-                all_games_dfs.append(new_games)
-                processed_game_ids.update(new_games['game_id'])
-                # اطبع أول 5 مباريات من كل صفحة
-                print(f"أول 5 مباريات من الصفحة {page_count}:")
-                print(df_page.head().to_string())
-
-            if max_games and len(processed_game_ids) >= max_games:
-                print("تجاوز الحد الأقصى لعدد المباريات. إيقاف الجلب.")
-                break
+                new_games = [g for g in data['games'] if g.get('id') not in processed_game_ids]
+                processed_game_ids.update(g.get('id') for g in new_games)
+                if new_games:
+                    yield self._process_game_records(new_games) if as_dataframe else new_games
 
-            # Get the next page URL from the 'paging' section
-            next_page_relative_path = data.get('paging', {}).get('nextPage')
-            if next_page_relative_path:
-                # Construct the full URL for the next page
-                # Ensure the base URL is correct for relative paths
-                current_full_url = f"https://webws.365scores.com{next_page_relative_path}"
-            else:
-                current_full_url = None # No more pages
+                if max_games and len(processed_game_ids) >= max_games:
+                    break
+
+                current_full_url = next_full_url
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_full_competition_results(self, competition_id: int = None, initial_url: str = None, page_size: int = 50, max_pages: int = 1000, max_games: int = None, prefetch: bool = False) -> pd.DataFrame:
+        """
+        Follows paging.nextPage from the first results page until the history is exhausted.
+
+        Args:
+            prefetch: Request the next page in a background thread while the current one is
+                parsed and deduplicated, so parsing overlaps with the network.
+        """
+        current_full_url = self._competition_results_url(competition_id, initial_url)
+        if initial_url:
+            print(f"جاري جلب الصفحة الأولية من الرابط: {initial_url}...")
+        else:
+            print(f"جاري جلب الصفحة الأولية للمسابقة {competition_id} من الرابط المُنشأ: {current_full_url}...")
+
+        all_games_dfs = []
+        pages = self.iter_competition_games(
+            initial_url=current_full_url,
+            page_size=page_size,
+            max_pages=max_pages,
+            max_games=max_games,
+            prefetch=prefetch
+        )
+        for page_count, new_games in enumerate(pages, start=1):
+            all_games_dfs.append(new_games)
+            # اطبع أول 5 مباريات من كل صفحة
+            print(f"أول 5 مباريات من الصفحة {page_count}:")
+            print(new_games.head().to_string())
 
         if not all_games_dfs:
             print(f"لم يتم تجميع أي بيانات مباريات للمسابقة {competition_id if competition_id else 'من الرابط المقدم'}.")
             return pd.DataFrame()
 
-        final_df = pd.concat(all_games_dfs, ignore_index=True)
+        final_df = self._restore_game_dtypes(pd.concat(all_games_dfs, ignore_index=True))
         final_df.drop_duplicates(subset=['game_id'], keep='first', inplace=True)
         
         if 'datetime_obj' in final_df.columns and not final_df['datetime_obj'].isnull().all():
@@ -934,72 +1599,147 @@ class ThreeSixFiveScores:
         self,
         competition_id: int,
         status_filter: str = None,
-        max_workers: int = 8,
+        max_workers: int = None,
         page_size: int = 100,
         max_pages: int = 1000,
         max_games: int = None,
+        direction: int = 1,
     ) -> dict:
-        first_page = self.get_competition_results(
-            competition_id=competition_id,
-            page_size=page_size,
-            fetch_all=False
-        )
-        games_df = first_page['games']
-        next_token = first_page['paging'].get('next_token')
-        total_games = first_page['paging'].get('total_games', 0)
-        if not next_token or total_games <= page_size:
-            if status_filter:
-                games_df = self._apply_status_filter(games_df, status_filter)
-            return {
-                'games': games_df,
-                'total_games': total_games
-            }
-        remaining_games = total_games - len(games_df)
-        remaining_pages = (remaining_games + page_size - 1) // page_size
-        all_additional_games = []
-        tokens_queue = [next_token]
-        seen_tokens = set(tokens_queue)
-        page_counter = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
-            for i, token in enumerate(tokens_queue):
-                if token is None:
-                    continue
-                if max_pages and page_counter >= max_pages:
-                    break
-                if token in seen_tokens:
-                    continue
-                future = executor.submit(
-                    self.get_competition_results,
-                    competition_id=competition_id,
-                    after_game=token,
-                    page_size=page_size,
-                    fetch_all=False
-                )
-                futures[future] = i
-                seen_tokens.add(token)
-                page_counter += 1
-            for future in concurrent.futures.as_completed(futures):
-                idx = futures[future]
-                try:
-                    page_result = future.result()
-                    all_additional_games.extend(page_result['games'].to_dict('records'))
-                    new_token = page_result['paging'].get('next_token')
-                    if new_token and idx + 1 < len(tokens_queue):
-                        tokens_queue[idx + 1] = new_token
-                        if idx + 1 >= len(futures) and len(futures) < remaining_pages:
-                            tokens_queue.append(new_token)
-                            seen_tokens.add(new_token)
-                except Exception as e:
-                    print(f"خطأ في جلب الصفحة: {e}")
-        if all_additional_games:
-            additional_df = pd.DataFrame(all_additional_games)
-            games_df = pd.concat([games_df, additional_df], ignore_index=True)
-        if status_filter:
-            games_df = self._apply_status_filter(games_df, status_filter)
-        if max_games and len(games_df) > max_games:
-            games_df = games_df.head(max_games)
+        """
+        Every results page of a competition in one DataFrame, built once from the raw games
+        that pass `status_filter`; the crawl stops early once later pages can't match it.
+
+        This is a sequential crawl: each page's aftergame cursor comes from the previous page,
+        so there is nothing to run concurrently. To fetch in parallel, use
+        get_competition_results_sharded, which crawls date windows side by side.
+
+        Args:
+            max_workers: Deprecated and ignored; passing it emits a DeprecationWarning.
+        """
+        if max_workers is not None:
+            warnings.warn(
+                "get_competition_results_fast() crawls pages sequentially and ignores 'max_workers'; "
+                "use get_competition_results_sharded() for a concurrent crawl.",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        try:
+            crawl = self._crawl_competition_results(
+                competition_id, direction=direction, page_size=page_size, status_filter=status_filter,
+                max_pages=max_pages, max_games=max_games
+            )
+        except (ConnectionError, json.JSONDecodeError, requests.exceptions.RequestException) as e:
+            print(f"خطأ أثناء جلب صفحة نتائج المسابقة: {e}")
+            return {'games': pd.DataFrame(), 'total_games': 0}
+        games_df = self._process_game_records(crawl['games'])
+        if not games_df.empty:
+            games_df = games_df.drop_duplicates(subset=['game_id'], keep='first').reset_index(drop=True)
         return {
-            'games': games_df.reset_index(drop=True),
+            'games': games_df,
             'total_games': len(games_df)
         }
+
+    @staticmethod
+    def _date_windows(start_date, end_date, window_days: int) -> list:
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        windows = []
+        while start <= end:
+            window_end = min(start + pd.Timedelta(days=window_days - 1), end)
+            windows.append((start, window_end))
+            start = window_end + pd.Timedelta(days=1)
+        return windows
+
+    def _crawl_results_window(self, competition_id, window_start, window_end, page_size, max_pages) -> list:
+        """
+        Follows nextPage inside one date window and returns the raw game dicts.
+        Raises ValueError when the first page has games but none inside the window, i.e. the
+        server doesn't apply startDate/endDate.
+        """
+        params = self._competition_results_params(competition_id, page_size=page_size)
+        params['startDate'] = window_start.strftime('%d/%m/%Y')
+        params['endDate'] = window_end.strftime('%d/%m/%Y')
+        first_date = window_start.strftime('%Y-%m-%d')
+        last_date = window_end.strftime('%Y-%m-%d')
+        current_full_url = requests.Request('GET', 'https://webws.365scores.com/web/games/results/', params=params).prepare().url
+        seen_full_urls = set()
+        games = []
+        while current_full_url and len(seen_full_urls) < max_pages and current_full_url not in seen_full_urls:
+            seen_full_urls.add(current_full_url)
+            try:
+                data = self._fetch_results_page(current_full_url, page_size)
+            except (ConnectionError, json.JSONDecodeError) as e:
+                print(f"خطأ أثناء جلب النافذة {first_date} - {last_date}: {e}")
+                break
+            page_games = data.get('games') or []
+            in_window = [g for g in page_games if first_date <= str(g.get('startTime', ''))[:10] <= last_date]
+            if not in_window and page_games and len(seen_full_urls) == 1:
+                # The window's own first page holds none of its games: the server ignored
+                # startDate/endDate, and every window would silently get the same pages
+                raise ValueError(
+                    f"الخادم تجاهل startDate/endDate للنافذة {first_date} - {last_date}: "
+                    f"الصفحة الأولى تبدأ في {str(page_games[0].get('startTime', ''))[:10]}."
+                )
+            # A later page entirely outside the window means the cursor has left it
+            if not in_window:
+                break
+            games.extend(in_window)
+            next_page_relative_path = data.get('paging', {}).get('nextPage')
+            current_full_url = f"https://webws.365scores.com{next_page_relative_path}" if next_page_relative_path else None
+        return games
+
+    def get_competition_results_sharded(
+        self,
+        competition_id: int,
+        start_date=None,
+        end_date=None,
+        window_days: int = 30,
+        windows: list = None,
+        max_workers: int = 8,
+        page_size: int = 100,
+        max_pages_per_window: int = 100,
+        status_filter: str = None
+    ) -> pd.DataFrame:
+        """
+        Crawls a competition's results by splitting its history into independent date windows
+        up front and following the nextPage cursors of every window concurrently. Results are
+        merged and deduplicated on game_id.
+
+        Args:
+            competition_id: Competition to crawl.
+            start_date, end_date: Range to cover (anything pd.Timestamp accepts), cut into `window_days` windows.
+            windows: Explicit list of (start, end) pairs, e.g. one per season; overrides the range.
+            max_workers: Windows crawled at the same time.
+            page_size: Games per request.
+            max_pages_per_window: Safety cap on cursor pages followed inside one window.
+            status_filter: 'finished', 'upcoming' or 'live'.
+
+        Returns:
+            pd.DataFrame in the _process_game_records format, sorted by start time.
+
+        Raises:
+            ValueError: The server ignored the startDate/endDate window params (see _crawl_results_window).
+        """
+        if windows is not None:
+            windows = [(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()) for start, end in windows]
+        elif start_date is not None and end_date is not None:
+            windows = self._date_windows(start_date, end_date, window_days)
+        else:
+            raise ValueError("يجب توفير 'windows' أو 'start_date' و 'end_date'.")
+
+        all_games = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._crawl_results_window, competition_id, start, end, page_size, max_pages_per_window)
+                for start, end in windows
+            ]
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc=f"جلب نوافذ المسابقة {competition_id}"):
+                all_games.extend(future.result())
+
+        if status_filter:
+            all_games = self._filter_games_by_status(all_games, status_filter)
+        games_df = self._process_game_records(all_games)
+        if games_df.empty:
+            return games_df
+        games_df = games_df.drop_duplicates(subset=['game_id'], keep='first')
+        return games_df.sort_values(['datetime_obj', 'game_id']).reset_index(drop=True)
@@ -0,0 +1,164 @@
+import os
+import re
+import time
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .metrics import ClientMetrics, endpoint_for_url
+    from .ratelimit import AdaptiveConcurrencyLimiter, HostRateLimiter
+    from .endpoints import API_BASE, RECORDED_ENDPOINTS, endpoint_of, recording_path
+except ImportError:
+    from metrics import ClientMetrics, endpoint_for_url
+    from ratelimit import AdaptiveConcurrencyLimiter, HostRateLimiter
+    from endpoints import API_BASE, RECORDED_ENDPOINTS, endpoint_of, recording_path
+
+
+THROTTLE_STATUSES = {429, 503}
+
+
+class Transport:
+    """
+    The single HTTP layer used by every ThreeSixFiveScores endpoint: one pooled
+    requests.Session with the retry policy, keep-alive and the shared rate limiter.
+    Safe to share between threads.
+
+    Args:
+        headers: Default headers sent with every request.
+        pool_connections: Number of per-host connection pools kept by the adapter.
+        pool_maxsize: Max open connections kept alive per host; size it to the number of worker threads.
+        pool_block: Block instead of opening throw-away connections once the pool is exhausted.
+        keep_alive: Reuse TCP/TLS connections between requests.
+        max_retries: urllib3 Retry (or int) applied to every request.
+        timeout: Default timeout in seconds.
+        rate_limiter: HostRateLimiter consulted before every request (None disables limiting).
+        concurrency_limiter: AdaptiveConcurrencyLimiter bounding requests in flight across all
+            threads; it is told about every 429/503, including those absorbed by the retry policy.
+        api_base: Replaces https://webws.365scores.com in every URL, e.g. the address of a
+            standin_server.StandInServer.
+        metrics: ClientMetrics receiving latency, bytes, retries and throttles of every request.
+    """
+
+    def __init__(
+        self,
+        headers: dict = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = True,
+        keep_alive: bool = True,
+        max_retries=None,
+        timeout: float = 10,
+        rate_limiter: HostRateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        api_base: str = None,
+        metrics: ClientMetrics = None,
+    ):
+        if max_retries is None:
+            max_retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        self.headers = headers if headers is not None else {}
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.api_base = api_base.rstrip('/') if api_base else None
+        self.metrics = metrics
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def get(self, url: str, params: dict = None, headers: dict = None, timeout: float = None) -> requests.Response:
+        """GET through the pooled session. Raises requests.RequestException on network or HTTP errors."""
+        if self.api_base and url.startswith(API_BASE):
+            url = self.api_base + url[len(API_BASE):]
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.acquire()
+        retries = throttles = nbytes = 0
+        success = False
+        started = None
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            started = time.perf_counter()
+            response = self.session.get(
+                url,
+                headers=headers if headers is not None else self.headers,
+                params=params,
+                timeout=timeout or self.timeout
+            )
+            retries, throttles = self._retry_counts(response)
+            nbytes = len(response.content)
+            response.raise_for_status()
+            success = True
+            return response
+        except requests.exceptions.RetryError as e:
+            # Retries exhausted on a status from the forcelist; only 429/503 shrink the window
+            if self._exhausted_status(e) in THROTTLE_STATUSES:
+                throttles = max(throttles, 1)
+            raise
+        finally:
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release(throttled=throttles > 0, success=success)
+            if self.metrics is not None and started is not None:
+                self.metrics.observe(
+                    endpoint_for_url(url), time.perf_counter() - started, nbytes=nbytes,
+                    retries=retries, throttles=throttles, error=not success
+                )
+
+    @staticmethod
+    def _retry_counts(response: requests.Response):
+        """(retries, throttled responses) for a response, including attempts absorbed by the retry policy."""
+        retries = getattr(response.raw, 'retries', None)
+        history = getattr(retries, 'history', None) or ()
+        throttles = sum(1 for attempt in history if attempt.status in THROTTLE_STATUSES)
+        if response.status_code in THROTTLE_STATUSES:
+            throttles += 1
+        return len(history), throttles
+
+    @staticmethod
+    def _exhausted_status(error: requests.exceptions.RetryError):
+        """Status whose retries ran out, from urllib3's 'too many <status> error responses' reason; None if unknown."""
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        match = re.search(r'too many (\d{3}) error responses', str(reason))
+        return int(match.group(1)) if match else None
+
+    def close(self):
+        self.session.close()
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that also writes every successful /web/game/, /web/game/stats/,
+    /web/games/results/ and /web/stats/ response to `record_dir`, in the layout
+    standin_server.StandInServer replays. Takes the same arguments as Transport.
+    """
+
+    def __init__(self, record_dir: str, **kwargs):
+        super().__init__(**kwargs)
+        self.record_dir = record_dir
+
+    def get(self, url: str, params: dict = None, headers: dict = None, timeout: float = None) -> requests.Response:
+        response = super().get(url, params=params, headers=headers, timeout=timeout)
+        parsed = urlparse(response.url)
+        endpoint = endpoint_of(parsed.path)
+        if endpoint in RECORDED_ENDPOINTS:
+            query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            path = recording_path(self.record_dir, endpoint, query)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(response.content)
+        return response
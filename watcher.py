@@ -0,0 +1,198 @@
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+try:
+    from .fastjson import loads
+    from .status import classify_game_status
+except ImportError:
+    from fastjson import loads
+    from status import classify_game_status
+
+
+def _event_key(event: dict):
+    """Identity of a game event; 365scores doesn't give every event an id, so fall back to its coordinates."""
+    if event.get('id') is not None:
+        return event['id']
+    event_type = event.get('eventType')
+    if isinstance(event_type, dict):
+        event_type = event_type.get('id')
+    return (event.get('order'), event.get('gameTime'), event_type, event.get('competitorId'), event.get('playerId'))
+
+
+def _chart_event_key(event: dict):
+    if event.get('id') is not None:
+        return event['id']
+    return (event.get('time'), event.get('type'), event.get('playerId'), event.get('competitorId'))
+
+
+def _statistic_key(stat: dict):
+    return (stat.get('competitorId'), stat.get('id', stat.get('name')))
+
+
+def _index(items, key_func) -> dict:
+    return {key_func(item): item for item in items or [] if isinstance(item, dict)}
+
+
+class _GameState:
+    __slots__ = ('game_id', 'competition_id', 'interval', 'next_poll', 'digests', 'events', 'chart_events',
+                 'statistics', 'status')
+
+    def __init__(self, game_id, competition_id, interval):
+        self.game_id = game_id
+        self.competition_id = competition_id
+        self.interval = interval
+        self.next_poll = 0.0
+        self.digests = {}
+        self.events = None
+        self.chart_events = None
+        self.statistics = None
+        self.status = None
+
+
+class LiveWatcher:
+    """
+    Polls live games and yields only what changed since the previous poll.
+
+    Every game keeps its last payloads indexed by key; a poll whose raw body is byte-identical
+    to the previous one is skipped without decoding. Change records are dicts:
+
+        {'game_id', 'kind': 'event' | 'chart_event' | 'statistic' | 'status',
+         'op': 'added' | 'changed' | 'removed', 'key', 'value', 'previous'}
+
+    The first poll of a game reports everything as 'added'. Each game's interval drops back
+    to `min_interval` when something changed and grows by `backoff` up to `max_interval`
+    while nothing does. A game stops being watched once its status is finished.
+
+    Requests go straight through the client's transport (its rate and concurrency limiters
+    apply), bypassing the response caches, which would otherwise serve stale live data.
+
+    Args:
+        client: ThreeSixFiveScores used for URLs and the transport.
+        game_ids: Games to watch; an int/str or a {game_id: competition_id} dict.
+        include_stats: Also poll /web/game/stats/ and diff its statistics.
+        min_interval, max_interval, backoff: Adaptive poll interval, in seconds.
+        max_workers: Games polled concurrently in one tick.
+    """
+
+    def __init__(self, client, game_ids, include_stats: bool = True, min_interval: float = 5.0,
+                 max_interval: float = 60.0, backoff: float = 1.5, max_workers: int = 4):
+        self.client = client
+        self.include_stats = include_stats
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.polls = 0
+        self.unchanged = 0
+        if not isinstance(game_ids, dict):
+            game_ids = {game_id: None for game_id in game_ids}
+        self.games = {
+            str(game_id): _GameState(str(game_id), competition_id, min_interval)
+            for game_id, competition_id in game_ids.items()
+        }
+
+    def _get_json(self, state: _GameState, endpoint: str, url: str):
+        """Decoded body of `url`, or None when it failed or is byte-identical to the last poll."""
+        try:
+            response = self.client.transport.get(url, headers=self.client.headers)
+        except requests.RequestException:
+            return None
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        if state.digests.get(endpoint) == digest:
+            self.unchanged += 1
+            return None
+        try:
+            data = loads(response.content)
+        except json.JSONDecodeError:
+            return None
+        state.digests[endpoint] = digest
+        return data
+
+    @staticmethod
+    def _diff(game_id, kind: str, previous: dict, current: dict) -> list:
+        changes = []
+        previous = previous or {}
+        for key, value in current.items():
+            if key not in previous:
+                changes.append({'game_id': game_id, 'kind': kind, 'op': 'added', 'key': key, 'value': value, 'previous': None})
+            elif previous[key] != value:
+                changes.append({'game_id': game_id, 'kind': kind, 'op': 'changed', 'key': key, 'value': value, 'previous': previous[key]})
+        for key, old in previous.items():
+            if key not in current:
+                changes.append({'game_id': game_id, 'kind': kind, 'op': 'removed', 'key': key, 'value': None, 'previous': old})
+        return changes
+
+    def _poll_game(self, state: _GameState) -> list:
+        changes = []
+        url = self.client._match_data_url(state.game_id, competition_id=state.competition_id)
+        data = self._get_json(state, 'game', url)
+        game = data.get('game') if isinstance(data, dict) else None
+        if game:
+            events = _index(game.get('events'), _event_key)
+            changes += self._diff(state.game_id, 'event', state.events, events)
+            state.events = events
+            chart_events = _index((game.get('chartEvents') or {}).get('events'), _chart_event_key)
+            changes += self._diff(state.game_id, 'chart_event', state.chart_events, chart_events)
+            state.chart_events = chart_events
+            status = {
+                'status': classify_game_status(game),
+                'shortStatusText': game.get('shortStatusText'),
+                'gameTime': game.get('gameTime'),
+                'homeScore': (game.get('homeCompetitor') or {}).get('score'),
+                'awayScore': (game.get('awayCompetitor') or {}).get('score'),
+            }
+            if status != state.status:
+                changes.append({'game_id': state.game_id, 'kind': 'status', 'op': 'changed' if state.status else 'added',
+                                'key': 'status', 'value': status, 'previous': state.status})
+            state.status = status
+        if self.include_stats:
+            data = self._get_json(state, 'stats', self.client._stats_url(state.game_id, state.competition_id))
+            if isinstance(data, dict) and isinstance(data.get('statistics'), list):
+                statistics = {key: stat.get('value') for key, stat in _index(data['statistics'], _statistic_key).items()}
+                changes += self._diff(state.game_id, 'statistic', state.statistics, statistics)
+                state.statistics = statistics
+        return changes
+
+    def poll(self, states: list = None) -> list:
+        """Polls `states` (default: every watched game) once and returns their change records."""
+        states = list(self.games.values()) if states is None else states
+        if not states:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(states))) as executor:
+            results = list(executor.map(self._poll_game, states))
+        now = time.monotonic()
+        changes = []
+        for state, game_changes in zip(states, results):
+            self.polls += 1
+            if game_changes:
+                state.interval = self.min_interval
+            else:
+                state.interval = min(state.interval * self.backoff, self.max_interval)
+            state.next_poll = now + state.interval
+            if state.status and state.status['status'] == 'finished':
+                del self.games[state.game_id]
+            changes.extend(game_changes)
+        return changes
+
+    def watch(self, duration: float = None):
+        """
+        Generator of change records; polls every game when it's due until all of them have
+        finished or `duration` seconds have passed.
+        """
+        deadline = time.monotonic() + duration if duration is not None else None
+        while self.games:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return
+            due = [state for state in self.games.values() if state.next_poll <= now]
+            if not due:
+                wake = min(state.next_poll for state in self.games.values())
+                if deadline is not None:
+                    wake = min(wake, deadline)
+                time.sleep(max(0.0, wake - now))
+                continue
+            yield from self.poll(due)